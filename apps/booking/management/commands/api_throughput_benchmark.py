@@ -0,0 +1,183 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.booking.models import Booking
+from apps.booking.services.calendar import mark_booked
+from apps.user.models import User
+from apps.user.services.token_service import issue_tokens
+from apps.vehicle.models import Vehicle
+from constants.common_status import CommonStatus
+
+MODES = ("sync", "async")
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive GET /api/v1/booking and GET /api/v1/vehicle through the ASGI application with "
+        "many concurrent connections and compare the sync views with the async ones "
+        "(ASYNC_API_VIEWS) against the same database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mode", choices=(*MODES, "both"), default="both")
+        parser.add_argument(
+            "--connections", default="16,64,256", help="Comma separated concurrent connection counts"
+        )
+        parser.add_argument("--requests", type=int, default=20, help="Requests sent by each connection")
+        parser.add_argument("--bookings", type=int, default=200, help="Bookings seeded for the benchmark user")
+        parser.add_argument("--json", action="store_true", help="Print raw results as JSON")
+
+    def handle(self, *args, **options):
+        connections = [int(value) for value in options["connections"].split(",") if value]
+        if options["mode"] == "both":
+            results = [result for mode in MODES for result in self._run_in_subprocess(mode, options)]
+        else:
+            results = self._run(options["mode"], connections, options["requests"], options["bookings"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results))
+            return
+
+        self.stdout.write(f"{'mode':<6} {'conns':>6} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for result in results:
+            self.stdout.write(
+                f"{result['mode']:<6} {result['connections']:>6} {result['requests']:>9} "
+                f"{result['throughput']:>8.0f} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['errors']:>7}"
+            )
+
+    def _run_in_subprocess(self, mode, options):
+        # The URLconf picks sync or async views at import time, so each mode
+        # needs a fresh process.
+        command = [
+            sys.executable, "manage.py", "api_throughput_benchmark", "--json",
+            "--mode", mode,
+            "--connections", options["connections"],
+            "--requests", str(options["requests"]),
+            "--bookings", str(options["bookings"]),
+        ]
+        env = {**os.environ, "ASYNC_API_VIEWS": str(mode == "async")}
+        completed = subprocess.run(command, env=env, capture_output=True, text=True, cwd=settings.BASE_DIR)
+        if completed.returncode != 0:
+            raise CommandError(f"{mode} run failed:\n{completed.stderr}")
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def _run(self, mode, connections, requests, bookings):
+        if settings.ASYNC_API_VIEWS != (mode == "async"):
+            raise CommandError(f"Run with ASYNC_API_VIEWS={mode == 'async'} to benchmark the {mode} views")
+
+        user, vehicles = self._seed(bookings)
+        try:
+            headers = [
+                (b"host", b"localhost"),
+                (b"authorization", f"Bearer {issue_tokens(user)['access_token']}".encode()),
+            ]
+            paths = ["/api/v1/booking", "/api/v1/vehicle", f"/api/v1/vehicle/{vehicles[0].id}"]
+            application = get_asgi_application()
+            return [
+                {"mode": mode, **asyncio.run(self._drive(application, headers, paths, count, requests))}
+                for count in connections
+            ]
+        finally:
+            user.delete()
+
+    def _seed(self, bookings):
+        suffix = uuid.uuid4().hex[:10]
+        user = User.objects.create(
+            email=f"throughput-{suffix}@benchmark.local",
+            password="!",
+            first_name="Throughput",
+            last_name="Benchmark",
+            phone="0000000000",
+            status=1,
+        )
+        vehicles = Vehicle.objects.bulk_create(
+            Vehicle(user=user, make="Bench", model="Mark", year=2024, plate=f"TB{suffix}{index}")
+            for index in range(10)
+        )
+        start = datetime.now().astimezone().replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+        seeded = Booking.objects.bulk_create(
+            Booking(
+                user=user,
+                vehicle=vehicles[index % len(vehicles)],
+                start_date=start + timedelta(days=index),
+                end_date=start + timedelta(days=index, hours=4),
+                status=CommonStatus.ACTIVE.value,
+            )
+            for index in range(bookings)
+        )
+        mark_booked(seeded)
+        return user, vehicles
+
+    async def _drive(self, application, headers, paths, connections, requests):
+        latencies = []
+        errors = 0
+
+        async def request(path):
+            nonlocal errors
+            sent = False
+            status_code = None
+            body = b""
+
+            async def receive():
+                nonlocal sent
+                if not sent:
+                    sent = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                # Django listens for a disconnect until the response is sent.
+                await asyncio.Event().wait()
+
+            async def send(message):
+                nonlocal status_code, body
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                elif message["type"] == "http.response.body":
+                    body += message.get("body", b"")
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": b"",
+                "headers": headers,
+                "client": ("127.0.0.1", 0),
+                "server": ("localhost", 80),
+            }
+            started = time.perf_counter()
+            await application(scope, receive, send)
+            latencies.append(time.perf_counter() - started)
+            if status_code != 200 or b'"success"' not in body:
+                errors += 1
+
+        async def connection(index):
+            for number in range(requests):
+                await request(paths[(index + number) % len(paths)])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(connection(index) for index in range(connections)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            "connections": connections,
+            "requests": len(latencies),
+            "elapsed": round(elapsed, 3),
+            "throughput": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(statistics.median(latencies) * 1000, 2),
+            "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2),
+            "errors": errors,
+        }
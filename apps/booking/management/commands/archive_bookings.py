@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.booking.services.archive import archive_bookings
+from apps.booking.services.partitions import add_months, month_start
+
+
+class Command(BaseCommand):
+    help = (
+        "Move completed bookings of months older than the retention window out of the bookings table "
+        "into compressed columnar files in BOOKING_ARCHIVE_DIR, one file per month. The booking list "
+        "and exports keep returning them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months", type=int, default=settings.BOOKING_ARCHIVE_AFTER_MONTHS,
+                            help="Months before the current one whose completed bookings stay in the table")
+        parser.add_argument("--chunk-rows", type=int, default=settings.BOOKING_ARCHIVE_CHUNK_ROWS,
+                            help="Rows per compressed chunk")
+
+    def handle(self, *args, **options):
+        if not settings.BOOKING_ARCHIVE_DIR:
+            raise CommandError(
+                "Set BOOKING_ARCHIVE_DIR to a directory on persistent storage first: archived bookings are "
+                "deleted from the table and the files are their only copy."
+            )
+        before = add_months(month_start(timezone.now()), -options["months"])
+        archived = archive_bookings(before, chunk_rows=options["chunk_rows"])
+        for month, rows, path in archived:
+            self.stdout.write(f"Archived {rows} bookings of {month:%Y-%m} to {path} ({path.stat().st_size} bytes)")
+        if not archived:
+            self.stdout.write(f"No completed bookings before {before:%Y-%m} to archive")
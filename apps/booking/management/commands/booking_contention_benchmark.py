@@ -0,0 +1,94 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.test import APIClient
+
+from apps.booking.services.availability import active_bookings_overlapping
+from apps.user.models import User
+from apps.vehicle.models import Vehicle
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent POST /api/v1/booking requests for the same vehicle and slot "
+        "and verify that exactly one booking wins every round."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=32, help="Requests racing per round")
+        parser.add_argument("--rounds", type=int, default=20, help="Number of contested slots")
+        parser.add_argument("--keep", action="store_true", help="Keep the benchmark user, vehicle and bookings")
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        rounds = options["rounds"]
+        suffix = uuid.uuid4().hex[:10]
+        user = User.objects.create(
+            email=f"contention-{suffix}@benchmark.local",
+            password="!",
+            first_name="Contention",
+            last_name="Benchmark",
+            phone="0000000000",
+            status=1,
+        )
+        vehicle = Vehicle.objects.create(user=user, make="Bench", model="Mark", year=2024, plate=f"CB{suffix}")
+
+        try:
+            results = {"created": 0, "conflict": 0, "error": 0}
+            double_booked = 0
+            elapsed = 0.0
+            for round_number in range(rounds):
+                start = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(days=round_number + 1)
+                end = start + timedelta(hours=4)
+                payload = {
+                    "vehicle_id": vehicle.id,
+                    "start_date": start.strftime("%Y-%m-%d %H:%M"),
+                    "end_date": end.strftime("%Y-%m-%d %H:%M"),
+                }
+                barrier = threading.Barrier(concurrency)
+
+                round_started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    outcomes = list(executor.map(lambda _: self._book(user, payload, barrier), range(concurrency)))
+                elapsed += time.perf_counter() - round_started
+
+                for outcome in outcomes:
+                    results[outcome] += 1
+                winners = active_bookings_overlapping(vehicle.id, start, end).count()
+                if winners != 1:
+                    double_booked += 1
+                    self.stderr.write(f"round {round_number}: {winners} active bookings for one slot")
+
+            total = concurrency * rounds
+            self.stdout.write(
+                f"requests={total} created={results['created']} conflicts={results['conflict']} "
+                f"errors={results['error']} elapsed={elapsed:.2f}s throughput={total / elapsed:.0f} req/s"
+            )
+            if double_booked or results["created"] != rounds:
+                raise CommandError(f"{double_booked} of {rounds} slots were double-booked")
+            self.stdout.write(self.style.SUCCESS(f"0 double-bookings across {rounds} contested slots"))
+        finally:
+            if not options["keep"]:
+                user.delete()
+
+    def _book(self, user, payload, barrier):
+        # The management command runs outside the test runner, so "testserver"
+        # is not an allowed host here.
+        client = APIClient(HTTP_HOST="localhost")
+        client.force_authenticate(user=user)
+        try:
+            barrier.wait()
+            response = client.post("/api/v1/booking", payload, format="json")
+        finally:
+            connection.close()
+
+        if "success" in response.data and response.data["success"]["code"] == 201:
+            return "created"
+        if "already booked" in str(response.data.get("error", {}).get("message")):
+            return "conflict"
+        return "error"
@@ -0,0 +1,28 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.booking.services.lifecycle import complete_expired_bookings
+
+
+class Command(BaseCommand):
+    help = (
+        "Mark active bookings whose end date has passed as completed, in short keyset-ordered "
+        "batches that skip rows locked by running requests. Runs once, or every --every seconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.BOOKING_SWEEP_BATCH_SIZE,
+                            help="Bookings completed per transaction")
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+        parser.add_argument("--every", type=float, help="Keep running, sweeping every this many seconds")
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            completed = complete_expired_bookings(options["batch_size"], pause=options["pause"])
+            self.stdout.write(f"Completed {completed} bookings in {time.perf_counter() - started:.2f}s")
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.booking.services.partitions import add_months, detach_partitions, ensure_future_partitions, month_start
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly bookings partitions for the coming months and, with --detach, detach the "
+        "partitions older than the retention window. Detached partitions stay behind as plain tables "
+        "unless --drop is given; partitions still holding pending or active bookings are kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months-ahead", type=int, default=settings.BOOKING_PARTITION_MONTHS_AHEAD,
+                            help="Months after the current one to create partitions for")
+        parser.add_argument("--detach", action="store_true", help="Detach partitions older than the retention window")
+        parser.add_argument("--retention-months", type=int, default=settings.BOOKING_PARTITION_RETENTION_MONTHS,
+                            help="Months before the current one that stay attached")
+        parser.add_argument("--drop", action="store_true", help="Drop detached partitions instead of keeping them")
+
+    def handle(self, *args, **options):
+        for name in ensure_future_partitions(options["months_ahead"]):
+            self.stdout.write(f"Created {name}")
+        if not options["detach"]:
+            return
+
+        cutoff = add_months(month_start(timezone.now()), -options["retention_months"])
+        detached, kept = detach_partitions(cutoff, drop=options["drop"])
+        for name in detached:
+            self.stdout.write(f"{'Dropped' if options['drop'] else 'Detached'} {name}")
+        for name in kept:
+            self.stdout.write(self.style.WARNING(f"Kept {name}: it still holds pending or active bookings"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.booking.services.calendar import rebuild_calendars
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-vehicle hourly availability bitmaps from active bookings."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vehicle", type=int, action="append", dest="vehicle_ids",
+                            help="Only rebuild this vehicle (repeatable)")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_calendars(options["vehicle_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt calendars from {rebuilt} active bookings"))
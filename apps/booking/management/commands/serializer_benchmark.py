@@ -0,0 +1,95 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.booking.models import Booking
+from apps.booking.serializers.booking_serializer import BookingSerializer
+from apps.user.models import User
+from apps.vehicle.models import Vehicle
+from constants.common_status import CommonStatus
+from utils.common import get_date
+
+
+def legacy_representation(instance):
+    # BookingSerializer.to_representation before the row path existed.
+    return {
+        "object": "booking",
+        "id": instance.id,
+        "user_id": instance.user_id,
+        "vehicle_id": instance.vehicle_id,
+        "start_date": get_date(instance.start_date),
+        "end_date": get_date(instance.end_date),
+        "status": instance.status,
+        "created_at": get_date(instance.created_at),
+        "updated_at": get_date(instance.updated_at),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure rows per second for serializing a large booking list: model instances "
+        "through the old per-instance path versus BookingSerializer(many=True) reading "
+        ".values() rows. The seeded rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="Bookings in the list")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per path; the best one is reported")
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        with transaction.atomic():
+            bookings = self._seed(rows)
+            paths = {
+                "instances (legacy)": lambda: [legacy_representation(booking) for booking in bookings.all()],
+                "instances": lambda: BookingSerializer(list(bookings.all()), many=True).data,
+                "values rows": lambda: BookingSerializer(bookings.all(), many=True).data,
+            }
+
+            reference = JSONRenderer().render(paths["instances (legacy)"]())
+            results = {}
+            for name, serialize in paths.items():
+                if JSONRenderer().render(serialize()) != reference:
+                    self.stderr.write(f"{name}: output differs from the legacy serializer")
+                results[name] = min(self._time(serialize) for _ in range(options["repeat"]))
+            transaction.set_rollback(True)
+
+        baseline = results["instances (legacy)"]
+        self.stdout.write(f"{'path':<20} {'seconds':>8} {'rows/s':>10} {'speedup':>8}")
+        for name, elapsed in results.items():
+            self.stdout.write(f"{name:<20} {elapsed:>8.3f} {rows / elapsed:>10.0f} {baseline / elapsed:>7.1f}x")
+
+    def _seed(self, rows):
+        suffix = uuid.uuid4().hex[:10]
+        user = User.objects.create(
+            email=f"serializer-{suffix}@benchmark.local",
+            password="!",
+            first_name="Serializer",
+            last_name="Benchmark",
+            phone="0000000000",
+            status=1,
+        )
+        vehicle = Vehicle.objects.create(user=user, make="Bench", model="Mark", year=2024, plate=f"SB{suffix}")
+        start = datetime.now().astimezone()
+        # Completed bookings are outside the overlap constraint, so the
+        # timestamps can be dense.
+        Booking.objects.bulk_create(
+            Booking(
+                user=user,
+                vehicle=vehicle,
+                start_date=start + timedelta(minutes=index),
+                end_date=start + timedelta(minutes=index, hours=2),
+                status=CommonStatus.COMPLETED.value,
+            )
+            for index in range(rows)
+        )
+        return Booking.objects.filter(user=user).order_by("-created_at", "-id")
+
+    def _time(self, serialize):
+        started = time.perf_counter()
+        serialize()
+        return time.perf_counter() - started
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0002_booking_period_exclusion'),
+        ('vehicle', '0003_created_at_keyset_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='bookings_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0003_created_at_keyset_index'),
+        ('vehicle', '0003_created_at_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VehicleCalendarDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('busy_hours', models.IntegerField(default=0)),
+                ('vehicle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='vehicle.vehicle')),
+            ],
+            options={
+                'db_table': 'vehicle_calendar_days',
+                'constraints': [models.UniqueConstraint(fields=('vehicle', 'day'), name='vehicle_calendar_days_vehicle_day_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-17 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0004_vehicle_calendar_day'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['start_date', 'id'], name='bookings_start_date_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-17 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0005_start_date_export_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status', 1)), fields=['end_date', 'id'], name='bookings_active_end_idx'),
+        ),
+    ]
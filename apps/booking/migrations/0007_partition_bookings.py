@@ -0,0 +1,180 @@
+from datetime import date, datetime, timezone as dt_timezone
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# Frozen copies of the apps.booking.services.partitions helpers as of this
+# migration, so later changes to that module cannot alter what it does.
+DEFAULT_PARTITION = "bookings_default"
+PARTITION_COLUMNS = "id, user_id, vehicle_id, start_date, end_date, status, created_at, updated_at"
+
+
+def month_start(value):
+    if isinstance(value, datetime) and value.tzinfo:
+        value = value.astimezone(dt_timezone.utc)
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_partition(cursor, month):
+    # The default partition is only created after the monthly ones, so no
+    # rows can be stranded in it yet.
+    upper = add_months(month, 1)
+    cursor.execute(
+        f"CREATE TABLE bookings_p{month:%Y_%m} PARTITION OF bookings FOR VALUES FROM (%s) TO (%s)",
+        [
+            datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc),
+            datetime(upper.year, upper.month, 1, tzinfo=dt_timezone.utc),
+        ],
+    )
+
+
+# A partitioned table cannot carry an exclusion constraint across
+# partitions, so the overlap rule moves into a trigger raising the same
+# error the constraint did. The per-vehicle advisory lock serialises
+# concurrent writers, which under READ COMMITTED then see each other's rows.
+OVERLAP_TRIGGER_SQL = """
+    CREATE FUNCTION bookings_no_active_overlap() RETURNS trigger LANGUAGE plpgsql AS $$
+    BEGIN
+        IF NEW.status = 1 AND NEW.vehicle_id IS NOT NULL THEN
+            PERFORM pg_advisory_xact_lock(hashtextextended('bookings:' || NEW.vehicle_id, 0));
+            IF EXISTS (
+                SELECT 1 FROM bookings
+                WHERE vehicle_id = NEW.vehicle_id AND status = 1 AND id <> NEW.id
+                  AND start_date <= NEW.end_date
+                  AND period && tstzrange(NEW.start_date, NEW.end_date, '[]')
+            ) THEN
+                RAISE EXCEPTION 'conflicting active booking for vehicle %', NEW.vehicle_id
+                    USING ERRCODE = 'exclusion_violation', CONSTRAINT = 'bookings_no_active_overlap';
+            END IF;
+        END IF;
+        RETURN NEW;
+    END
+    $$;
+    CREATE TRIGGER bookings_no_active_overlap
+        BEFORE INSERT OR UPDATE OF vehicle_id, start_date, end_date, status ON bookings
+        FOR EACH ROW EXECUTE FUNCTION bookings_no_active_overlap();
+"""
+ACTIVE_PERIOD_INDEX_SQL = (
+    "CREATE INDEX bookings_active_period_idx ON bookings USING gist (vehicle_id, period) WHERE status = 1"
+)
+OVERLAP_CONSTRAINT_SQL = (
+    "ALTER TABLE bookings ADD CONSTRAINT bookings_no_active_overlap "
+    "EXCLUDE USING gist (vehicle_id WITH =, period WITH &&) WHERE (status = 1)"
+)
+
+
+def table_definitions(cursor, table):
+    """Secondary index and foreign key DDL of ``table``, to replay on its replacement."""
+    cursor.execute(
+        "SELECT replace(pg_get_indexdef(idx.indexrelid), ' ON ONLY ', ' ON ') FROM pg_index idx "
+        "WHERE idx.indrelid = %s::regclass AND NOT idx.indisprimary "
+        "AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = idx.indexrelid)",
+        [table],
+    )
+    indexes = [definition for definition, in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+        [table],
+    )
+    return indexes, cursor.fetchall()
+
+
+def replace_bookings(cursor, old_name, create_sql):
+    """Move ``bookings`` aside as ``old_name`` and create its replacement with ``create_sql``.
+
+    Returns the secondary indexes and foreign keys of the old table, which
+    ``copy_bookings`` recreates once the old table is gone.
+    """
+    definitions = table_definitions(cursor, "bookings")
+    cursor.execute(f"ALTER TABLE bookings RENAME TO {old_name}")
+    cursor.execute(create_sql.format(source=old_name))
+    return definitions
+
+
+def copy_bookings(cursor, old_name, primary_key, indexes, foreign_keys):
+    cursor.execute(
+        f"INSERT INTO bookings ({PARTITION_COLUMNS}) OVERRIDING SYSTEM VALUE "
+        f"SELECT {PARTITION_COLUMNS} FROM {old_name}"
+    )
+    cursor.execute(f"DROP TABLE {old_name} CASCADE")
+    cursor.execute("SELECT pg_get_serial_sequence('bookings', 'id')")
+    sequence = cursor.fetchone()[0]
+    cursor.execute(f"ALTER SEQUENCE {sequence} RENAME TO bookings_id_seq")
+    cursor.execute(
+        "SELECT setval('bookings_id_seq', GREATEST(MAX(id), 1), MAX(id) IS NOT NULL) FROM bookings"
+    )
+    cursor.execute(f"ALTER TABLE bookings ADD CONSTRAINT bookings_pkey PRIMARY KEY ({primary_key})")
+    for definition in indexes:
+        cursor.execute(definition)
+    for name, definition in foreign_keys:
+        cursor.execute(f"ALTER TABLE bookings ADD CONSTRAINT {name} {definition}")
+
+
+def partition_bookings(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        indexes, foreign_keys = replace_bookings(
+            cursor,
+            "bookings_unpartitioned",
+            "CREATE TABLE bookings (LIKE {source} INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING IDENTITY) "
+            "PARTITION BY RANGE (start_date)",
+        )
+        cursor.execute("SELECT MIN(start_date) FROM bookings_unpartitioned")
+        first = cursor.fetchone()[0]
+        current = month_start(timezone.now())
+        last = add_months(current, getattr(settings, "BOOKING_PARTITION_MONTHS_AHEAD", 3))
+        month = min(month_start(first), current) if first else current
+        while month <= last:
+            create_partition(cursor, month)
+            month = add_months(month, 1)
+        cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF bookings DEFAULT")
+
+        # The partition key has to be part of the primary key.
+        copy_bookings(cursor, "bookings_unpartitioned", "id, start_date", indexes, foreign_keys)
+        cursor.execute(ACTIVE_PERIOD_INDEX_SQL)
+        cursor.execute(OVERLAP_TRIGGER_SQL)
+        cursor.execute("ANALYZE bookings")
+
+
+def unpartition_bookings(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        indexes, foreign_keys = replace_bookings(
+            cursor,
+            "bookings_partitioned",
+            "CREATE TABLE bookings (LIKE {source} INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING IDENTITY)",
+        )
+        cursor.execute("DROP FUNCTION bookings_no_active_overlap() CASCADE")
+        indexes = [definition for definition in indexes if "bookings_active_period_idx" not in definition]
+        copy_bookings(cursor, "bookings_partitioned", "id", indexes, foreign_keys)
+        cursor.execute(OVERLAP_CONSTRAINT_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0006_active_end_index'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(partition_bookings, unpartition_bookings),
+            ],
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name='booking',
+                    name='bookings_no_active_overlap',
+                ),
+                migrations.AddIndex(
+                    model_name='booking',
+                    index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('status', 1)), fields=['vehicle', 'period'], name='bookings_active_period_idx'),
+                ),
+            ],
+        ),
+    ]
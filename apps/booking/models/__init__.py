@@ -1 +1,2 @@
-from .booking import Booking
\ No newline at end of file
+from .booking import Booking
+from .vehicle_calendar_day import VehicleCalendarDay
\ No newline at end of file
@@ -1,18 +1,59 @@
+from django.contrib.postgres.fields import DateTimeRangeField, RangeBoundary
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models
 from apps.user.models.user import User
 from apps.vehicle.models.vehicle import Vehicle
+from constants.common_status import CommonStatus
+
+# Raised by the trigger that keeps active bookings of a vehicle from
+# overlapping; see migration 0007.
+BOOKING_OVERLAP_CONSTRAINT = "bookings_no_active_overlap"
+
+
+class TsTzRange(models.Func):
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
+
 
 class Booking(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     vehicle = models.ForeignKey(Vehicle, on_delete=models.SET_NULL, null=True)
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
+    # Closed [start_date, end_date] range kept in sync by Postgres, so bookings
+    # that touch at the edges still count as overlapping.
+    period = models.GeneratedField(
+        expression=TsTzRange(
+            "start_date", "end_date", RangeBoundary(inclusive_lower=True, inclusive_upper=True)
+        ),
+        output_field=DateTimeRangeField(),
+        db_persist=True,
+    )
     status = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # Range partitioned by month on start_date (services/partitions.py),
+        # with (id, start_date) as the primary key in the database.
         db_table = "bookings"
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"], name="bookings_user_created_idx"),
+            models.Index(fields=["start_date", "id"], name="bookings_start_date_idx"),
+            # Only live rows, so it stays small however long the history grows;
+            # the lifecycle sweeper walks it to find expired bookings.
+            models.Index(
+                fields=["end_date", "id"],
+                name="bookings_active_end_idx",
+                condition=models.Q(status=CommonStatus.ACTIVE.value),
+            ),
+            # Backs the overlap trigger's lookup of a vehicle's active periods.
+            GistIndex(
+                fields=["vehicle", "period"],
+                name="bookings_active_period_idx",
+                condition=models.Q(status=CommonStatus.ACTIVE.value),
+            ),
+        ]
 
     def __str__(self):
-        return self.pk
\ No newline at end of file
+        return self.pk
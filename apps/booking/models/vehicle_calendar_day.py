@@ -0,0 +1,18 @@
+from django.db import models
+from apps.vehicle.models.vehicle import Vehicle
+
+
+class VehicleCalendarDay(models.Model):
+    vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE)
+    day = models.DateField()
+    # Bit n is set when hour n (UTC) of the day is held by an active booking.
+    busy_hours = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "vehicle_calendar_days"
+        constraints = [
+            models.UniqueConstraint(fields=["vehicle", "day"], name="vehicle_calendar_days_vehicle_day_uniq"),
+        ]
+
+    def __str__(self):
+        return self.pk
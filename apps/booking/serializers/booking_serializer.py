@@ -1,29 +1,72 @@
 from rest_framework.serializers import ModelSerializer
 
 from apps.booking.models.booking import Booking
-from rest_framework import serializers
+from apps.booking.services.availability import BOOKING_CONFLICT_MESSAGE, is_overlap_violation
+from apps.booking.services.calendar import mark_booked, refresh_calendar
+from rest_framework import serializers, status
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from apps.vehicle.models import Vehicle
 from constants.common_status import CommonStatus
-from utils.common import get_date
+from utils.common import format_date
+from utils.error_handler import CustomAPIException
+from utils.serializers import RowListSerializer, TimedDataMixin
 
-class BookingSerializer(ModelSerializer):
+class BookingSerializer(TimedDataMixin, ModelSerializer):
     # start_date = serializers.DateTimeField()
     # end_date = serializers.DateTimeField()
     
     class Meta:
         model = Booking
         fields =["user", "vehicle", "start_date", "end_date"]
+        list_serializer_class = RowListSerializer
+
+    row_fields = ("id", "user_id", "vehicle_id", "start_date", "end_date", "status", "created_at", "updated_at")
  
     def create(self, validated_data):
         booking = Booking(
-            user=validated_data["user"],
+            # Only the key is needed, so token-backed users work here too.
+            user_id=validated_data["user"].pk,
             vehicle=validated_data["vehicle"],
             start_date=validated_data["start_date"],
             end_date=validated_data["end_date"],
             status=CommonStatus.ACTIVE.value,
         )
-        booking.save()
+        # The overlap trigger is the source of truth for overlaps; the
+        # savepoint keeps a rejected insert from poisoning the outer transaction.
+        try:
+            with transaction.atomic():
+                booking.save()
+                mark_booked([booking])
+        except IntegrityError as error:
+            if not is_overlap_violation(error):
+                raise
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=BOOKING_CONFLICT_MESSAGE,
+            )
+        return booking
+
+    def update(self, instance, validated_data):
+        # Status is not a writable field; callers change it with
+        # serializer.save(status=...), which lands in validated_data.
+        previous_start, previous_end = instance.start_date, instance.end_date
+        try:
+            with transaction.atomic():
+                booking = super().update(instance, validated_data)
+                if booking.vehicle_id:
+                    refresh_calendar(
+                        booking.vehicle_id,
+                        min(previous_start, booking.start_date),
+                        max(previous_end, booking.end_date),
+                    )
+        except IntegrityError as error:
+            if not is_overlap_violation(error):
+                raise
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=BOOKING_CONFLICT_MESSAGE,
+            )
         return booking
     
     def to_representation(self, instance):
@@ -32,10 +75,24 @@ class BookingSerializer(ModelSerializer):
             "id": instance.id,
             "user_id": instance.user_id,
             "vehicle_id": instance.vehicle_id,
-            "start_date": get_date(instance.start_date),
-            "end_date": get_date(instance.end_date),
+            "start_date": format_date(instance.start_date),
+            "end_date": format_date(instance.end_date),
             "status": instance.status,
-            "created_at": get_date(instance.created_at),
-            "updated_at": get_date(instance.updated_at),
+            "created_at": format_date(instance.created_at),
+            "updated_at": format_date(instance.updated_at),
+        }
+
+    @staticmethod
+    def row_representation(row):
+        return {
+            "object": "booking",
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "vehicle_id": row["vehicle_id"],
+            "start_date": format_date(row["start_date"]),
+            "end_date": format_date(row["end_date"]),
+            "status": row["status"],
+            "created_at": format_date(row["created_at"]),
+            "updated_at": format_date(row["updated_at"]),
         }
 
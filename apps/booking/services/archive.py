@@ -0,0 +1,474 @@
+"""Cold archive of completed bookings in compressed columnar files.
+
+``archive_bookings`` moves the completed bookings of every month older than
+the retention window out of ``bookings`` into one file per month under
+``BOOKING_ARCHIVE_DIR``. A file keeps its rows sorted by vehicle and start
+date in chunks of ``BOOKING_ARCHIVE_CHUNK_ROWS``. Each column of a chunk is
+a zlib-compressed block of little-endian int64: timestamps are microseconds
+since the epoch and a missing vehicle is 0. A compressed JSON footer indexes
+the chunks by vehicle, by user and by start date range. A lookup maps the
+file, reads the footer and decompresses only the columns of chunks that can
+match.
+
+File layout: ``MAGIC``, the column blocks, the footer, then a trailer
+holding the footer's offset and length followed by ``MAGIC`` again.
+"""
+import heapq
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from collections import deque
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from itertools import groupby, islice
+from operator import itemgetter
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.booking.models.booking import Booking
+from apps.booking.services.partitions import month_bounds, month_start
+from constants.common_status import CommonStatus
+
+MAGIC = b"BKARCH01"
+TRAILER = struct.Struct("<QQ8s")
+ARCHIVE_COLUMNS = ("id", "user_id", "vehicle_id", "start_date", "end_date", "status", "created_at", "updated_at")
+TIMESTAMP_COLUMNS = frozenset(("start_date", "end_date", "created_at", "updated_at"))
+ARCHIVE_FILE_NAME = re.compile(r"^bookings-(\d{4})-(\d{2})-(\d+)\.bka$")
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# Open archives and the directory listing, kept per process. Files are never
+# rewritten in place, so a path with the same inode and size is unchanged.
+_archives = {}
+_listing = {}
+
+
+def to_micros(value):
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(value):
+    return EPOCH + timedelta(microseconds=value)
+
+
+def start_of(value):
+    """``value`` as an aware datetime; dates start at midnight, as in a queryset filter."""
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def encode_column(values):
+    column = array("q", values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return zlib.compress(column.tobytes())
+
+
+def decode_column(block):
+    column = array("q")
+    column.frombytes(zlib.decompress(block))
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class ArchiveWriter:
+    """Writes one archive file a chunk at a time.
+
+    Rows are tuples ordered like ``ARCHIVE_COLUMNS`` and must arrive sorted
+    by vehicle, so every vehicle occupies a contiguous run of chunks.
+    """
+
+    def __init__(self, path, month, chunk_rows):
+        self.month = month
+        self.chunk_rows = chunk_rows
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.pending = []
+        self.chunks = []
+        self.vehicles = {}
+        self.users = {}
+        self.rows = 0
+
+    def add(self, row):
+        self.pending.append(row)
+        if len(self.pending) == self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        index = len(self.chunks)
+        columns = {}
+        blocks = []
+        for name, values in zip(ARCHIVE_COLUMNS, zip(*self.pending)):
+            if name in TIMESTAMP_COLUMNS:
+                values = [to_micros(value) for value in values]
+            elif name == "vehicle_id":
+                values = [value or 0 for value in values]
+            columns[name] = values
+            block = encode_column(values)
+            blocks.append([self.file.tell(), len(block)])
+            self.file.write(block)
+
+        self.chunks.append({
+            "rows": len(self.pending),
+            "blocks": blocks,
+            "start": [min(columns["start_date"]), max(columns["start_date"])],
+        })
+        for vehicle_id in set(columns["vehicle_id"]):
+            self.vehicles.setdefault(str(vehicle_id), [index, index])[1] = index
+        for user_id in set(columns["user_id"]):
+            self.users.setdefault(str(user_id), []).append(index)
+        self.rows += len(self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        footer = zlib.compress(json.dumps({
+            "month": f"{self.month:%Y-%m}",
+            "rows": self.rows,
+            "columns": ARCHIVE_COLUMNS,
+            "chunks": self.chunks,
+            "vehicles": self.vehicles,
+            "users": self.users,
+        }, separators=(",", ":")).encode())
+        offset = self.file.tell()
+        self.file.write(footer)
+        self.file.write(TRAILER.pack(offset, len(footer), MAGIC))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+
+class ArchiveFile:
+    """Read-only view of an archive file through ``mmap``."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset, length, magic = TRAILER.unpack_from(self.map, len(self.map) - TRAILER.size)
+        if magic != MAGIC or self.map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a booking archive")
+        self.footer = json.loads(zlib.decompress(self.map[offset:offset + length]))
+        self.chunks = self.footer["chunks"]
+
+    def column(self, chunk, name):
+        offset, length = self.chunks[chunk]["blocks"][ARCHIVE_COLUMNS.index(name)]
+        return decode_column(self.map[offset:offset + length])
+
+    def candidate_chunks(self, user_id=None, vehicle_id=None, start_from=None):
+        """Chunks the footer cannot rule out for the filter."""
+        chunks = range(len(self.chunks))
+        if vehicle_id is not None:
+            first, last = self.footer["vehicles"].get(str(vehicle_id), (0, -1))
+            chunks = range(first, last + 1)
+        if user_id is not None:
+            chunks = sorted(set(chunks).intersection(self.footer["users"].get(str(user_id), ())))
+        if start_from is not None:
+            lower = to_micros(start_from)
+            chunks = [chunk for chunk in chunks if self.chunks[chunk]["start"][1] >= lower]
+        return chunks
+
+    def matching(self, chunk, user_id=None, vehicle_id=None, lower=None):
+        """Decode the filtered columns of ``chunk``; returns them and the indexes of the rows that match."""
+        columns = {}
+        keep = range(self.chunks[chunk]["rows"])
+        for name, wanted in (("user_id", user_id), ("vehicle_id", vehicle_id)):
+            if wanted is not None:
+                columns[name] = self.column(chunk, name)
+                keep = [index for index in keep if columns[name][index] == wanted]
+        if lower is not None:
+            columns["start_date"] = self.column(chunk, "start_date")
+            keep = [index for index in keep if columns["start_date"][index] >= lower]
+        return columns, keep
+
+    def row(self, chunk, columns, index):
+        """Row ``index`` of ``chunk`` as a dict, decoding the columns still missing from ``columns``."""
+        for name in ARCHIVE_COLUMNS:
+            if name not in columns:
+                columns[name] = self.column(chunk, name)
+        row = {}
+        for name in ARCHIVE_COLUMNS:
+            value = columns[name][index]
+            if name in TIMESTAMP_COLUMNS:
+                value = from_micros(value)
+            elif name == "vehicle_id":
+                value = value or None
+            row[name] = value
+        return row
+
+    def rows(self, user_id=None, vehicle_id=None, start_from=None):
+        """Yield the matching bookings as dicts shaped like ``.values(*ARCHIVE_COLUMNS)`` rows."""
+        lower = to_micros(start_from) if start_from is not None else None
+        for chunk in self.candidate_chunks(user_id, vehicle_id, start_from):
+            # Decode the filtered columns first; the rest only for chunks with hits.
+            columns, keep = self.matching(chunk, user_id, vehicle_id, lower)
+            for index in keep:
+                yield self.row(chunk, columns, index)
+
+    def newest_rows(self, user_id, start_from=None, before=None, limit=None):
+        """Yield the bookings of ``user_id`` newest created first.
+
+        Only rows whose ``(created_at, id)`` sorts below ``before`` count,
+        and at most ``limit`` of them are yielded. The rows are ranked on
+        the key columns alone, so the others are decoded only for the chunks
+        a yielded row comes from.
+        """
+        lower = to_micros(start_from) if start_from is not None else None
+        bound = (to_micros(before[0]), before[1]) if before is not None else None
+        decoded = {}
+        keys = []
+        for chunk in self.candidate_chunks(user_id=user_id, start_from=start_from):
+            columns, keep = self.matching(chunk, user_id=user_id, lower=lower)
+            if not keep:
+                continue
+            for name in ("created_at", "id"):
+                columns[name] = self.column(chunk, name)
+            created, ids = columns["created_at"], columns["id"]
+            decoded[chunk] = columns
+            keys.extend(
+                (created[index], ids[index], chunk, index) for index in keep
+                if bound is None or (created[index], ids[index]) < bound
+            )
+        keys = heapq.nlargest(limit, keys) if limit is not None else sorted(keys, reverse=True)
+        for _, _, chunk, index in keys:
+            yield self.row(chunk, decoded[chunk], index)
+
+
+    def rows_by_start(self, start, end, vehicle_ids=None):
+        """Yield the bookings starting in ``[start, end)`` in ``(start_date, id)`` order.
+
+        The file keeps rows by vehicle, so the matching rows of the month are
+        ordered on their key columns first. ``vehicle_ids`` narrows the rows
+        to those vehicles.
+        """
+        lower, upper = to_micros(start), to_micros(end)
+        chunks = range(len(self.chunks))
+        if vehicle_ids is not None:
+            chunks = set()
+            for vehicle_id in vehicle_ids:
+                first, last = self.footer["vehicles"].get(str(vehicle_id), (0, -1))
+                chunks.update(range(first, last + 1))
+        decoded = {}
+        keys = []
+        for chunk in sorted(chunks):
+            first, last = self.chunks[chunk]["start"]
+            if last < lower or first >= upper:
+                continue
+            columns = {name: self.column(chunk, name) for name in ("vehicle_id", "start_date", "id")}
+            starts, ids = columns["start_date"], columns["id"]
+            keep = [
+                index for index in range(self.chunks[chunk]["rows"])
+                if lower <= starts[index] < upper
+                and (vehicle_ids is None or columns["vehicle_id"][index] in vehicle_ids)
+            ]
+            if keep:
+                decoded[chunk] = columns
+                keys.extend((starts[index], ids[index], chunk, index) for index in keep)
+        keys.sort()
+        for _, _, chunk, index in keys:
+            yield self.row(chunk, decoded[chunk], index)
+
+
+def archive_dir():
+    """``BOOKING_ARCHIVE_DIR``, or ``None`` when no archive is configured."""
+    return Path(settings.BOOKING_ARCHIVE_DIR) if settings.BOOKING_ARCHIVE_DIR else None
+
+
+def archive_files():
+    """``(month, path)`` of every archive file, oldest month first."""
+    directory = archive_dir()
+    if directory is None:
+        return []
+    try:
+        version = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    cached = _listing.get(directory)
+    if cached is None or cached[0] != version:
+        files = []
+        for path in directory.iterdir():
+            match = ARCHIVE_FILE_NAME.match(path.name)
+            if match:
+                files.append((date(int(match[1]), int(match[2]), 1), int(match[3]), path))
+        cached = _listing[directory] = version, [(month, path) for month, _, path in sorted(files)]
+    return cached[1]
+
+
+def open_archive(path):
+    stat = path.stat()
+    key = stat.st_ino, stat.st_size
+    cached = _archives.get(path)
+    if cached is None or cached[0] != key:
+        cached = _archives[path] = key, ArchiveFile(path)
+    return cached[1]
+
+
+def archived_until():
+    """End of the newest archived month, or ``None`` without an archive."""
+    files = archive_files()
+    return month_bounds(files[-1][0])[1] if files else None
+
+
+def archived_bookings(user_id, start_from=None, before=None, limit=None):
+    """Archived bookings of ``user_id`` starting at or after ``start_from``, newest created first.
+
+    A lazy merge of every month file that can match: with a keyset cursor
+    ``before`` (a ``(created_at, id)`` pair) only rows created before it are
+    decoded, and with ``limit`` at most that many per file. Without
+    ``start_from`` every month counts. Touches no file when ``start_from`` is
+    past the newest archived month.
+    """
+    start_from = start_of(start_from) if start_from is not None else None
+    until = archived_until()
+    if until is None or (start_from is not None and start_from >= until):
+        return
+    months = [
+        open_archive(path).newest_rows(user_id, start_from, before, limit)
+        for month, path in archive_files() if start_from is None or month_bounds(month)[1] > start_from
+    ]
+    rows = heapq.merge(*months, key=created_key, reverse=True)
+    yield from islice(rows, limit) if limit is not None else rows
+
+
+def archived_vehicle_bookings(vehicle_id, start_from=None):
+    """Archived bookings of ``vehicle_id``, in start date order within each month."""
+    start_from = start_of(start_from) if start_from is not None else None
+    for month, path in archive_files():
+        if start_from is None or month_bounds(month)[1] > start_from:
+            yield from open_archive(path).rows(vehicle_id=vehicle_id, start_from=start_from)
+
+
+def archived_bookings_by_start(start, end, vehicle_ids=None):
+    """Archived bookings starting in ``[start, end)``, oldest first; ``vehicle_ids`` narrows them to those vehicles.
+
+    Months are read one at a time, merging the files of a month.
+    """
+    for month, files in groupby(archive_files(), key=itemgetter(0)):
+        lower, upper = month_bounds(month)
+        if upper <= start or lower >= end:
+            continue
+        yield from heapq.merge(
+            *(open_archive(path).rows_by_start(start, end, vehicle_ids) for _, path in files),
+            key=itemgetter("start_date", "id"),
+        )
+
+
+def created_key(row):
+    return row["created_at"], row["id"]
+
+
+def merge_newest_first(rows, archived):
+    """Merge two ``(created_at, id)`` descending row streams."""
+    return heapq.merge(rows, archived, key=created_key, reverse=True)
+
+
+async def amerge_newest_first(rows, archived, batch_size=500):
+    """:func:`merge_newest_first` for an async ``rows`` stream.
+
+    Reading the archive blocks, so ``archived`` is pulled ``batch_size``
+    rows at a time in a worker thread.
+    """
+    archived = iter(archived)
+    fetch = sync_to_async(lambda: list(islice(archived, batch_size)))
+    batch = deque()
+    exhausted = False
+
+    async def pending():
+        nonlocal exhausted
+        if not batch and not exhausted:
+            batch.extend(await fetch())
+            exhausted = len(batch) < batch_size
+        return batch[0] if batch else None
+
+    async for row in rows:
+        while (head := await pending()) is not None and created_key(head) > created_key(row):
+            yield batch.popleft()
+        yield row
+    while await pending() is not None:
+        yield batch.popleft()
+
+
+def archivable_months(before):
+    """Months before the month of ``before`` that still hold completed bookings."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', start_date AT TIME ZONE 'UTC') FROM bookings "
+            "WHERE status = %s AND start_date < %s ORDER BY 1",
+            [CommonStatus.COMPLETED.value, month_bounds(month_start(before))[0]],
+        )
+        return [month_start(month) for month, in cursor.fetchall()]
+
+
+def archive_path(month):
+    taken = [int(match[3]) for path in archive_dir().glob(f"bookings-{month:%Y-%m}-*.bka")
+             if (match := ARCHIVE_FILE_NAME.match(path.name))]
+    return archive_dir() / f"bookings-{month:%Y-%m}-{max(taken, default=0) + 1}.bka"
+
+
+def archive_month(month, chunk_rows):
+    """Move the completed bookings of ``month`` into a new archive file.
+
+    Returns ``(rows, path)``, or ``(0, None)`` when there was nothing to
+    move. The file is renamed into place just before the delete commits, and
+    removed again if the transaction fails.
+    """
+    lower, upper = month_bounds(month)
+    archive_dir().mkdir(parents=True, exist_ok=True)
+    path = partial = None
+    try:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                # One archiver at a time, so file numbers and row sets never clash.
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext('bookings:archive'))")
+            path = archive_path(month)
+            partial = path.with_name(path.name + ".partial")
+            rows = (
+                Booking.objects.select_for_update()
+                .filter(status=CommonStatus.COMPLETED.value, start_date__gte=lower, start_date__lt=upper)
+                .order_by("vehicle_id", "start_date", "id")
+                .values_list(*ARCHIVE_COLUMNS)
+                .iterator(chunk_size=chunk_rows)
+            )
+            writer = ArchiveWriter(partial, month, chunk_rows)
+            ids = []
+            for row in rows:
+                writer.add(row)
+                ids.append(row[0])
+            writer.close()
+            if not ids:
+                partial.unlink()
+                return 0, None
+
+            with connection.cursor() as cursor:
+                for offset in range(0, len(ids), chunk_rows):
+                    cursor.execute(
+                        "DELETE FROM bookings WHERE id = ANY(%s) AND start_date >= %s AND start_date < %s",
+                        [ids[offset:offset + chunk_rows], lower, upper],
+                    )
+            partial.replace(path)
+    except BaseException:
+        for leftover in (partial, path):
+            if leftover is not None:
+                leftover.unlink(missing_ok=True)
+        raise
+    return len(ids), path
+
+
+def archive_bookings(before, chunk_rows=8192):
+    """Archive every month before the month of ``before``; returns ``[(month, rows, path)]``."""
+    archived = []
+    for month in archivable_months(before):
+        rows, path = archive_month(month, chunk_rows)
+        if rows:
+            archived.append((month, rows, path))
+    return archived
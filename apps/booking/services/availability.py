@@ -0,0 +1,80 @@
+from django.contrib.postgres.fields.ranges import DateTimeTZRange
+from django.db import IntegrityError
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.booking.models.booking import BOOKING_OVERLAP_CONSTRAINT, Booking
+from constants.common_status import CommonStatus
+
+BOOKING_CONFLICT_MESSAGE = "Vehicle is already booked for the selected dates."
+
+
+def as_aware(value):
+    if timezone.is_naive(value):
+        return timezone.make_aware(value)
+    return value
+
+
+def booking_period(start_date, end_date):
+    return DateTimeTZRange(as_aware(start_date), as_aware(end_date), bounds="[]")
+
+
+def active_bookings_overlapping(vehicle_id, start_date, end_date):
+    # Served by bookings_active_period_idx. The start_date bound is implied by
+    # the overlap but lets Postgres skip the partitions of later months.
+    return Booking.objects.filter(
+        vehicle_id=vehicle_id,
+        status=CommonStatus.ACTIVE.value,
+        start_date__lte=as_aware(end_date),
+        period__overlap=booking_period(start_date, end_date),
+    )
+
+
+def is_vehicle_booked(vehicle_id, start_date, end_date):
+    return active_bookings_overlapping(vehicle_id, start_date, end_date).exists()
+
+
+async def ais_vehicle_booked(vehicle_id, start_date, end_date):
+    return await active_bookings_overlapping(vehicle_id, start_date, end_date).aexists()
+
+
+def find_booked_periods(periods):
+    """Return the indexes of ``(vehicle_id, start_date, end_date)`` periods that
+    overlap an active booking, using a single query for the whole list."""
+    if not periods:
+        return set()
+
+    overlaps = Q()
+    for vehicle_id, start_date, end_date in periods:
+        overlaps |= Q(vehicle_id=vehicle_id, period__overlap=booking_period(start_date, end_date))
+    latest_end = max(as_aware(end_date) for _, _, end_date in periods)
+    booked = Booking.objects.filter(
+        overlaps, status=CommonStatus.ACTIVE.value, start_date__lte=latest_end
+    ).values_list(
+        "vehicle_id", "start_date", "end_date"
+    )
+
+    booked_by_vehicle = {}
+    for vehicle_id, start_date, end_date in booked:
+        booked_by_vehicle.setdefault(vehicle_id, []).append((start_date, end_date))
+
+    return {
+        index
+        for index, (vehicle_id, start_date, end_date) in enumerate(periods)
+        if any(
+            periods_overlap(start_date, end_date, booked_start, booked_end)
+            for booked_start, booked_end in booked_by_vehicle.get(vehicle_id, [])
+        )
+    }
+
+
+def periods_overlap(start_date, end_date, other_start, other_end):
+    return as_aware(start_date) <= as_aware(other_end) and as_aware(other_start) <= as_aware(end_date)
+
+
+def is_overlap_violation(error: IntegrityError):
+    diag = getattr(error.__cause__, "diag", None)
+    constraint_name = getattr(diag, "constraint_name", None)
+    if constraint_name:
+        return constraint_name == BOOKING_OVERLAP_CONSTRAINT
+    return BOOKING_OVERLAP_CONSTRAINT in str(error)
@@ -0,0 +1,144 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db import connection, transaction
+
+from apps.booking.models.booking import Booking
+from apps.booking.models.vehicle_calendar_day import VehicleCalendarDay
+from apps.booking.services.availability import active_bookings_overlapping, as_aware
+from constants.common_status import CommonStatus
+
+HOURS_PER_DAY = 24
+
+UPSERT_OR_SQL = """
+    INSERT INTO vehicle_calendar_days (vehicle_id, day, busy_hours) VALUES {values}
+    ON CONFLICT (vehicle_id, day)
+    DO UPDATE SET busy_hours = vehicle_calendar_days.busy_hours | EXCLUDED.busy_hours
+"""
+
+UPSERT_SET_SQL = """
+    INSERT INTO vehicle_calendar_days (vehicle_id, day, busy_hours) VALUES {values}
+    ON CONFLICT (vehicle_id, day)
+    DO UPDATE SET busy_hours = EXCLUDED.busy_hours
+"""
+
+# hour_masks in SQL: every UTC hour from the start up to and including the
+# end sets its bit on that day.
+MARK_LOADED_SQL = """
+    INSERT INTO vehicle_calendar_days (vehicle_id, day, busy_hours)
+    SELECT vehicle_id, hour::date, bit_or(1 << extract(hour FROM hour)::int)
+    FROM bookings, generate_series(
+        date_trunc('hour', start_date AT TIME ZONE 'UTC'),
+        GREATEST(end_date, start_date) AT TIME ZONE 'UTC',
+        interval '1 hour'
+    ) AS hour
+    WHERE id > %s AND status = %s AND vehicle_id IS NOT NULL
+    GROUP BY vehicle_id, hour::date
+    ON CONFLICT (vehicle_id, day)
+    DO UPDATE SET busy_hours = vehicle_calendar_days.busy_hours | EXCLUDED.busy_hours
+"""
+
+
+def hour_masks(start_date, end_date):
+    """Map each UTC day touched by ``[start_date, end_date]`` to a 24-bit hour mask.
+
+    The bounds are closed like ``booking_period``: a booking ending at 12:00
+    conflicts with one starting at 12:00, so the 12:00 hour is booked too.
+    """
+    start = as_aware(start_date).astimezone(dt_timezone.utc)
+    end = as_aware(end_date).astimezone(dt_timezone.utc)
+    last = max(end, start)
+
+    masks = {}
+    day = start.date()
+    while day <= last.date():
+        first_hour = start.hour if day == start.date() else 0
+        last_hour = last.hour if day == last.date() else HOURS_PER_DAY - 1
+        masks[day] = ((1 << (last_hour + 1)) - 1) & ~((1 << first_hour) - 1)
+        day += timedelta(days=1)
+    return masks
+
+
+def mark_booked(bookings):
+    """OR the hours of newly written active bookings into the calendar."""
+    masks = {}
+    for booking in bookings:
+        for day, mask in hour_masks(booking.start_date, booking.end_date).items():
+            key = (booking.vehicle_id, day)
+            masks[key] = masks.get(key, 0) | mask
+    _upsert(UPSERT_OR_SQL, masks)
+
+
+def mark_loaded(after_booking_id):
+    """Set-based ``mark_booked`` for every active booking with a higher id, for bulk loads."""
+    with connection.cursor() as cursor:
+        cursor.execute(MARK_LOADED_SQL, [after_booking_id, CommonStatus.ACTIVE.value])
+        return cursor.rowcount
+
+
+def refresh_calendar(vehicle_id, start_date, end_date):
+    """Recompute the days covered by a period from the vehicle's active bookings.
+
+    Used when a booking stops being active, since its bits cannot simply be
+    cleared: another booking may share the boundary hours.
+    """
+    days = sorted(hour_masks(start_date, end_date))
+    window_start = datetime.combine(days[0], time.min, tzinfo=dt_timezone.utc)
+    window_end = datetime.combine(days[-1] + timedelta(days=1), time.min, tzinfo=dt_timezone.utc)
+
+    masks = {(vehicle_id, day): 0 for day in days}
+    bookings = active_bookings_overlapping(vehicle_id, window_start, window_end).only("start_date", "end_date")
+    for booking in bookings:
+        for day, mask in hour_masks(booking.start_date, booking.end_date).items():
+            if (vehicle_id, day) in masks:
+                masks[(vehicle_id, day)] |= mask
+
+    with transaction.atomic():
+        _upsert(UPSERT_SET_SQL, masks)
+        VehicleCalendarDay.objects.filter(vehicle_id=vehicle_id, day__in=days, busy_hours=0).delete()
+
+
+def rebuild_calendars(vehicle_ids=None, chunk_size=2000):
+    days = VehicleCalendarDay.objects.all()
+    bookings = Booking.objects.filter(status=CommonStatus.ACTIVE.value, vehicle__isnull=False)
+    if vehicle_ids:
+        days = days.filter(vehicle_id__in=vehicle_ids)
+        bookings = bookings.filter(vehicle_id__in=vehicle_ids)
+
+    rebuilt = 0
+    with transaction.atomic():
+        days.delete()
+        chunk = []
+        for booking in bookings.only("vehicle_id", "start_date", "end_date").iterator(chunk_size=chunk_size):
+            chunk.append(booking)
+            if len(chunk) == chunk_size:
+                mark_booked(chunk)
+                rebuilt += len(chunk)
+                chunk = []
+        mark_booked(chunk)
+        rebuilt += len(chunk)
+    return rebuilt
+
+
+def get_calendar(vehicle_id, from_day, days):
+    rows = dict(
+        VehicleCalendarDay.objects.filter(
+            vehicle_id=vehicle_id, day__gte=from_day, day__lt=from_day + timedelta(days=days)
+        ).values_list("day", "busy_hours")
+    )
+    return [
+        {
+            "date": day.strftime("%Y-%m-%d"),
+            "slots": "".join("1" if rows.get(day, 0) >> hour & 1 else "0" for hour in range(HOURS_PER_DAY)),
+        }
+        for day in (from_day + timedelta(days=offset) for offset in range(days))
+    ], bool(rows)
+
+
+def _upsert(sql, masks):
+    if not masks:
+        return
+    params = []
+    for (vehicle_id, day), mask in masks.items():
+        params += [vehicle_id, day, mask]
+    with connection.cursor() as cursor:
+        cursor.execute(sql.format(values=", ".join(["(%s, %s, %s)"] * len(masks))), params)
@@ -0,0 +1,155 @@
+import csv
+import heapq
+import io
+import json
+import time
+import zlib
+from datetime import datetime, time as dt_time, timezone as dt_timezone
+from itertools import islice
+from operator import itemgetter
+
+from django.db import transaction
+
+from apps.booking.models.booking import Booking
+from apps.booking.services.archive import archived_bookings_by_start, archived_until
+from apps.vehicle.models.vehicle import Vehicle
+from utils.common import format_date
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+EXPORT_FIELDS = (
+    "id", "user_id", "vehicle_id", "owner_id", "start_date", "end_date", "status", "created_at", "updated_at",
+)
+_DATE_COLUMNS = {4, 5, 7, 8}
+# gzip container rather than a bare deflate stream, so the output opens with gunzip.
+_GZIP_WBITS = 31
+
+
+def day_start(day):
+    return datetime.combine(day, dt_time.min, tzinfo=dt_timezone.utc)
+
+
+def export_queryset(start_day, end_day, owner_id=None, vehicle_id=None):
+    """Bookings starting in ``[start_day, end_day)`` (UTC), oldest first."""
+    bookings = Booking.objects.filter(start_date__gte=day_start(start_day), start_date__lt=day_start(end_day))
+    if owner_id is not None:
+        bookings = bookings.filter(vehicle__user_id=owner_id)
+    if vehicle_id is not None:
+        bookings = bookings.filter(vehicle_id=vehicle_id)
+    return bookings.order_by("start_date", "id").values_list(
+        "id", "user_id", "vehicle_id", "vehicle__user_id", "start_date", "end_date", "status", "created_at", "updated_at",
+    )
+
+
+def export_archived(start_day, end_day, owner_id=None, vehicle_id=None, batch_size=1000):
+    """Archived bookings for the same filter as :func:`export_queryset`, as rows of the same shape.
+
+    The archive does not keep the vehicle owner, so it is looked up a batch
+    of rows at a time. Nothing is read when the range starts after the
+    newest archived month.
+    """
+    start, end = day_start(start_day), day_start(end_day)
+    until = archived_until()
+    if until is None or start >= until:
+        return
+    vehicle_ids = None
+    if owner_id is not None:
+        vehicle_ids = set(Vehicle.objects.filter(user_id=owner_id).values_list("id", flat=True))
+        if vehicle_id is not None:
+            vehicle_ids &= {vehicle_id}
+    elif vehicle_id is not None:
+        vehicle_ids = {vehicle_id}
+    if vehicle_ids == set():
+        return
+
+    rows = archived_bookings_by_start(start, end, vehicle_ids)
+    while batch := list(islice(rows, batch_size)):
+        owners = dict(
+            Vehicle.objects.filter(id__in={row["vehicle_id"] for row in batch}).values_list("id", "user_id")
+        )
+        for row in batch:
+            yield (
+                row["id"], row["user_id"], row["vehicle_id"], owners.get(row["vehicle_id"]), row["start_date"],
+                row["end_date"], row["status"], row["created_at"], row["updated_at"],
+            )
+
+
+class ExportStats:
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+    @property
+    def seconds(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.rows} rows, {self.bytes / 1_000_000:.1f} MB in {self.seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def _formatted(row):
+    return [format_date(value) if index in _DATE_COLUMNS else value for index, value in enumerate(row)]
+
+
+def _ndjson(rows):
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, _formatted(row))), separators=(",", ":")) + "\n" for row in rows
+    )
+
+
+def _csv(rows, header=False):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows(_formatted(row) for row in rows)
+    return buffer.getvalue()
+
+
+def export_bookings(queryset, export_format, chunk_size, compress=False, stats=None, archived=None):
+    """Yield the rows of ``export_queryset`` encoded as bytes, one chunk at a time.
+
+    Rows are read through Django's named server-side cursor. The transaction
+    makes it a plain (non-holdable) cursor, so Postgres streams the rows
+    instead of materializing the whole result when the query ends.
+    ``archived`` rows (see :func:`export_archived`) are merged in by start
+    date, as if they were still in the table.
+    """
+    stats = stats or ExportStats()
+    compressor = zlib.compressobj(6, zlib.DEFLATED, _GZIP_WBITS) if compress else None
+
+    def emit(text):
+        data = text.encode()
+        if compressor:
+            data = compressor.compress(data)
+        stats.bytes += len(data)
+        return data
+
+    with transaction.atomic():
+        rows = queryset.iterator(chunk_size=chunk_size)
+        if archived is not None:
+            rows = heapq.merge(rows, archived, key=itemgetter(4, 0))
+        header = export_format == "csv"
+        while (batch := list(islice(rows, chunk_size))) or header:
+            stats.rows += len(batch)
+            data = emit(_ndjson(batch) if export_format == "ndjson" else _csv(batch, header=header))
+            header = False
+            if data:
+                yield data
+
+    if compressor:
+        data = compressor.flush()
+        stats.bytes += len(data)
+        yield data
+    stats.finished = time.monotonic()
@@ -0,0 +1,66 @@
+"""Moves bookings through their lifecycle once their period is over.
+
+``complete_expired_bookings`` flips active bookings whose ``end_date`` has
+passed to completed, a batch per short transaction. Batches walk the
+partial ``bookings_active_end_idx`` index in ``(end_date, id)`` order and
+lock with ``SKIP LOCKED``, so rows a request is updating are left for the
+next sweep instead of blocking it, and several sweepers can run at once.
+The redundant ``start_date`` bounds keep future partitions out of the plan
+and let the update find each row by its full primary key.
+Calendar bits are left alone: the hours were booked and are in the past.
+"""
+import time
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from constants.common_status import CommonStatus
+
+COMPLETE_BATCH_SQL = """
+    WITH expired AS (
+        SELECT id, start_date FROM bookings
+        WHERE status = %(active)s AND end_date < %(now)s AND start_date < %(now)s {after}
+        ORDER BY end_date, id
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE bookings SET status = %(completed)s, updated_at = %(now)s
+    FROM expired WHERE bookings.id = expired.id AND bookings.start_date = expired.start_date
+    RETURNING bookings.end_date, bookings.id
+"""
+
+
+def complete_batch(now, after, batch_size):
+    """Complete up to ``batch_size`` expired bookings past the ``(end_date, id)`` key ``after``."""
+    params = {
+        "active": CommonStatus.ACTIVE.value,
+        "completed": CommonStatus.COMPLETED.value,
+        "now": now,
+        "limit": batch_size,
+    }
+    after_clause = ""
+    if after is not None:
+        after_clause = "AND (end_date, id) > (%(after_end)s, %(after_id)s)"
+        params["after_end"], params["after_id"] = after
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(COMPLETE_BATCH_SQL.format(after=after_clause), params)
+        return cursor.fetchall()
+
+
+def complete_expired_bookings(batch_size=1000, now=None, pause=0.0):
+    """Complete every active booking that ended before ``now``; returns how many were updated.
+
+    ``now`` is fixed up front so the sweep ends even while new bookings
+    expire, and ``pause`` seconds between batches leaves room for traffic.
+    """
+    now = now or timezone.now()
+    completed = 0
+    after = None
+    while True:
+        rows = complete_batch(now, after, batch_size)
+        completed += len(rows)
+        if len(rows) < batch_size:
+            return completed
+        after = max(rows)
+        if pause:
+            time.sleep(pause)
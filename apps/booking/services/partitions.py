@@ -0,0 +1,160 @@
+"""Monthly range partitions of ``bookings`` on ``start_date``.
+
+Each calendar month (UTC) lives in its own ``bookings_pYYYY_MM`` partition,
+so vacuum and index maintenance stay proportional to one month of rows and
+queries bounded on ``start_date`` only touch the months they can match.
+Rows outside every monthly partition land in ``bookings_default``.
+
+``ensure_partitions`` creates the partitions ahead of time, moving rows out
+of the default partition when a month already has some there.
+``detach_partitions`` takes old months out of ``bookings``; a detached
+partition stays behind as a plain table to archive or drop.
+"""
+import re
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from constants.common_status import CommonStatus
+
+PARENT_TABLE = "bookings"
+DEFAULT_PARTITION = "bookings_default"
+PARTITION_NAME = re.compile(r"^bookings_p(\d{4})_(\d{2})$")
+# Every column but the generated ``period``, which Postgres recomputes.
+PARTITION_COLUMNS = "id, user_id, vehicle_id, start_date, end_date, status, created_at, updated_at"
+LIVE_STATUSES = (CommonStatus.PENDING.value, CommonStatus.ACTIVE.value)
+
+
+def month_start(value):
+    """First day of the (UTC) month ``value`` falls in."""
+    if isinstance(value, datetime) and value.tzinfo:
+        value = value.astimezone(dt_timezone.utc)
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"bookings_p{month:%Y_%m}"
+
+
+def month_bounds(month):
+    """``[lower, upper)`` of ``month`` as UTC datetimes."""
+    lower = datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc)
+    upper = add_months(month, 1)
+    return lower, datetime(upper.year, upper.month, 1, tzinfo=dt_timezone.utc)
+
+
+def parent_table(relation):
+    """The table a ``bookings`` partition belongs to; other names are returned unchanged."""
+    if relation == DEFAULT_PARTITION or PARTITION_NAME.match(relation):
+        return PARENT_TABLE
+    return relation
+
+
+def plan_nodes(plan):
+    """Every node of an ``EXPLAIN (FORMAT JSON)`` plan."""
+    nodes = [plan]
+    while nodes:
+        node = nodes.pop()
+        yield node
+        nodes.extend(node.get("Plans", []))
+
+
+def scanned_partitions(plan, table=PARENT_TABLE):
+    """Names of the partitions of ``table`` the plan reads, after pruning."""
+    return {
+        node["Relation Name"] for node in plan_nodes(plan)
+        if "Relation Name" in node and node["Relation Name"] != table and parent_table(node["Relation Name"]) == table
+    }
+
+
+def attached_partitions(cursor):
+    """Names of the partitions currently attached to ``bookings``."""
+    cursor.execute(
+        "SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = %s::regclass ORDER BY 1",
+        [PARENT_TABLE],
+    )
+    return [name for name, in cursor.fetchall()]
+
+
+def partition_month(name):
+    match = PARTITION_NAME.match(name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def create_partition(cursor, month):
+    """Create and attach the partition for ``month``.
+
+    Rows of that month already sitting in the default partition would make a
+    plain ``PARTITION OF`` fail, so they are moved over with the default
+    partition detached. Callers run this inside a transaction.
+    """
+    name = partition_name(month)
+    lower, upper = month_bounds(month)
+    in_month = "start_date >= %s AND start_date < %s"
+    stranded = False
+    if DEFAULT_PARTITION in attached_partitions(cursor):
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_month})", [lower, upper])
+        stranded = cursor.fetchone()[0]
+
+    if stranded:
+        cursor.execute(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}")
+    cursor.execute(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} FOR VALUES FROM (%s) TO (%s)", [lower, upper])
+    if stranded:
+        cursor.execute(
+            f"INSERT INTO {name} ({PARTITION_COLUMNS}) SELECT {PARTITION_COLUMNS} FROM {DEFAULT_PARTITION} "
+            f"WHERE {in_month}",
+            [lower, upper],
+        )
+        cursor.execute(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_month}", [lower, upper])
+        cursor.execute(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    return name
+
+
+def ensure_partitions(first, last):
+    """Create the missing partitions for the months from ``first`` to ``last``; returns their names."""
+    month, last = month_start(first), month_start(last)
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        attached = set(attached_partitions(cursor))
+        while month <= last:
+            if partition_name(month) not in attached:
+                created.append(create_partition(cursor, month))
+            month = add_months(month, 1)
+    return created
+
+
+def ensure_future_partitions(months_ahead, now=None):
+    """Create the partitions from this month to ``months_ahead`` months out."""
+    current = month_start(now or timezone.now())
+    return ensure_partitions(current, add_months(current, months_ahead))
+
+
+def detach_partitions(before, drop=False):
+    """Detach the monthly partitions older than the month of ``before``.
+
+    Partitions still holding pending or active bookings stay attached.
+    Returns ``(detached, kept)`` partition names; with ``drop`` the detached
+    tables are dropped as well.
+    """
+    cutoff = month_start(before)
+    detached, kept = [], []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for name in attached_partitions(cursor):
+            month = partition_month(name)
+            if month is None or month >= cutoff:
+                continue
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {name} WHERE status = ANY(%s))", [list(LIVE_STATUSES)])
+            if cursor.fetchone()[0]:
+                kept.append(name)
+                continue
+            cursor.execute(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}")
+            if drop:
+                cursor.execute(f"DROP TABLE {name}")
+            detached.append(name)
+    return detached, kept
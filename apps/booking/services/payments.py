@@ -0,0 +1,13 @@
+"""Stripe checkout for bookings.
+
+The Stripe SDK takes about a second to import, so it is loaded on first use
+instead of when the booking views are imported at worker boot.
+"""
+from functools import cache
+
+
+@cache
+def stripe_sdk():
+    import stripe
+
+    return stripe
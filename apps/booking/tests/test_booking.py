@@ -3,7 +3,8 @@ from rest_framework.test import APIClient
 from apps.user.models import User
 from apps.vehicle.models import Vehicle
 from apps.booking.models import Booking
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from tests.streaming import get_streamed
 
 @pytest.fixture
 def user():
@@ -19,8 +20,8 @@ def user():
 @pytest.fixture
 def auth_client(user):
     client = APIClient()
-    from apps.user.serializers.user_serializer import UserSerializer
-    access_token = UserSerializer(user).data.get("access_token")
+    from apps.user.services.token_service import issue_tokens
+    access_token = issue_tokens(user)["access_token"]
     client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
     return client
 
@@ -117,3 +118,414 @@ def test_get_user_bookings(auth_client, user, vehicle, booking_url):
     assert data["code"] == 200
     assert data["message"] == "Bookings retrieved successfully"
     assert any(b["vehicle_id"] == vehicle.id for b in data["data"])
+
+@pytest.mark.django_db
+def test_create_booking_overlap_rejected_by_constraint(user, vehicle):
+    from apps.booking.serializers.booking_serializer import BookingSerializer
+    from utils.error_handler import CustomAPIException
+    start = datetime.now() + timedelta(days=1)
+    end = datetime.now() + timedelta(days=2)
+    Booking.objects.create(user=user, vehicle=vehicle, start_date=start, end_date=end, status=1)
+    # Simulates a concurrent request that passed the view's availability check.
+    serializer = BookingSerializer(data={
+        "user": user.id,
+        "vehicle": vehicle.id,
+        "start_date": start + timedelta(hours=6),
+        "end_date": end + timedelta(hours=6),
+    })
+    assert serializer.is_valid()
+    with pytest.raises(CustomAPIException, match="Vehicle is already booked"):
+        serializer.save()
+    assert Booking.objects.filter(vehicle=vehicle).count() == 1
+
+@pytest.mark.django_db
+def test_get_user_bookings_cursor_pagination(auth_client, user, vehicle, booking_url):
+    for day in range(3):
+        Booking.objects.create(
+            user=user,
+            vehicle=vehicle,
+            start_date=datetime.now() + timedelta(days=day * 2 + 1),
+            end_date=datetime.now() + timedelta(days=day * 2 + 2),
+            status=1
+        )
+    expected = list(Booking.objects.filter(user=user).order_by("-created_at", "-id").values_list("id", flat=True))
+    seen = []
+    cursor = None
+    while True:
+        params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+        data = auth_client.get(booking_url, params).data["success"]
+        seen += [b["id"] for b in data["data"]]
+        cursor = data["next"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+@pytest.mark.django_db
+def test_batch_booking_all_or_nothing(auth_client, user, vehicle, booking_url):
+    start = datetime.now() + timedelta(days=1)
+    end = datetime.now() + timedelta(days=2)
+    Booking.objects.create(user=user, vehicle=vehicle, start_date=start, end_date=end, status=1)
+    other = Vehicle.objects.create(user=user, make="Honda", model="Fit", year=2021, plate="BATCH1")
+    payload = {"bookings": [
+        {"vehicle_id": other.id, "start_date": start.strftime("%Y-%m-%d %H:%M"), "end_date": end.strftime("%Y-%m-%d %H:%M")},
+        {"vehicle_id": vehicle.id, "start_date": start.strftime("%Y-%m-%d %H:%M"), "end_date": end.strftime("%Y-%m-%d %H:%M")},
+    ]}
+    response = auth_client.post(f"{booking_url}/batch", payload, format="json")
+    data = response.data["error"]
+    assert data["code"] == 400
+    assert "Vehicle is already booked" in data["data"][1]["message"]
+    assert not Booking.objects.filter(vehicle=other).exists()
+
+@pytest.mark.django_db
+def test_batch_booking_partial(auth_client, user, vehicle, booking_url):
+    other = Vehicle.objects.create(user=user, make="Honda", model="Fit", year=2021, plate="BATCH2")
+    start = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M")
+    end = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d %H:%M")
+    payload = {"all_or_nothing": False, "bookings": [
+        {"vehicle_id": vehicle.id, "start_date": start, "end_date": end},
+        {"vehicle_id": other.id, "start_date": start, "end_date": end},
+        {"vehicle_id": vehicle.id, "start_date": start, "end_date": end},
+    ]}
+    response = auth_client.post(f"{booking_url}/batch", payload, format="json")
+    data = response.data["success"]
+    assert data["code"] == 201
+    assert [item["created"] for item in data["data"]] == [True, True, False]
+    assert "another item in this batch" in data["data"][2]["message"]
+    assert Booking.objects.filter(user=user).count() == 2
+
+@pytest.mark.django_db
+def test_batch_booking_all_or_nothing_flag_parsing(auth_client, user, vehicle, booking_url):
+    start = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M")
+    end = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d %H:%M")
+    bookings = [{"vehicle_id": vehicle.id, "start_date": start, "end_date": end}, {"vehicle_id": 0}]
+    response = auth_client.post(f"{booking_url}/batch", {"all_or_nothing": "false", "bookings": bookings}, format="json")
+    assert [item["created"] for item in response.data["success"]["data"]] == [True, False]
+
+    response = auth_client.post(f"{booking_url}/batch", {"all_or_nothing": "maybe", "bookings": bookings}, format="json")
+    data = response.data["error"]
+    assert data["code"] == 400
+    assert data["message"] == "All or nothing must be a boolean"
+    assert Booking.objects.filter(user=user).count() == 1
+
+@pytest.mark.django_db
+def test_async_booking_view(user, vehicle, booking_url):
+    import json
+    from asgiref.sync import async_to_sync
+    from django.test import RequestFactory
+    from apps.booking.views.async_booking_view import AsyncBookingView
+    from apps.user.services.token_service import issue_tokens
+
+    view = AsyncBookingView.as_view()
+    factory = RequestFactory(HTTP_AUTHORIZATION=f"Bearer {issue_tokens(user)['access_token']}")
+    start = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M")
+    end = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d %H:%M")
+    payload = {"vehicle_id": vehicle.id, "start_date": start, "end_date": end}
+
+    response = async_to_sync(view)(factory.post(booking_url, payload, content_type="application/json"))
+    data = json.loads(response.content)["success"]
+    assert data["code"] == 201
+    assert data["data"]["vehicle_id"] == vehicle.id
+
+    response = async_to_sync(view)(factory.post(booking_url, payload, content_type="application/json"))
+    assert json.loads(response.content)["error"]["message"] == "Vehicle is already booked for the selected dates."
+
+    data = json.loads(async_to_sync(view)(factory.get(booking_url)).content)["success"]
+    assert [booking["id"] for booking in data["data"]] == [Booking.objects.get().id]
+    assert data["next"] is None
+
+    response = async_to_sync(view)(RequestFactory().get(booking_url))
+    assert json.loads(response.content)["error"] == {"code": 401, "data": None, "message": "Unauthenticated"}
+
+@pytest.mark.django_db
+def test_booking_list_serializer_matches_instance_output(user, vehicle):
+    from rest_framework.renderers import JSONRenderer
+    from apps.booking.serializers.booking_serializer import BookingSerializer
+    from utils.common import get_date
+
+    start = datetime.now().astimezone() + timedelta(days=1, microseconds=123)
+    for day in range(3):
+        Booking.objects.create(user=user, vehicle=vehicle, start_date=start + timedelta(days=day * 2),
+                               end_date=start + timedelta(days=day * 2 + 1), status=1)
+    bookings = Booking.objects.order_by("id")
+
+    rows = BookingSerializer(bookings, many=True).data
+    instances = [BookingSerializer(booking).data for booking in bookings]
+    assert JSONRenderer().render(rows) == JSONRenderer().render(instances)
+    assert [row["start_date"] for row in rows] == [get_date(booking.start_date) for booking in bookings]
+
+@pytest.mark.django_db
+def test_get_user_bookings_streamed(auth_client, user, vehicle, booking_url, settings):
+    import json
+    from asgiref.sync import async_to_sync
+    from django.test import RequestFactory
+    from apps.booking.views.async_booking_view import AsyncBookingView
+    from apps.user.services.token_service import issue_tokens
+
+    assert auth_client.get(booking_url, {"stream": 1}).data["success"]["code"] == 404
+
+    settings.BOOKING_STREAM_CHUNK_SIZE = 2
+    start = datetime.now().astimezone() + timedelta(days=1)
+    for day in range(5):
+        Booking.objects.create(user=user, vehicle=vehicle, start_date=start + timedelta(days=day * 2),
+                               end_date=start + timedelta(days=day * 2 + 1), status=1)
+
+    paged = auth_client.get(booking_url, {"page_size": 10})
+    expected = {"success": {key: value for key, value in json.loads(paged.content)["success"].items() if key != "next"}}
+
+    response, body = get_streamed(user, booking_url, {"stream": 1})
+    assert response.streaming
+    assert json.loads(body) == expected
+
+    _, body = get_streamed(user, booking_url, headers={"Accept": "application/stream+json"})
+    assert json.loads(body) == expected
+
+    request = RequestFactory(HTTP_AUTHORIZATION=f"Bearer {issue_tokens(user)['access_token']}").get(booking_url, {"stream": 1})
+
+    async def read():
+        response = await AsyncBookingView.as_view()(request)
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert json.loads(async_to_sync(read)()) == expected
+
+@pytest.mark.django_db
+def test_export_bookings(auth_client, user, vehicle, booking_url, tmp_path):
+    import csv
+    import gzip
+    import json
+    from asgiref.sync import async_to_sync
+    from django.core.management import call_command
+    from django.test import AsyncClient
+    from apps.user.services.token_service import issue_tokens
+
+    start = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+    bookings = [
+        Booking.objects.create(user=user, vehicle=vehicle, start_date=start + timedelta(days=day * 10),
+                               end_date=start + timedelta(days=day * 10 + 1), status=1)
+        for day in range(4)
+    ]
+    other_owner = User.objects.create(email="other@example.com", password="pytestpass123", first_name="Other",
+                                      last_name="Owner", phone="1234567890", status=1)
+    other_vehicle = Vehicle.objects.create(user=other_owner, make="Kia", model="Rio", year=2021, plate="OTHER1")
+    Booking.objects.create(user=user, vehicle=other_vehicle, start_date=start, end_date=start + timedelta(days=1),
+                           status=1)
+
+    response = auth_client.get(f"{booking_url}/export", {"from": "2026-03-01", "to": "2026-03-31"})
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+    assert [row["id"] for row in rows] == [booking.id for booking in bookings[:3]]
+    assert rows[0]["owner_id"] == user.id
+    assert rows[0]["start_date"] == "2026-03-01 15:00:00"
+
+    async def read_over_asgi():
+        response = await AsyncClient().get(f"{booking_url}/export", {"from": "2026-03-01", "to": "2026-03-31"},
+                                           headers={"Authorization": f"Bearer {issue_tokens(user)['access_token']}"})
+        return response.is_async, b"".join([chunk async for chunk in response])
+
+    # Under ASGI the export is an async stream, which Django does not buffer.
+    is_async, body = async_to_sync(read_over_asgi)()
+    assert is_async
+    assert [json.loads(line)["id"] for line in body.splitlines()] == [booking.id for booking in bookings[:3]]
+
+    response = auth_client.get(f"{booking_url}/export", {"from": "2026-03-01", "to": "2026-04-01", "format": "csv",
+                                                          "gzip": 1})
+    assert response["Content-Disposition"] == 'attachment; filename="bookings-2026-03-01-2026-04-01.csv.gz"'
+    rows = list(csv.DictReader(gzip.decompress(b"".join(response.streaming_content)).decode().splitlines()))
+    assert [int(row["id"]) for row in rows] == [booking.id for booking in bookings]
+
+    response = auth_client.get(f"{booking_url}/export", {"from": "2026-03-01", "to": "2026-03-01"})
+    assert response.data["error"]["message"] == "From date must be before to date"
+
+    params = {"from": "2026-03-01", "to": "2026-04-01", "format": "csv"}
+    response = auth_client.get(f"{booking_url}/export", params, HTTP_ACCEPT="text/csv")
+    assert response["Content-Type"] == "text/csv"
+    response = auth_client.get(f"{booking_url}/export", {"from": "2026-03-01", "to": "2026-04-01"},
+                               HTTP_ACCEPT="application/xml")
+    assert response.data["error"]["code"] == 406
+
+    output = tmp_path / "bookings.ndjson.gz"
+    call_command("export_bookings", "--from", "2026-03-01", "--to", "2026-04-01", "--owner", str(other_owner.id),
+                 "--gzip", "--output", str(output), "--chunk-size", "1")
+    rows = [json.loads(line) for line in gzip.decompress(output.read_bytes()).splitlines()]
+    assert [row["vehicle_id"] for row in rows] == [other_vehicle.id]
+
+@pytest.mark.django_db
+def test_complete_expired_bookings(auth_client, user, vehicle):
+    from django.core.management import call_command
+    from apps.booking.services.lifecycle import complete_expired_bookings
+
+    now = datetime.now(timezone.utc)
+    expired = [
+        Booking.objects.create(user=user, vehicle=vehicle, start_date=now - timedelta(days=day * 2 + 2),
+                               end_date=now - timedelta(days=day * 2 + 1), status=1)
+        for day in range(5)
+    ]
+    cancelled = Booking.objects.create(user=user, vehicle=vehicle, start_date=now - timedelta(days=20),
+                                       end_date=now - timedelta(days=19), status=2)
+
+    assert auth_client.delete(f"/api/v1/vehicle/{vehicle.id}").data["success"]["code"] == 400
+    assert complete_expired_bookings(batch_size=2) == 5
+    assert set(Booking.objects.filter(id__in=[booking.id for booking in expired]).values_list("status", flat=True)) == {3}
+    cancelled.refresh_from_db()
+    assert cancelled.status == 2
+
+    upcoming = Booking.objects.create(user=user, vehicle=vehicle, start_date=now + timedelta(days=1),
+                                      end_date=now + timedelta(days=2), status=1)
+    call_command("complete_bookings")
+    upcoming.refresh_from_db()
+    assert upcoming.status == 1
+    upcoming.delete()
+    assert auth_client.delete(f"/api/v1/vehicle/{vehicle.id}").data["success"]["code"] == 200
+
+@pytest.mark.django_db
+def test_partition_bookings(user, vehicle):
+    from django.core.management import call_command
+    from django.db import IntegrityError, connection, transaction
+    from apps.booking.services.availability import is_overlap_violation
+    from apps.booking.services.partitions import (
+        add_months, attached_partitions, detach_partitions, ensure_partitions, month_bounds, month_start,
+        partition_name,
+    )
+
+    def partition_of(booking):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT tableoid::regclass::text FROM bookings WHERE id = %s", [booking.id])
+            return cursor.fetchone()[0]
+
+    current = month_start(datetime.now(timezone.utc))
+    boundary, _ = month_bounds(add_months(current, 8))
+    spanning = Booking.objects.create(user=user, vehicle=vehicle, start_date=boundary - timedelta(hours=2),
+                                      end_date=boundary + timedelta(hours=2), status=1)
+    assert partition_of(spanning) == "bookings_default"
+
+    call_command("partition_bookings", "--months-ahead", "8")
+    assert partition_of(spanning) == partition_name(add_months(current, 7))
+    # The overlap check still spans partitions.
+    with pytest.raises(IntegrityError) as error, transaction.atomic():
+        Booking.objects.create(user=user, vehicle=vehicle, start_date=boundary + timedelta(hours=1),
+                               end_date=boundary + timedelta(hours=3), status=1)
+    assert is_overlap_violation(error.value)
+
+    old = add_months(current, -30)
+    ensure_partitions(old, add_months(old, 1))
+    completed = Booking.objects.create(user=user, vehicle=vehicle, start_date=month_bounds(old)[0],
+                                       end_date=month_bounds(old)[0] + timedelta(days=1), status=3)
+    Booking.objects.create(user=user, vehicle=vehicle, start_date=month_bounds(add_months(old, 1))[0],
+                           end_date=month_bounds(add_months(old, 1))[0] + timedelta(days=1), status=1)
+    detached, kept = detach_partitions(add_months(current, -24))
+    assert (detached, kept) == ([partition_name(old)], [partition_name(add_months(old, 1))])
+    assert not Booking.objects.filter(id=completed.id).exists()
+    with connection.cursor() as cursor:
+        assert partition_name(old) not in attached_partitions(cursor)
+        cursor.execute(f"SELECT id FROM {partition_name(old)}")
+        assert cursor.fetchall() == [(completed.id,)]
+
+@pytest.mark.django_db
+def test_archive_bookings(auth_client, user, vehicle, booking_url, settings, tmp_path):
+    from asgiref.sync import async_to_sync
+    from django.core.management import call_command
+    from django.test import RequestFactory
+    from apps.booking.services.archive import archived_bookings, archived_vehicle_bookings, open_archive
+    from apps.booking.views.async_booking_view import AsyncBookingView
+    from django.core.management.base import CommandError
+    from apps.user.services.token_service import issue_tokens
+
+    settings.BOOKING_ARCHIVE_DIR = ""
+    with pytest.raises(CommandError, match="BOOKING_ARCHIVE_DIR"):
+        call_command("archive_bookings")
+    settings.BOOKING_ARCHIVE_DIR = str(tmp_path)
+    other = Vehicle.objects.create(user=user, make="Kia", model="Rio", year=2021, plate="ARCH123")
+    start = datetime(2024, 3, 1, 9, tzinfo=timezone.utc)
+    old = [
+        Booking.objects.create(user=user, vehicle=(vehicle, other)[day % 2], start_date=start + timedelta(days=day),
+                               end_date=start + timedelta(days=day, hours=3), status=3)
+        for day in range(40)
+    ]
+    kept = Booking.objects.create(user=user, vehicle=vehicle, start_date=start + timedelta(days=5, hours=4),
+                                  end_date=start + timedelta(days=5, hours=6), status=2)
+    now = datetime.now(timezone.utc)
+    Booking.objects.create(user=user, vehicle=vehicle, start_date=now - timedelta(days=3),
+                           end_date=now - timedelta(days=2), status=3)
+
+    def pages():
+        seen, cursor = [], None
+        while True:
+            params = {"from": "2024-03-10", "page_size": 7, **({"cursor": cursor} if cursor else {})}
+            data = auth_client.get(booking_url, params).data["success"]
+            seen.append(data["data"])
+            cursor = data["next"]
+            if cursor is None:
+                return seen
+
+    def streamed():
+        return get_streamed(user, booking_url, {"from": "2024-03-01", "stream": 1})[1]
+
+    def listed():
+        return auth_client.get(booking_url, {"page_size": 100}).data["success"]["data"]
+
+    def exported():
+        api = auth_client.get(f"{booking_url}/export", {"from": "2024-03-01", "to": "2024-05-01", "format": "csv"})
+        command = tmp_path.parent / f"{tmp_path.name}.ndjson"
+        call_command("export_bookings", "--from", "2024-03-01", "--to", "2024-05-01", "--vehicle", str(other.id),
+                     "--output", str(command), "--chunk-size", "3")
+        return b"".join(api.streaming_content), command.read_bytes()
+
+    hot_pages, hot_stream, hot_list, hot_export = pages(), streamed(), listed(), exported()
+    call_command("archive_bookings", "--months", "6", "--chunk-rows", "8")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["bookings-2024-03-1.bka", "bookings-2024-04-1.bka"]
+    assert not Booking.objects.filter(id__in=[booking.id for booking in old]).exists()
+    assert Booking.objects.filter(id=kept.id).exists()
+
+    assert pages() == hot_pages
+    assert streamed() == hot_stream
+    assert listed() == hot_list
+    assert len(hot_list) == 42
+    assert exported() == hot_export
+    assert [body.count(b"\n") for body in hot_export] == [1 + 41, 20]
+    request = RequestFactory(HTTP_AUTHORIZATION=f"Bearer {issue_tokens(user)['access_token']}").get(
+        booking_url, {"from": "2024-03-01", "stream": 1}
+    )
+
+    async def read():
+        response = await AsyncBookingView.as_view()(request)
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert async_to_sync(read)() == hot_stream
+
+    # The footer narrows a vehicle lookup to its own chunks.
+    march = open_archive(tmp_path / "bookings-2024-03-1.bka")
+    assert len(march.candidate_chunks(vehicle_id=vehicle.id)) < len(march.chunks)
+    assert [row["id"] for row in archived_vehicle_bookings(other.id)] == [
+        booking.id for booking in old if booking.vehicle_id == other.id
+    ]
+    assert list(archived_bookings(user.id, datetime(2024, 5, 1).date())) == []
+
+@pytest.mark.django_db
+def test_archived_pages_decode_bounded_rows(auth_client, user, vehicle, booking_url, settings, tmp_path):
+    from unittest import mock
+    from django.core.management import call_command
+    from apps.booking.services.archive import ArchiveFile
+
+    settings.BOOKING_ARCHIVE_DIR = str(tmp_path)
+    start = datetime(2024, 3, 1, 9, tzinfo=timezone.utc)
+    old = Booking.objects.bulk_create([
+        Booking(user=user, vehicle=vehicle, start_date=start + timedelta(days=day),
+                end_date=start + timedelta(days=day, hours=3), status=3)
+        for day in range(60)
+    ])
+    call_command("archive_bookings", "--months", "6", "--chunk-rows", "8")
+    assert len(list(tmp_path.iterdir())) == 2
+
+    page_size, seen, cursor = 5, [], None
+    with mock.patch.object(ArchiveFile, "row", autospec=True, side_effect=ArchiveFile.row) as decoded:
+        while True:
+            decoded.reset_mock()
+            params = {"from": "2024-03-01", "page_size": page_size, **({"cursor": cursor} if cursor else {})}
+            data = auth_client.get(booking_url, params).data["success"]
+            # The page plus the extra row, and one row read ahead per other month file.
+            assert decoded.call_count <= page_size + 2
+            seen += [booking["id"] for booking in data["data"]]
+            cursor = data["next"]
+            if cursor is None:
+                break
+    assert sorted(seen) == sorted(booking.id for booking in old)
+    assert len(seen) == len(set(seen))
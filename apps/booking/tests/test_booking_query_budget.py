@@ -0,0 +1,158 @@
+import pytest
+from rest_framework.test import APIClient
+from apps.booking.models import Booking
+from apps.user.authentication import active_users
+from apps.user.services.token_service import issue_tokens
+from datetime import datetime, timedelta
+from tests.query_budget import assert_max_queries, assert_no_seq_scans, seed_dataset
+
+@pytest.fixture
+def dataset():
+    return seed_dataset()
+
+@pytest.fixture
+def user(dataset):
+    owners, _ = dataset
+    return owners[0]
+
+@pytest.fixture
+def auth_client(user):
+    client = APIClient()
+    access_token = issue_tokens(user)["access_token"]
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    # Budgets are per request once the user's active flag is cached.
+    active_users.is_active(user.id)
+    return client
+
+@pytest.fixture
+def booking_url():
+    return "/api/v1/booking"
+
+def booking_payload(vehicle, days_ahead):
+    start = datetime.now() + timedelta(days=days_ahead)
+    return {
+        "vehicle_id": vehicle.id,
+        "start_date": start.strftime("%Y-%m-%d %H:%M"),
+        "end_date": (start + timedelta(hours=5)).strftime("%Y-%m-%d %H:%M"),
+    }
+
+@pytest.mark.django_db
+def test_create_booking_query_budget(auth_client, dataset, booking_url):
+    _, vehicles = dataset
+    with assert_max_queries(8) as queries:
+        response = auth_client.post(booking_url, booking_payload(vehicles[5], 60), format="json")
+    assert response.data["success"]["code"] == 201
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_create_booking_conflict_query_budget(auth_client, dataset, booking_url):
+    _, vehicles = dataset
+    auth_client.post(booking_url, booking_payload(vehicles[5], 60), format="json")
+    with assert_max_queries(2) as queries:
+        response = auth_client.post(booking_url, booking_payload(vehicles[5], 60), format="json")
+    assert response.data["error"]["code"] == 400
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_list_bookings_query_budget(auth_client, user, booking_url):
+    assert Booking.objects.filter(user=user).count() > 50
+    with assert_max_queries(1) as queries:
+        response = auth_client.get(booking_url, {"from": "2000-01-01"})
+    data = response.data["success"]
+    assert len(data["data"]) == 50
+    with assert_max_queries(1):
+        auth_client.get(booking_url, {"cursor": data["next"]})
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_batch_booking_query_budget(auth_client, dataset, booking_url):
+    _, vehicles = dataset
+    payload = {"bookings": [booking_payload(vehicle, 60) for vehicle in vehicles[:20]]}
+    with assert_max_queries(6) as queries:
+        response = auth_client.post(f"{booking_url}/batch", payload, format="json")
+    assert response.data["success"]["code"] == 201
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_export_bookings_query_budget(auth_client, user, booking_url):
+    start_day = (datetime.now() - timedelta(days=40)).strftime("%Y-%m-%d")
+    end_day = (datetime.now() + timedelta(days=40)).strftime("%Y-%m-%d")
+    # The cursor's SELECT plus the savepoint that keeps it non-holdable.
+    with assert_max_queries(3) as queries:
+        response = auth_client.get(f"{booking_url}/export", {"from": start_day, "to": end_day})
+        lines = b"".join(response.streaming_content).splitlines()
+    assert len(lines) == Booking.objects.filter(vehicle__user=user).count()
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_query_inspector_flags_n_plus_one(user, settings):
+    from rest_framework import serializers
+    from utils.query_inspector import NPlusOneDetected, inspect_queries
+
+    class PlateSerializer(serializers.Serializer):
+        plate = serializers.SerializerMethodField()
+
+        def get_plate(self, booking):
+            return booking.vehicle.plate
+
+    settings.QUERY_INSPECTOR_RAISE = True
+    bookings = Booking.objects.filter(user=user)[:10]
+    with pytest.raises(NPlusOneDetected, match="via PlateSerializer"):
+        with inspect_queries("plates"):
+            PlateSerializer(bookings, many=True).data
+    with inspect_queries("plates") as inspection:
+        PlateSerializer(bookings.select_related("vehicle"), many=True).data
+    assert not inspection.n_plus_one
+
+@pytest.mark.django_db
+def test_booking_list_has_no_n_plus_one(user, booking_url, settings):
+    settings.QUERY_INSPECTOR = True
+    settings.QUERY_INSPECTOR_RAISE = True
+    settings.QUERY_INSPECTOR_REPEAT_THRESHOLD = 2
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {issue_tokens(user)['access_token']}")
+    response = client.get(booking_url, {"from": "2000-01-01"})
+    assert len(response.data["success"]["data"]) == 50
+
+@pytest.mark.django_db
+def test_complete_expired_bookings_uses_active_index(dataset):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from apps.booking.services.lifecycle import complete_expired_bookings
+    from tests.query_budget import explain, seq_scans
+
+    expired = Booking.objects.filter(status=1, end_date__lt=datetime.now().astimezone()).count()
+    with CaptureQueriesContext(connection) as queries:
+        assert complete_expired_bookings(batch_size=100) == expired
+    sweeps = [query["sql"] for query in queries.captured_queries if "SKIP LOCKED" in query["sql"]]
+    assert len(sweeps) == expired // 100 + 1
+    assert not seq_scans(explain(sweeps[-1]))
+
+@pytest.mark.django_db
+def test_partition_pruning(auth_client, dataset, booking_url):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from apps.booking.services.availability import is_vehicle_booked
+    from apps.booking.services.partitions import (
+        add_months, attached_partitions, ensure_future_partitions, month_start, partition_name, scanned_partitions,
+    )
+    from tests.query_budget import explain
+
+    _, vehicles = dataset
+    current = month_start(datetime.now().astimezone())
+    ensure_future_partitions(12)
+    with connection.cursor() as cursor:
+        partitions = set(attached_partitions(cursor))
+
+    with CaptureQueriesContext(connection) as queries:
+        auth_client.get(booking_url, {"from": add_months(current, 10).isoformat()})
+    listing = next(query["sql"] for query in queries.captured_queries if '"bookings"."start_date" >=' in query["sql"])
+    later = {partition_name(add_months(current, offset)) for offset in (10, 11, 12)}
+    assert scanned_partitions(explain(listing)) == later | {"bookings_default"}
+
+    start = datetime.now().astimezone() + timedelta(days=1)
+    with CaptureQueriesContext(connection) as queries:
+        is_vehicle_booked(vehicles[0].id, start, start + timedelta(hours=5))
+    scanned = scanned_partitions(explain(queries.captured_queries[0]["sql"]))
+    assert partition_name(add_months(current, 3)) not in scanned
+    assert len(scanned) <= 3 < len(partitions)
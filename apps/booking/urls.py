@@ -1,6 +1,18 @@
+from django.conf import settings
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+from apps.booking.views.async_booking_view import AsyncBookingView
+from apps.booking.views.booking_batch_view import BookingBatchView
+from apps.booking.views.booking_export_view import BookingExportView
 from apps.booking.views.booking_view import BookingView
 
+if settings.ASYNC_API_VIEWS:
+    booking_view = csrf_exempt(AsyncBookingView.as_view())
+else:
+    booking_view = BookingView.as_view()
+
 urlpatterns = [
-    path("booking", BookingView.as_view(), name="booking"),
+    path("booking", booking_view, name="booking"),
+    path("booking/batch", BookingBatchView.as_view(), name="booking_batch"),
+    path("booking/export", BookingExportView.as_view(), name="booking_export"),
 ]
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Async variant of BookingView for ASGI deployments (ASYNC_API_VIEWS=True).
+"""
+from datetime import datetime
+from functools import partial
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import status
+from apps.booking.models.booking import Booking
+from apps.booking.serializers.booking_serializer import BookingSerializer
+from apps.booking.services.archive import amerge_newest_first, archived_bookings
+from apps.booking.services.availability import BOOKING_CONFLICT_MESSAGE, ais_vehicle_booked, as_aware
+from apps.vehicle.models.vehicle import Vehicle
+from utils.async_views import AsyncAPIView
+from utils.custom_responses import PaginatedResponse, SuccessResponse
+from utils.error_handler import CustomAPIException
+from utils.pagination import apaginate_by_created_at
+from utils.streaming import EnvelopeStream, wants_stream
+
+
+class AsyncBookingView(AsyncAPIView):
+    async def post(self, request):
+        user = request.user
+        vehicle_id = request.data.get("vehicle_id")
+        start_date = request.data.get("start_date")
+        end_date = request.data.get("end_date")
+
+        if not vehicle_id:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Vehicle ID is required",
+            )
+
+        vehicle = await Vehicle.objects.filter(id=vehicle_id).afirst()
+        if not vehicle:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="Vehicle not found",
+            )
+
+        if not start_date or not end_date:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Start date and end date are required",
+            )
+
+        start_date = datetime.strptime(start_date, "%Y-%m-%d %H:%M")
+        end_date = datetime.strptime(end_date, "%Y-%m-%d %H:%M")
+
+        if start_date > end_date:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Start date cannot be after end date",
+            )
+
+        if start_date < datetime.now():
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Cannot book dates in the past",
+            )
+
+        if await ais_vehicle_booked(vehicle_id, start_date, end_date):
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=BOOKING_CONFLICT_MESSAGE,
+            )
+
+        # The insert and the calendar update share a transaction, which the
+        # async ORM cannot open, so this one step runs on the sync thread.
+        serializer = BookingSerializer()
+        booking = await sync_to_async(serializer.create)({
+            "user": user,
+            "vehicle": vehicle,
+            "start_date": as_aware(start_date),
+            "end_date": as_aware(end_date),
+        })
+        return SuccessResponse(
+            status_code=status.HTTP_201_CREATED,
+            data=serializer.to_representation(booking),
+            message="Booking created successfully",
+        )
+
+    async def get(self, request):
+        user = request.user
+        from_date = request.query_params.get("from")
+
+        user_bookings = Booking.objects.filter(user_id=user.id)
+        if from_date:
+            from_date = datetime.strptime(from_date, '%Y-%m-%d').date()
+            user_bookings = user_bookings.filter(start_date__gte=from_date)
+        # Completed bookings moved to the cold archive are merged back in;
+        # no file is opened when from_date is past the newest archived month.
+        archived = partial(archived_bookings, user.id, from_date)
+
+        if wants_stream(request):
+            return await self.stream(user_bookings, archived)
+
+        bookings, next_cursor = await apaginate_by_created_at(
+            user_bookings.values(*BookingSerializer.row_fields), request, extra_rows=archived
+        )
+        if not bookings:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="No bookings found for this user",
+            )
+
+        return PaginatedResponse(
+            status_code=status.HTTP_200_OK,
+            data=BookingSerializer(bookings, many=True).data,
+            next_cursor=next_cursor,
+            message="Bookings retrieved successfully",
+        )
+
+    async def stream(self, user_bookings, archived):
+        rows = (
+            user_bookings.order_by("-created_at", "-id")
+            .values(*BookingSerializer.row_fields)
+            .aiterator(chunk_size=settings.BOOKING_STREAM_CHUNK_SIZE)
+        )
+        rows = amerge_newest_first(rows, archived())
+        first = await anext(rows, None)
+        if first is None:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="No bookings found for this user",
+            )
+
+        async def all_rows():
+            yield first
+            async for row in rows:
+                yield row
+
+        stream = EnvelopeStream(
+            BookingSerializer.row_representation,
+            message="Bookings retrieved successfully",
+            chunk_size=settings.BOOKING_STREAM_CHUNK_SIZE,
+        )
+        return stream.response(stream.aiterate(all_rows()))
@@ -0,0 +1,180 @@
+from datetime import datetime
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import serializers, status
+from apps.booking.models.booking import Booking
+from apps.booking.serializers.booking_serializer import BookingSerializer
+from apps.booking.services.availability import (
+    BOOKING_CONFLICT_MESSAGE,
+    find_booked_periods,
+    is_overlap_violation,
+    periods_overlap,
+)
+from apps.booking.services.calendar import mark_booked
+from apps.vehicle.models.vehicle import Vehicle
+from constants.common_status import CommonStatus
+from utils.common import parse_date_time
+from utils.custom_responses import ErrorResponse, SuccessResponse
+from utils.error_handler import CustomAPIException
+from drf_spectacular.utils import extend_schema
+from .open_api_schemas import (
+    booking_batch_payload_schema,
+    booking_batch_success_example,
+    booking_batch_rejected_example,
+)
+
+
+class BookingBatchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Create bookings in batch",
+        description=(
+            "Create several bookings for the authenticated user in one request. With "
+            "`all_or_nothing` (default) a single invalid item rejects the whole batch; "
+            "otherwise valid items are created and per-item results are returned."
+        ),
+        request=booking_batch_payload_schema,
+        responses={
+            201: None,
+            400: None,
+        },
+        examples=[
+            booking_batch_success_example,
+            booking_batch_rejected_example,
+        ]
+    )
+    def post(self, request):
+        items = request.data.get("bookings")
+        try:
+            # Form and multipart bodies carry booleans as strings such as "false".
+            all_or_nothing = serializers.BooleanField().to_internal_value(request.data.get("all_or_nothing", True))
+        except serializers.ValidationError:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="All or nothing must be a boolean",
+            )
+
+        if not isinstance(items, list) or not items:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Bookings must be a non-empty list",
+            )
+        if len(items) > settings.BOOKING_BATCH_MAX_SIZE:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"A batch can contain at most {settings.BOOKING_BATCH_MAX_SIZE} bookings",
+            )
+
+        errors = {}
+        periods = {}
+        for index, item in enumerate(items):
+            error, period = self._parse_item(item)
+            if error:
+                errors[index] = error
+            else:
+                periods[index] = period
+
+        vehicle_ids = {vehicle_id for vehicle_id, _, _ in periods.values()}
+        existing_vehicle_ids = set(Vehicle.objects.filter(id__in=vehicle_ids).values_list("id", flat=True))
+        for index, (vehicle_id, _, _) in list(periods.items()):
+            if vehicle_id not in existing_vehicle_ids:
+                errors[index] = "Vehicle not found"
+                del periods[index]
+
+        indexes = list(periods)
+        for position in find_booked_periods([periods[index] for index in indexes]):
+            errors[indexes[position]] = BOOKING_CONFLICT_MESSAGE
+            del periods[indexes[position]]
+
+        # Earlier items win over later ones for the same vehicle.
+        accepted = {}
+        for index, (vehicle_id, start_date, end_date) in list(periods.items()):
+            taken = accepted.setdefault(vehicle_id, [])
+            if any(periods_overlap(start_date, end_date, other_start, other_end) for other_start, other_end in taken):
+                errors[index] = "Vehicle is booked by another item in this batch."
+                del periods[index]
+            else:
+                taken.append((start_date, end_date))
+
+        if errors and (all_or_nothing or not periods):
+            return ErrorResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                data=self._results(items, errors, {}),
+                message="Batch rejected, no bookings were created",
+            )
+
+        bookings = {
+            index: Booking(
+                user_id=request.user.id,
+                vehicle_id=vehicle_id,
+                start_date=start_date,
+                end_date=end_date,
+                status=CommonStatus.ACTIVE.value,
+            )
+            for index, (vehicle_id, start_date, end_date) in periods.items()
+        }
+        try:
+            with transaction.atomic():
+                Booking.objects.bulk_create(bookings.values())
+                mark_booked(bookings.values())
+        except IntegrityError as error:
+            if not is_overlap_violation(error):
+                raise
+            # A concurrent request took one of the slots after the conflict check.
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=BOOKING_CONFLICT_MESSAGE,
+            )
+
+        return SuccessResponse(
+            status_code=status.HTTP_201_CREATED,
+            data=self._results(items, errors, bookings),
+            message=f"{len(bookings)} of {len(items)} bookings created successfully",
+        )
+
+    def _parse_item(self, item):
+        if not isinstance(item, dict) or not item.get("vehicle_id"):
+            return "Vehicle ID is required", None
+
+        if not item.get("start_date") or not item.get("end_date"):
+            return "Start date and end date are required", None
+
+        start_date = parse_date_time(item["start_date"])
+        end_date = parse_date_time(item["end_date"])
+        if not start_date or not end_date:
+            return "Dates must be in YYYY-MM-DD HH:MM format", None
+
+        if start_date > end_date:
+            return "Start date cannot be after end date", None
+
+        if start_date < datetime.now():
+            return "Cannot book dates in the past", None
+
+        try:
+            vehicle_id = int(item["vehicle_id"])
+        except (TypeError, ValueError):
+            return "Vehicle ID must be a valid integer", None
+
+        return None, (vehicle_id, start_date, end_date)
+
+    def _results(self, items, errors, bookings):
+        results = []
+        for index in range(len(items)):
+            if index in bookings:
+                results.append({
+                    "index": index,
+                    "created": True,
+                    "booking": BookingSerializer(bookings[index]).data,
+                    "message": None,
+                })
+            else:
+                results.append({
+                    "index": index,
+                    "created": False,
+                    "booking": None,
+                    "message": errors.get(index, "Not created, batch rejected"),
+                })
+        return results
@@ -0,0 +1,129 @@
+import logging
+from datetime import datetime
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from apps.booking.services.export import (
+    EXPORT_FORMATS,
+    ExportStats,
+    export_archived,
+    export_bookings,
+    export_queryset,
+)
+from utils.error_handler import CustomAPIException
+from utils.streaming import StreamingNegotiation, streaming_body
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+
+
+class BookingExportView(APIView):
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = StreamingNegotiation
+    streamed_media_types = (*EXPORT_FORMATS.values(), "application/gzip")
+
+    @extend_schema(
+        summary="Export bookings",
+        description=(
+            "Stream every booking on the authenticated user's vehicles that starts in "
+            "[from, to) as NDJSON or CSV, optionally gzip-compressed. Meant for reporting "
+            "instead of walking the paginated booking list."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='from',
+                location=OpenApiParameter.QUERY,
+                description='First day of the range (YYYY-MM-DD, UTC)',
+                required=True,
+                type=str
+            ),
+            OpenApiParameter(
+                name='to',
+                location=OpenApiParameter.QUERY,
+                description='Day after the range (YYYY-MM-DD, UTC, exclusive)',
+                required=True,
+                type=str
+            ),
+            OpenApiParameter(
+                name='vehicle_id',
+                location=OpenApiParameter.QUERY,
+                description='Only export bookings for this vehicle',
+                required=False,
+                type=int
+            ),
+            OpenApiParameter(
+                name='format',
+                location=OpenApiParameter.QUERY,
+                description='`ndjson` (default) or `csv`',
+                required=False,
+                type=str
+            ),
+            OpenApiParameter(
+                name='gzip',
+                location=OpenApiParameter.QUERY,
+                description='Set to 1 to download a gzip-compressed file',
+                required=False,
+                type=int
+            ),
+        ],
+        responses={
+            200: None,
+            400: None,
+        },
+    )
+    def get(self, request):
+        start_day = self._parse_day(request.query_params.get("from"))
+        end_day = self._parse_day(request.query_params.get("to"))
+        if not start_day or not end_day:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="From and to dates are required in YYYY-MM-DD format",
+            )
+        if start_day >= end_day:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="From date must be before to date",
+            )
+
+        export_format = request.query_params.get("format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Format must be one of: " + ", ".join(EXPORT_FORMATS),
+            )
+
+        vehicle_id = request.query_params.get("vehicle_id")
+        if vehicle_id is not None and not vehicle_id.isdigit():
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Vehicle ID must be a valid integer",
+            )
+
+        compress = request.query_params.get("gzip") == "1"
+        filters = {"owner_id": request.user.id, "vehicle_id": int(vehicle_id) if vehicle_id else None}
+        queryset = export_queryset(start_day, end_day, **filters)
+        archived = export_archived(start_day, end_day, **filters)
+        stats = ExportStats()
+
+        def chunks():
+            yield from export_bookings(
+                queryset, export_format, settings.BOOKING_EXPORT_CHUNK_SIZE, compress=compress, stats=stats,
+                archived=archived,
+            )
+            logging.info("Booking export for user %s: %s", request.user.id, stats)
+
+        filename = f"bookings-{start_day}-{end_day}.{export_format}"
+        body = streaming_body(request, chunks())
+        if compress:
+            response = StreamingHttpResponse(body, content_type="application/gzip")
+            filename += ".gz"
+        else:
+            response = StreamingHttpResponse(body, content_type=EXPORT_FORMATS[export_format])
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def _parse_day(self, value):
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            return None
@@ -1,14 +1,19 @@
 from datetime import datetime
+from functools import partial
+from itertools import chain
+from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
-import stripe
 from apps.booking.models.booking import Booking
 from apps.booking.serializers.booking_serializer import BookingSerializer
+from apps.booking.services.archive import archived_bookings, merge_newest_first
+from apps.booking.services.availability import BOOKING_CONFLICT_MESSAGE, is_vehicle_booked
 from apps.vehicle.models.vehicle import Vehicle
-from constants.common_status import CommonStatus
-from utils.custom_responses import SuccessResponse
+from utils.custom_responses import PaginatedResponse, SuccessResponse
 from utils.error_handler import CustomAPIException
+from utils.pagination import paginate_by_created_at
+from utils.streaming import STREAM_MEDIA_TYPE, EnvelopeStream, StreamingNegotiation, wants_stream
 from datetime import datetime
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from .open_api_schemas import (
@@ -24,6 +29,8 @@ from .open_api_schemas import (
 
 class BookingView(APIView):
     permission_classes = [IsAuthenticated]
+    content_negotiation_class = StreamingNegotiation
+    streamed_media_types = (STREAM_MEDIA_TYPE,)
 
     @extend_schema(
         summary="Create a new booking",
@@ -82,17 +89,10 @@ class BookingView(APIView):
                 message="Cannot book dates in the past",
             )
 
-        conflicting_booking = Booking.objects.filter(
-            vehicle_id=vehicle_id,
-            status=CommonStatus.ACTIVE.value,
-            start_date__lte=end_date,
-            end_date__gte=start_date,
-        ).first()
-
-        if conflicting_booking:
+        if is_vehicle_booked(vehicle_id, start_date, end_date):
             raise CustomAPIException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                message=f"Vehicle is already booked for the selected dates.",
+                message=BOOKING_CONFLICT_MESSAGE,
             )
 
         payload = {"user": user.id, "vehicle": vehicle_id, **request.data}
@@ -109,14 +109,35 @@ class BookingView(APIView):
 
     @extend_schema(
         summary="Get user bookings",
-        description="Retrieve all bookings for the authenticated user, optionally filtered by from date",
+        description="Retrieve the authenticated user's bookings newest first, optionally filtered by from date, one cursor page at a time",
         parameters=[
             OpenApiParameter(
                 name='from',
                 location=OpenApiParameter.QUERY,
-                description='Filter bookings from this date (YYYY-MM-DD format)',
+                description='Filter bookings from this date (YYYY-MM-DD format); archived bookings in the range are included',
+                required=False,
+                type=str
+            ),
+            OpenApiParameter(
+                name='cursor',
+                location=OpenApiParameter.QUERY,
+                description='Opaque cursor returned as `next` by the previous page',
                 required=False,
                 type=str
+            ),
+            OpenApiParameter(
+                name='page_size',
+                location=OpenApiParameter.QUERY,
+                description='Number of bookings per page',
+                required=False,
+                type=int
+            ),
+            OpenApiParameter(
+                name='stream',
+                location=OpenApiParameter.QUERY,
+                description='Set to 1 (or send `Accept: application/stream+json`) to stream every matching booking in one response instead of a page',
+                required=False,
+                type=int
             )
         ],
         responses={
@@ -132,25 +153,31 @@ class BookingView(APIView):
         user = request.user
         from_date = request.query_params.get("from")
         
-        user_bookings = Booking.objects.none()
+        user_bookings = Booking.objects.filter(user_id=user.id)
         if from_date:
             from_date = datetime.strptime(from_date, '%Y-%m-%d').date()
-            user_bookings = Booking.objects.filter(
-                user=user, start_date__gte=from_date
-            ).order_by("-created_at")
-        else:
-            user_bookings = Booking.objects.filter(user=user).order_by("-created_at")
+            user_bookings = user_bookings.filter(start_date__gte=from_date)
+        # Completed bookings moved to the cold archive are merged back in;
+        # no file is opened when from_date is past the newest archived month.
+        archived = partial(archived_bookings, user.id, from_date)
+
+        if wants_stream(request):
+            return self.stream(user_bookings, archived)
 
-        if user_bookings.exists() == False:
+        bookings, next_cursor = paginate_by_created_at(
+            user_bookings.values(*BookingSerializer.row_fields), request, extra_rows=archived
+        )
+        if not bookings:
             return SuccessResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 data=None,
                 message="No bookings found for this user",
             )
         
-        serializer = BookingSerializer(user_bookings, many=True)
+        serializer = BookingSerializer(bookings, many=True)
+        # from apps.booking.services.payments import stripe_sdk
         # amount_payable = 20 * 2 #(rental rate * number of days)
-        # session = stripe.checkout.Session.create(
+        # session = stripe_sdk().checkout.Session.create(
         #         success_url="https://example.com/success",
         #         line_items=[
         #             {
@@ -164,8 +191,33 @@ class BookingView(APIView):
         #         metadata={"booking_id": serializer.data["id"], "user_id": user.id},
         #         mode="payment",
         #     )
-        return SuccessResponse(
+        return PaginatedResponse(
             status_code=status.HTTP_200_OK,
             data=serializer.data,
+            next_cursor=next_cursor,
+            message="Bookings retrieved successfully",
+        )
+
+    def stream(self, user_bookings, archived):
+        # A server-side cursor feeds the response chunk by chunk, so memory
+        # stays flat however long the history is.
+        rows = (
+            user_bookings.order_by("-created_at", "-id")
+            .values(*BookingSerializer.row_fields)
+            .iterator(chunk_size=settings.BOOKING_STREAM_CHUNK_SIZE)
+        )
+        rows = merge_newest_first(rows, archived())
+        first = next(rows, None)
+        if first is None:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="No bookings found for this user",
+            )
+
+        stream = EnvelopeStream(
+            BookingSerializer.row_representation,
             message="Bookings retrieved successfully",
+            chunk_size=settings.BOOKING_STREAM_CHUNK_SIZE,
         )
+        return stream.response(stream.iterate(chain([first], rows)))
@@ -90,6 +90,7 @@ booking_list_success_example = OpenApiExample(
                     "updated_at": "2024-01-01T00:00:00Z",
                 }
             ],
+            "next": "WyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwxXQ",
             "message": "Bookings retrieved successfully",
         }
     },
@@ -109,3 +110,69 @@ booking_list_not_found_example = OpenApiExample(
     response_only=True,
     status_codes=["404"],
 )
+
+# Booking batch examples
+booking_batch_payload_schema = {
+    "application/json": {
+        "type": "object",
+        "properties": {
+            "bookings": {
+                "type": "array",
+                "items": create_booking_payload_schema["application/json"],
+            },
+            "all_or_nothing": {"type": "boolean", "example": True},
+        },
+        "required": ["bookings"],
+    }
+}
+
+booking_batch_success_example = OpenApiExample(
+    "Success Response",
+    value={
+        "success": {
+            "code": 201,
+            "data": [
+                {
+                    "index": 0,
+                    "created": True,
+                    "booking": {
+                        "object": "booking",
+                        "id": 1,
+                        "user_id": 1,
+                        "vehicle_id": 1,
+                        "start_date": "2024-01-15 15:00:00",
+                        "end_date": "2024-01-16 15:00:00",
+                        "status": 1,
+                        "created_at": "2024-01-01 05:00:00",
+                        "updated_at": "2024-01-01 05:00:00",
+                    },
+                    "message": None,
+                }
+            ],
+            "message": "1 of 1 bookings created successfully",
+        }
+    },
+    response_only=True,
+    status_codes=["201"],
+)
+
+booking_batch_rejected_example = OpenApiExample(
+    "Batch Rejected",
+    value={
+        "error": {
+            "code": 400,
+            "data": [
+                {"index": 0, "created": False, "booking": None, "message": "Not created, batch rejected"},
+                {
+                    "index": 1,
+                    "created": False,
+                    "booking": None,
+                    "message": "Vehicle is already booked for the selected dates.",
+                },
+            ],
+            "message": "Batch rejected, no bookings were created",
+        }
+    },
+    response_only=True,
+    status_codes=["400"],
+)
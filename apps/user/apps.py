@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class UserConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.user'
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from apps.user.authentication import forget_user
+        from apps.user.models import User
+
+        post_save.connect(forget_user, sender=User, dispatch_uid="user-forget-on-save")
+        post_delete.connect(forget_user, sender=User, dispatch_uid="user-forget-on-delete")
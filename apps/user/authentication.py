@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.user.models import User
+from apps.user.tokens import USER_CLAIMS
+from constants.common_status import CommonStatus
+from utils.metrics import phase
+
+
+class UserCache:
+    """Per-process LRU of full ``User`` rows, revalidated after a short TTL."""
+
+    def __init__(self):
+        self._users = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry and now - entry[0] < settings.AUTH_USER_CACHE_TTL:
+                self._users.move_to_end(user_id)
+                return entry[1]
+
+        user = User.objects.filter(id=user_id).first()
+        with self._lock:
+            if user is None:
+                self._users.pop(user_id, None)
+                return None
+            self._users[user_id] = (now, user)
+            self._users.move_to_end(user_id)
+            while len(self._users) > settings.AUTH_USER_CACHE_SIZE:
+                self._users.popitem(last=False)
+        return user
+
+    def forget(self, user_id):
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+
+
+user_cache = UserCache()
+
+
+class ActiveUsers:
+    """Whether a user may still authenticate, kept in the shared cache.
+
+    Tokens outlive the user they were minted for, so every authenticated
+    request checks that the user still exists and is active. A miss costs one
+    indexed lookup. Saving or deleting the user drops the entry; bulk updates
+    that bypass signals are picked up within ``AUTH_ACTIVE_CACHE_TTL``.
+    """
+
+    def is_active(self, user_id):
+        active = cache.get(self._key(user_id))
+        if active is None:
+            active = self._query(user_id).exists()
+            cache.set(self._key(user_id), active, timeout=settings.AUTH_ACTIVE_CACHE_TTL)
+        return active
+
+    async def ais_active(self, user_id):
+        active = await cache.aget(self._key(user_id))
+        if active is None:
+            active = await self._query(user_id).aexists()
+            await cache.aset(self._key(user_id), active, timeout=settings.AUTH_ACTIVE_CACHE_TTL)
+        return active
+
+    def forget(self, user_id):
+        cache.delete(self._key(user_id))
+
+    def _query(self, user_id):
+        return User.objects.filter(id=user_id, status=CommonStatus.ACTIVE.value)
+
+    def _key(self, user_id):
+        return f"auth:active:{user_id}"
+
+
+active_users = ActiveUsers()
+
+
+def forget_user(sender, instance, **kwargs):
+    """Signal receiver dropping the cached state of a saved or deleted user."""
+    active_users.forget(instance.pk)
+    user_cache.forget(instance.pk)
+
+
+class ClaimsUser(TokenUser):
+    """User built from token claims that loads the ``User`` row only when a
+    view reads an attribute the token does not carry."""
+
+    @property
+    def status(self):
+        return self._claim("status")
+
+    @property
+    def email_verified(self):
+        return self._claim("email_verified")
+
+    @property
+    def phone_verified(self):
+        return self._claim("phone_verified")
+
+    def get_user(self):
+        if "_user" not in self.__dict__:
+            user = user_cache.get(self.id)
+            if user is None:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            self.__dict__["_user"] = user
+        return self.__dict__["_user"]
+
+    def _claim(self, claim):
+        # Tokens minted before the claims were added fall back to the row.
+        if claim in self.token:
+            return self.token[claim]
+        return getattr(self.get_user(), claim)
+
+    def __getattr__(self, attr):
+        if attr.startswith("_") or attr in USER_CLAIMS:
+            raise AttributeError(attr)
+        return getattr(self.get_user(), attr)
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    def authenticate(self, request):
+        with phase("auth"):
+            return super().authenticate(request)
+
+    async def aauthenticate(self, request):
+        """Async variant of :meth:`authenticate` for the async views."""
+        with phase("auth"):
+            header = self.get_header(request)
+            if header is None:
+                return None
+            raw_token = self.get_raw_token(header)
+            if raw_token is None:
+                return None
+            validated_token = self.get_validated_token(raw_token)
+            user = self.claims_user(validated_token)
+            if not await active_users.ais_active(user.id):
+                raise self.inactive()
+            return user, validated_token
+
+    def get_user(self, validated_token):
+        user = self.claims_user(validated_token)
+        if not active_users.is_active(user.id):
+            raise self.inactive()
+        return user
+
+    def claims_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        return ClaimsUser(validated_token)
+
+    def inactive(self):
+        return AuthenticationFailed("User is inactive or no longer exists", code="user_inactive")
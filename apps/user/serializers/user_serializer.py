@@ -3,12 +3,16 @@ from apps.user.models import User  # Adjust the import based on your User model
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 from rest_framework.validators import UniqueValidator
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.hashers import make_password
 from config.settings import env
+from utils.serializers import TimedDataMixin
 
 
-class UserSerializer(serializers.ModelSerializer):
+def hash_password(password):
+    return make_password(password, salt=env("PASSWORD_SALT"), hasher="default")
+
+
+class UserSerializer(TimedDataMixin, serializers.ModelSerializer):
     email = serializers.EmailField(
         required=True,
         validators=[
@@ -38,13 +42,12 @@ class UserSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
+        # Async registration hashes in the hashing pool and passes the result
+        # through serializer.save(password_hash=...).
+        password_hash = validated_data.get("password_hash") or hash_password(validated_data.get("password"))
         user = User(
             email=validated_data["email"],
-            password=make_password(
-                validated_data.get("password"),
-                salt=env("PASSWORD_SALT"),
-                hasher="default",
-            ),
+            password=password_hash,
             first_name=validated_data["first_name"],
             last_name=validated_data["last_name"],
             phone=validated_data["phone"],
@@ -55,7 +58,6 @@ class UserSerializer(serializers.ModelSerializer):
     
 
     def to_representation(self, instance):
-        token = RefreshToken.for_user(instance)
         return {
             "object": "user",
             "id": instance.id,
@@ -66,7 +68,6 @@ class UserSerializer(serializers.ModelSerializer):
             "status": instance.status,
             "phone_verified": instance.phone_verified,
             "email_verified": instance.email_verified,
-            "access_token": str(token.access_token),
             "created_at": instance.created_at,
             "updated_at": instance.updated_at,
         }
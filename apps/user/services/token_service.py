@@ -0,0 +1,50 @@
+from rest_framework import status
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.user.models import User
+from apps.user.tokens import UserClaimsRefreshToken
+from constants.common_status import CommonStatus
+from utils.error_handler import CustomAPIException
+
+
+def issue_tokens(user):
+    """Mint a refresh/access pair for ``user``.
+
+    Only login, registration and refresh need tokens; plain user
+    serialization never signs anything.
+    """
+    refresh = UserClaimsRefreshToken.for_user(user)
+    return {
+        "access_token": str(refresh.access_token),
+        "refresh_token": str(refresh),
+    }
+
+
+def refresh_tokens(raw_refresh_token):
+    try:
+        refresh = UserClaimsRefreshToken(raw_refresh_token)
+    except TokenError:
+        raise CustomAPIException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message="Invalid or expired refresh token",
+        )
+
+    # Re-read the user so the new access token carries current claims.
+    user = User.objects.filter(
+        id=refresh[api_settings.USER_ID_CLAIM], status=CommonStatus.ACTIVE.value
+    ).first()
+    if user is None:
+        raise CustomAPIException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message="Invalid or expired refresh token",
+        )
+
+    if api_settings.ROTATE_REFRESH_TOKENS:
+        return issue_tokens(user)
+
+    access = UserClaimsRefreshToken.for_user(user).access_token
+    return {
+        "access_token": str(access),
+        "refresh_token": raw_refresh_token,
+    }
@@ -1,5 +1,16 @@
+import json
 import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
+from apps.user.authentication import ClaimsJWTAuthentication, user_cache
+from apps.user.models import User
+from apps.user.serializers.user_serializer import UserSerializer
+from apps.user.views.async_user_views import AsyncUserLoginView, AsyncUserRegistrationView
+from utils.hashing_pool import hashing_pool
+from utils.metrics import registry
 
 @pytest.fixture
 def client():
@@ -95,4 +106,180 @@ def test_login_success(client, register_url, login_url):
     data = response.data["success"]
     assert data["code"] == 200
     assert data["message"] == "User login successfully"
-    assert data["data"]["email"] == payload["email"] 
\ No newline at end of file
+    assert data["data"]["email"] == payload["email"] 
+
+
+@pytest.mark.django_db
+def test_authenticated_request_uses_token_claims(client, register_url):
+    payload = {
+        "email": "claims.user@example.com",
+        "password": "pytestpass123",
+        "first_name": "Claims",
+        "last_name": "User",
+        "phone": "1234567890"
+    }
+    access_token = client.post(register_url, payload, format="json").data["success"]["data"]["access_token"]
+    user_cache.clear()
+    validated_token = ClaimsJWTAuthentication().get_validated_token(access_token.encode())
+    user = ClaimsJWTAuthentication().get_user(validated_token)
+    with CaptureQueriesContext(connection) as queries:
+        assert user.status == 1
+        assert user.email_verified is False
+    assert len(queries.captured_queries) == 0
+    with CaptureQueriesContext(connection) as queries:
+        assert user.email == payload["email"]
+        assert user.first_name == "Claims"
+    assert len(queries.captured_queries) == 1
+
+
+@pytest.mark.django_db
+def test_token_rejected_once_user_is_deactivated_or_deleted(client, register_url):
+    from apps.vehicle.views.async_vehicle_views import AsyncVehicleView
+
+    payload = {
+        "email": "revoked.user@example.com",
+        "password": "pytestpass123",
+        "first_name": "Revoked",
+        "last_name": "User",
+        "phone": "1234567890"
+    }
+    access_token = client.post(register_url, payload, format="json").data["success"]["data"]["access_token"]
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    async_request = RequestFactory(HTTP_AUTHORIZATION=f"Bearer {access_token}").get("/api/v1/vehicle")
+    # Authenticated, the fresh user simply has no vehicles yet.
+    assert client.get("/api/v1/vehicle").data["success"]["code"] == 404
+    # The active check is cached, so later requests skip the users table.
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get("/api/v1/vehicle").data["success"]["code"] == 404
+    assert not any('"users"' in query["sql"] for query in queries.captured_queries)
+
+    user = User.objects.get(email=payload["email"])
+    user.status = 2
+    user.save()
+    assert client.get("/api/v1/vehicle").data["error"]["code"] == 401
+    response = async_to_sync(AsyncVehicleView.as_view())(async_request)
+    assert json.loads(response.content)["error"]["code"] == 401
+
+    user.status = 1
+    user.save()
+    assert client.get("/api/v1/vehicle").data["success"]["code"] == 404
+    user.delete()
+    assert client.get("/api/v1/vehicle").data["error"]["code"] == 401
+    response = async_to_sync(AsyncVehicleView.as_view())(async_request)
+    assert json.loads(response.content)["error"]["code"] == 401
+
+
+@pytest.mark.django_db
+def test_async_register_and_login(register_url, login_url):
+    factory = RequestFactory()
+    payload = {
+        "email": "async.user@example.com",
+        "password": "pytestpass123",
+        "first_name": "Async",
+        "last_name": "User",
+        "phone": "1234567890"
+    }
+    request = factory.post(register_url, payload, content_type="application/json")
+    response = async_to_sync(AsyncUserRegistrationView.as_view())(request)
+    data = json.loads(response.content)["success"]
+    assert data["code"] == 201
+    assert data["data"]["email"] == payload["email"]
+
+    request = factory.post(login_url, {"email": payload["email"], "password": "wrongpassword"}, content_type="application/json")
+    data = json.loads(async_to_sync(AsyncUserLoginView.as_view())(request).content)["error"]
+    assert data["message"] == "Incorect password"
+
+    request = factory.post(login_url, {"email": payload["email"], "password": payload["password"]}, content_type="application/json")
+    data = json.loads(async_to_sync(AsyncUserLoginView.as_view())(request).content)["success"]
+    assert data["code"] == 200
+    assert data["data"]["access_token"]
+
+
+@pytest.mark.django_db
+def test_async_login_rejected_when_hashing_pool_is_full(settings, login_url):
+    User.objects.create(email="busy@example.com", password="!", first_name="B", last_name="U", phone="1234567890", status=1)
+    settings.PASSWORD_HASHING_MAX_PENDING = 0
+    request = RequestFactory().post(login_url, {"email": "busy@example.com", "password": "pytestpass123"}, content_type="application/json")
+    rejected = hashing_pool.stats()["rejected"]
+    response = async_to_sync(AsyncUserLoginView.as_view())(request)
+    assert json.loads(response.content)["error"]["code"] == 503
+    assert response["Retry-After"] == "1"
+    stats = hashing_pool.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["rejected"] == rejected + 1
+    exposition = registry.exposition()
+    assert "# TYPE password_hashing_queue_depth gauge\npassword_hashing_queue_depth 0\n" in exposition
+    assert f"password_hashing_rejected_total {rejected + 1}\n" in exposition
+
+
+@pytest.mark.django_db
+def test_refresh_token(client, register_url):
+    payload = {
+        "email": "refresh.user@example.com",
+        "password": "pytestpass123",
+        "first_name": "Refresh",
+        "last_name": "User",
+        "phone": "1234567890"
+    }
+    tokens = client.post(register_url, payload, format="json").data["success"]["data"]
+    response = client.post("/api/v1/user/token/refresh", {"refresh_token": tokens["refresh_token"]}, format="json")
+    data = response.data["success"]
+    assert data["code"] == 200
+    assert data["data"]["access_token"]
+    assert data["data"]["refresh_token"]
+
+    response = client.post("/api/v1/user/token/refresh", {"refresh_token": "not-a-token"}, format="json")
+    assert response.data["error"]["code"] == 401
+
+
+@pytest.mark.django_db
+def test_user_representation_has_no_tokens():
+    user = User.objects.create(email="profile@example.com", password="!", first_name="P", last_name="U", phone="1234567890", status=1)
+    data = UserSerializer(user).data
+    assert "access_token" not in data
+    assert "refresh_token" not in data
+
+
+@pytest.mark.django_db
+def test_healthz(client):
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["pool"] is None
+
+    from unittest import mock
+    from django.db import OperationalError
+    with mock.patch("utils.health.connection") as connection:
+        connection.cursor.side_effect = OperationalError('connection to server at "db.internal", port 5432 failed')
+        response = client.get("/healthz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable"}
+
+
+@pytest.mark.django_db
+def test_prebuilt_schema(client, settings, tmp_path, caplog, monkeypatch):
+    from django.core.management import call_command
+    from utils import schema
+    from utils.schema import build_schema, source_fingerprint
+
+    settings.OPENAPI_SCHEMA_DIR = str(tmp_path)
+    monkeypatch.setattr(schema, "_warned", set())
+    introspected = client.get("/api/schema/", {"format": "json"})
+    assert introspected.status_code == 200
+    assert "ETag" not in introspected
+    assert f"No pre-built json schema for code version {source_fingerprint()}" in caplog.text
+
+    call_command("build_schema")
+    assert build_schema() == []
+    response = client.get("/api/schema/", {"format": "json"})
+    assert response.json()["paths"] == introspected.json()["paths"]
+    assert response["Cache-Control"] == "no-cache"
+    etag = response["ETag"]
+    assert client.get("/api/schema/", {"format": "json"}, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    versioned = client.get(response["Content-Location"], {"format": "json"})
+    assert versioned["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert versioned.content == response.content
+    assert client.get("/api/schema/0000000000000000/", {"format": "json"}).data["error"]["code"] == 404
+    assert source_fingerprint() in response["Content-Location"]
@@ -0,0 +1,32 @@
+import pytest
+from rest_framework.test import APIClient
+from tests.query_budget import assert_max_queries, seed_dataset
+
+@pytest.fixture
+def client():
+    seed_dataset(bookings_per_vehicle=1)
+    return APIClient()
+
+@pytest.fixture
+def payload():
+    return {
+        "email": "budget.user@example.com",
+        "password": "pytestpass123",
+        "first_name": "Budget",
+        "last_name": "User",
+        "phone": "1234567890"
+    }
+
+@pytest.mark.django_db
+def test_register_query_budget(client, payload):
+    with assert_max_queries(2):
+        response = client.post("/api/v1/user/register", payload, format="json")
+    assert response.data["success"]["code"] == 201
+
+@pytest.mark.django_db
+def test_login_query_budget(client, payload):
+    client.post("/api/v1/user/register", payload, format="json")
+    login_payload = {"email": payload["email"], "password": payload["password"]}
+    with assert_max_queries(2):
+        response = client.post("/api/v1/user/login", login_payload, format="json")
+    assert response.data["success"]["code"] == 200
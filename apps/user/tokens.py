@@ -0,0 +1,20 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# User fields copied into every token so that authenticated requests can be
+# served without loading the user row.
+USER_CLAIMS = ("status", "email_verified", "phone_verified")
+
+
+class UserClaimsRefreshToken(RefreshToken):
+    """Refresh token carrying ``USER_CLAIMS``; its access tokens copy them.
+
+    Signing and verification go through simplejwt's shared
+    ``state.token_backend``, which prepares its keys once.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
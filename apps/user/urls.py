@@ -1,10 +1,22 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
 
+from apps.user.views.async_user_views import AsyncUserLoginView, AsyncUserRegistrationView
+from apps.user.views.token_refresh_view import TokenRefreshView
 from apps.user.views.user_login_view import UserLoginView
 from apps.user.views.user_registration_view import UserRegistrationView
 
+if settings.ASYNC_AUTH_VIEWS:
+    registration_view = csrf_exempt(AsyncUserRegistrationView.as_view())
+    login_view = csrf_exempt(AsyncUserLoginView.as_view())
+else:
+    registration_view = UserRegistrationView.as_view()
+    login_view = UserLoginView.as_view()
+
 urlpatterns = [
-    path("register", UserRegistrationView.as_view(), name="user-register"),
-    path("login", UserLoginView.as_view(), name="user-login"),
+    path("register", registration_view, name="user-register"),
+    path("login", login_view, name="user-login"),
+    path("token/refresh", TokenRefreshView.as_view(), name="user-token-refresh"),
 ]
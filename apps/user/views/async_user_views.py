@@ -0,0 +1,79 @@
+"""
+Async variants of UserLoginView and UserRegistrationView for ASGI deployments
+(ASYNC_AUTH_VIEWS=True). Password hashing runs in the bounded hashing pool so
+login storms cannot pin the workers serving the rest of the API.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import check_password
+from rest_framework import status
+from apps.user.models.user import User
+from apps.user.serializers.user_serializer import UserSerializer, hash_password
+from apps.user.services.token_service import issue_tokens
+from utils.common import is_valid_email
+from utils.async_views import AsyncAPIView
+from utils.custom_responses import ErrorResponse, SuccessResponse
+from utils.error_handler import CustomAPIException
+from utils.hashing_pool import HashingPoolSaturated, hashing_pool
+
+
+class AsyncAuthView(AsyncAPIView):
+    authentication_required = False
+
+    def handle_exception(self, exc):
+        if isinstance(exc, HashingPoolSaturated):
+            response = ErrorResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                message="Server is busy, please try again",
+            )
+            response["Retry-After"] = "1"
+            return response
+        return super().handle_exception(exc)
+
+
+class AsyncUserLoginView(AsyncAuthView):
+    async def post(self, request):
+        payload = request.data
+        email = payload.get("email", None)
+        password = payload.get("password", None)
+        if not email or not password:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Email and password are required",
+            )
+
+        if is_valid_email(email) == False:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Invalid email format",
+            )
+
+        user = await User.objects.filter(email=email).afirst()
+        if user is None:
+            raise CustomAPIException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message="User not registered",
+            )
+        if await hashing_pool.run(check_password, password, user.password) == False:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Incorect password",
+            )
+
+        return SuccessResponse(
+            data={**UserSerializer(user).data, **issue_tokens(user)},
+            message="User login successfully",
+            status_code=status.HTTP_200_OK,
+        )
+
+
+class AsyncUserRegistrationView(AsyncAuthView):
+    async def post(self, request):
+        serializer = UserSerializer(data=request.data)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        password_hash = await hashing_pool.run(hash_password, serializer.validated_data["password"])
+        user = await sync_to_async(serializer.save)(password_hash=password_hash)
+        return SuccessResponse(
+            data={**serializer.data, **issue_tokens(user)},
+            message="User registered successfully",
+            status_code=status.HTTP_201_CREATED,
+        )
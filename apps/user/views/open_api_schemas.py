@@ -67,3 +67,39 @@ user_login_invalid_credentials_example = OpenApiExample(
     response_only=True,
     status_codes=["401"],
 )
+
+# Token refresh examples
+token_refresh_payload_schema = {
+    "application/json": {
+        "type": "object",
+        "properties": {
+            "refresh_token": {"type": "string", "example": "<jwt-refresh-token>"},
+        },
+        "required": ["refresh_token"],
+    }
+}
+
+token_refresh_success_example = OpenApiExample(
+    "Success Response",
+    value={
+        "success": {
+            "code": 200,
+            "data": {
+                "access_token": "<jwt-token>",
+                "refresh_token": "<jwt-refresh-token>",
+            },
+            "message": "Token refreshed successfully",
+        }
+    },
+    response_only=True,
+    status_codes=["200"],
+)
+
+token_refresh_invalid_example = OpenApiExample(
+    "Invalid Refresh Token",
+    value={
+        "error": {"code": 401, "data": None, "message": "Invalid or expired refresh token"}
+    },
+    response_only=True,
+    status_codes=["401"],
+)
@@ -0,0 +1,37 @@
+from rest_framework.views import APIView
+from rest_framework import status
+from apps.user.services.token_service import refresh_tokens
+from utils.custom_responses import SuccessResponse
+from utils.error_handler import CustomAPIException
+from drf_spectacular.utils import extend_schema
+from .open_api_schemas import (
+    token_refresh_payload_schema,
+    token_refresh_success_example,
+    token_refresh_invalid_example,
+)
+
+
+class TokenRefreshView(APIView):
+    @extend_schema(
+        summary="Refresh access token",
+        description="Exchange a refresh token for a new access token without logging in again",
+        request=token_refresh_payload_schema,
+        responses={
+            200: None,
+            401: None,
+        },
+        examples=[token_refresh_success_example, token_refresh_invalid_example],
+    )
+    def post(self, request):
+        refresh_token = request.data.get("refresh_token", None)
+        if not refresh_token:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Refresh token is required",
+            )
+
+        return SuccessResponse(
+            data=refresh_tokens(refresh_token),
+            message="Token refreshed successfully",
+            status_code=status.HTTP_200_OK,
+        )
@@ -2,6 +2,7 @@ from rest_framework.views import APIView
 from rest_framework import status
 from apps.user.models.user import User
 from apps.user.serializers.user_serializer import UserSerializer
+from apps.user.services.token_service import issue_tokens
 from utils.common import is_valid_email
 from utils.custom_responses import SuccessResponse
 from utils.error_handler import CustomAPIException
@@ -47,7 +48,7 @@ class UserLoginView(APIView):
             )
 
         return SuccessResponse(
-            data=UserSerializer(user).data,
+            data={**UserSerializer(user).data, **issue_tokens(user)},
             message="User login successfully",
             status_code=status.HTTP_200_OK,
         )
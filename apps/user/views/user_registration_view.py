@@ -6,6 +6,7 @@ from rest_framework import status
 from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
 from apps.user.serializers.user_serializer import UserSerializer
+from apps.user.services.token_service import issue_tokens
 from utils.custom_responses import ErrorResponse, SuccessResponse
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from .open_api_schemas import (
@@ -31,9 +32,9 @@ class UserRegistrationView(APIView):
     def post(self, request):
         serializer = UserSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        user = serializer.save()
         return SuccessResponse(
-            data=serializer.data,
+            data={**serializer.data, **issue_tokens(user)},
             message="User registered successfully",
             status_code=status.HTTP_201_CREATED,
         )
@@ -0,0 +1,46 @@
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.user.models import User
+from apps.vehicle.services.vehicle_import import IMPORT_FORMATS, VehicleImportError, import_vehicles, parse_vehicle_file
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a fleet from a CSV (make,model,year,plate header) or JSON file for one owner, "
+        "checking plates and inserting per chunk. Rejected rows are listed on stderr."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSON file to import")
+        parser.add_argument("--owner", type=int, required=True, help="User who will own the vehicles")
+        parser.add_argument("--format", choices=IMPORT_FORMATS,
+                            help="File format (default: taken from the file extension)")
+        parser.add_argument("--chunk-size", type=int, default=settings.VEHICLE_IMPORT_CHUNK_SIZE,
+                            help="Rows checked and inserted per chunk")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        import_format = options["format"] or path.suffix.lstrip(".").lower()
+        if import_format not in IMPORT_FORMATS:
+            raise CommandError("Cannot tell the file format, pass --format")
+        if not User.objects.filter(id=options["owner"]).exists():
+            raise CommandError(f"User {options['owner']} does not exist")
+
+        started = time.perf_counter()
+        try:
+            rows = parse_vehicle_file(path.read_bytes(), import_format)
+        except VehicleImportError as error:
+            raise CommandError(str(error))
+        results, created = import_vehicles(options["owner"], rows, options["chunk_size"])
+        elapsed = time.perf_counter() - started
+
+        for result in results:
+            if not result["created"]:
+                self.stderr.write(f"row {result['index'] + 1}: {result['message']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {created} of {len(rows)} vehicles in {elapsed:.2f}s"
+        ))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicle', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vehicle',
+            index=models.Index(fields=['make', 'model', 'year', 'id'], name='vehicles_make_model_year_idx'),
+        ),
+    ]
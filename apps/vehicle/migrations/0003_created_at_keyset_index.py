@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicle', '0002_vehicle_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vehicle',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='vehicles_user_created_idx'),
+        ),
+    ]
@@ -14,6 +14,10 @@ class Vehicle(models.Model):
 
     class Meta:
         db_table = "vehicles"
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-id"], name="vehicles_user_created_idx"),
+            models.Index(fields=["make", "model", "year", "id"], name="vehicles_make_model_year_idx"),
+        ]
 
     def __str__(self):
         return self.pk
@@ -1,8 +1,10 @@
 from rest_framework import serializers
 from apps.vehicle.models import Vehicle
 from rest_framework.validators import UniqueValidator
+from apps.vehicle.services.vehicle_cache import vehicle_cache
+from utils.serializers import RowListSerializer, TimedDataMixin
 
-class VehicleSerializer(serializers.ModelSerializer):
+class VehicleSerializer(TimedDataMixin, serializers.ModelSerializer):
     make = serializers.CharField(
         required=True,
         error_messages={
@@ -41,6 +43,9 @@ class VehicleSerializer(serializers.ModelSerializer):
             "year",
             "plate",
         ]
+        list_serializer_class = RowListSerializer
+
+    row_fields = ("id", "user_id", "make", "model", "year", "plate", "created_at", "updated_at")
 
     def create(self, validated_data):
         vehicle = Vehicle(
@@ -51,6 +56,12 @@ class VehicleSerializer(serializers.ModelSerializer):
             plate=validated_data["plate"],
         )
         vehicle.save()
+        vehicle_cache.invalidate(vehicle.user_id)
+        return vehicle
+
+    def update(self, instance, validated_data):
+        vehicle = super().update(instance, validated_data)
+        vehicle_cache.invalidate(vehicle.user_id)
         return vehicle
 
     def to_representation(self, instance):
@@ -65,3 +76,17 @@ class VehicleSerializer(serializers.ModelSerializer):
             "created_at": instance.created_at,
             "updated_at": instance.updated_at,
         }
+
+    @staticmethod
+    def row_representation(row):
+        return {
+            "object": "vehicle",
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "make": row["make"],
+            "model": row["model"],
+            "year": row["year"],
+            "plate": row["plate"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
@@ -0,0 +1,14 @@
+from utils.cache import VersionedCache
+from utils.metrics import Stats, registry
+
+# Serialized vehicle lists and single vehicles, grouped per owner.
+vehicle_cache = VersionedCache("vehicles", timeout_setting="VEHICLE_CACHE_TTL")
+
+registry.register(Stats("vehicle_cache", vehicle_cache.stats, {
+    "hits": ("counter", "Vehicle lookups served from the cache."),
+    "misses": ("counter", "Vehicle lookups that had to query the database."),
+}))
+
+
+def cache_status(hit):
+    return "HIT" if hit else "MISS"
@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+
+from django.db import IntegrityError, transaction
+
+from apps.vehicle.models import Vehicle
+from apps.vehicle.services.vehicle_cache import vehicle_cache
+
+IMPORT_FORMATS = ("csv", "json")
+IMPORT_FIELDS = ("make", "model", "year", "plate")
+PLATE_EXISTS_MESSAGE = "Plate already exists"
+
+
+class VehicleImportError(ValueError):
+    """The file itself could not be read; per-row problems go in the report."""
+
+
+def parse_vehicle_file(content, import_format):
+    """Return the rows of a CSV (with a header line) or JSON (array of objects) file."""
+    if isinstance(content, bytes):
+        try:
+            content = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise VehicleImportError("File must be UTF-8 encoded")
+
+    if import_format == "csv":
+        reader = csv.DictReader(io.StringIO(content))
+        missing = set(IMPORT_FIELDS) - set(reader.fieldnames or ())
+        if missing:
+            raise VehicleImportError("CSV header is missing: " + ", ".join(sorted(missing)))
+        return list(reader)
+
+    try:
+        rows = json.loads(content)
+    except ValueError:
+        raise VehicleImportError("File is not valid JSON")
+    if not isinstance(rows, list):
+        raise VehicleImportError("JSON file must contain a list of vehicles")
+    return rows
+
+
+def _clean(row):
+    """Validate one row the way ``VehicleSerializer`` would, without queries."""
+    if not isinstance(row, dict):
+        return "Vehicle must be an object", None
+
+    values = {}
+    for field in ("make", "model", "plate"):
+        value = row.get(field)
+        value = str(value).strip() if value is not None else ""
+        if not value:
+            return f"{field.capitalize()} is required", None
+        max_length = Vehicle._meta.get_field(field).max_length
+        if len(value) > max_length:
+            return f"{field.capitalize()} must be at most {max_length} characters", None
+        values[field] = value
+
+    year = row.get("year")
+    if year is None or str(year).strip() == "":
+        return "Year is required", None
+    try:
+        values["year"] = int(str(year).strip())
+    except ValueError:
+        return "Year must be a valid integer", None
+    if values["year"] < 0:
+        return "Year must be a valid integer", None
+    return None, values
+
+
+def _existing_plates(plates):
+    return set(Vehicle.objects.filter(plate__in=plates).values_list("plate", flat=True))
+
+
+def import_vehicles(owner_id, rows, chunk_size):
+    """Create vehicles for ``owner_id`` from ``rows`` and return a per-row report.
+
+    Plates are deduplicated inside the file first, then checked against the
+    database with one ``plate__in`` query per chunk and inserted with
+    ``bulk_create``, so the cost grows with the number of chunks rather than
+    the number of rows.
+    """
+    errors = {}
+    cleaned = {}
+    seen_plates = set()
+    for index, row in enumerate(rows):
+        error, values = _clean(row)
+        if not error and values["plate"] in seen_plates:
+            error = "Duplicate plate in file"
+        if error:
+            errors[index] = error
+            continue
+        seen_plates.add(values["plate"])
+        cleaned[index] = values
+
+    created = {}
+    indexes = list(cleaned)
+    for offset in range(0, len(indexes), chunk_size):
+        chunk = {index: cleaned[index] for index in indexes[offset:offset + chunk_size]}
+        created.update(_import_chunk(owner_id, chunk, errors))
+
+    if created:
+        vehicle_cache.invalidate(owner_id)
+
+    results = [
+        {
+            "index": index,
+            "created": index in created,
+            "vehicle_id": created[index].id if index in created else None,
+            "message": errors.get(index),
+        }
+        for index in range(len(rows))
+    ]
+    return results, len(created)
+
+
+def _import_chunk(owner_id, chunk, errors):
+    for attempt in range(2):
+        existing = _existing_plates([values["plate"] for values in chunk.values()])
+        for index in [index for index, values in chunk.items() if values["plate"] in existing]:
+            errors[index] = PLATE_EXISTS_MESSAGE
+            del chunk[index]
+        if not chunk:
+            return {}
+
+        vehicles = {index: Vehicle(user_id=owner_id, **values) for index, values in chunk.items()}
+        try:
+            with transaction.atomic():
+                Vehicle.objects.bulk_create(vehicles.values())
+            return vehicles
+        except IntegrityError:
+            # A concurrent request took one of the plates after the check;
+            # re-checking once marks it and lets the rest of the chunk through.
+            if attempt:
+                raise
@@ -20,8 +20,8 @@ def user():
 @pytest.fixture
 def auth_client(user):
     client = APIClient()
-    from apps.user.serializers.user_serializer import UserSerializer
-    access_token = UserSerializer(user).data.get("access_token")
+    from apps.user.services.token_service import issue_tokens
+    access_token = issue_tokens(user)["access_token"]
     client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
     return client
 
@@ -147,3 +147,248 @@ def test_unauthenticated_access(vehicle_url):
     assert response.status_code in [401, 200]
     if response.status_code == 200:
         assert "Unauthenticated" in str(response.data)
+
+@pytest.mark.django_db
+def test_available_vehicles_excludes_booked(auth_client, user, vehicle_url):
+    free = Vehicle.objects.create(user=user, make="Kia", model="Rio", year=2022, plate="FREE123")
+    booked = Vehicle.objects.create(user=user, make="Kia", model="Rio", year=2022, plate="TAKEN123")
+    start = datetime.now() + timedelta(days=1)
+    end = datetime.now() + timedelta(days=2)
+    Booking.objects.create(user=user, vehicle=booked, start_date=start, end_date=end, status=1)
+    response = auth_client.get(f"{vehicle_url}/available", {
+        "start": start.strftime("%Y-%m-%d %H:%M"),
+        "end": end.strftime("%Y-%m-%d %H:%M"),
+        "make": "Kia",
+    })
+    data = response.data["success"]
+    assert data["code"] == 200
+    assert [v["id"] for v in data["data"]] == [free.id]
+    assert data["next"] is None
+
+@pytest.mark.django_db
+def test_available_vehicles_pagination(auth_client, user, vehicle_url):
+    first = Vehicle.objects.create(user=user, make="Audi", model="A4", year=2021, plate="PAGE1")
+    second = Vehicle.objects.create(user=user, make="Audi", model="A4", year=2021, plate="PAGE2")
+    params = {
+        "start": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M"),
+        "end": (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d %H:%M"),
+        "page_size": 1,
+    }
+    page = auth_client.get(f"{vehicle_url}/available", params).data["success"]
+    assert [v["id"] for v in page["data"]] == [first.id]
+    page = auth_client.get(f"{vehicle_url}/available", {**params, "cursor": page["next"]}).data["success"]
+    assert [v["id"] for v in page["data"]] == [second.id]
+    assert page["next"] is None
+
+@pytest.mark.django_db
+def test_available_vehicles_invalid_cursor(auth_client, user, vehicle_url):
+    from utils.pagination import encode_cursor
+    params = {
+        "start": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M"),
+        "end": (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d %H:%M"),
+    }
+    for cursor in ("not-a-cursor!", encode_cursor({"id": 1}), encode_cursor([1, 2]), encode_cursor(["x"])):
+        response = auth_client.get(f"{vehicle_url}/available", {**params, "cursor": cursor})
+        assert response.status_code == 200
+        assert response.data["error"]["code"] == 400
+        assert response.data["error"]["message"] == "Invalid cursor"
+
+@pytest.mark.django_db
+def test_vehicle_calendar_tracks_bookings(auth_client, user, vehicle_url):
+    vehicle = Vehicle.objects.create(user=user, make="Seat", model="Ibiza", year=2020, plate="CAL123")
+    day = (datetime.now() + timedelta(days=2)).date()
+    auth_client.post("/api/v1/booking", {
+        "vehicle_id": vehicle.id,
+        "start_date": f"{day} 09:30",
+        "end_date": f"{day} 12:00",
+    }, format="json")
+    response = auth_client.get(f"{vehicle_url}/{vehicle.id}/calendar", {"from": str(day), "days": 2})
+    data = response.data["success"]
+    assert data["code"] == 200
+    assert data["data"]["days"][0]["slots"] == "0" * 9 + "1111" + "0" * 11
+    assert data["data"]["days"][1]["slots"] == "0" * 24
+
+    from apps.booking.serializers.booking_serializer import BookingSerializer
+    booking = Booking.objects.get(vehicle=vehicle)
+    serializer = BookingSerializer(booking, data={}, partial=True)
+    serializer.is_valid(raise_exception=True)
+    serializer.save(status=3)
+    data = auth_client.get(f"{vehicle_url}/{vehicle.id}/calendar", {"from": str(day), "days": 1}).data["success"]
+    assert data["data"]["days"][0]["slots"] == "0" * 24
+
+@pytest.mark.django_db
+def test_vehicle_calendar_counts_the_end_hour(auth_client, user, vehicle_url):
+    vehicle = Vehicle.objects.create(user=user, make="Seat", model="Leon", year=2021, plate="EDGE123")
+    day = (datetime.now() + timedelta(days=2)).date()
+    auth_client.post("/api/v1/booking", {
+        "vehicle_id": vehicle.id,
+        "start_date": f"{day} 10:00",
+        "end_date": f"{day} 12:00",
+    }, format="json")
+    data = auth_client.get(f"{vehicle_url}/{vehicle.id}/calendar", {"from": str(day), "days": 1}).data["success"]
+    assert data["data"]["days"][0]["slots"] == "0" * 10 + "111" + "0" * 11
+
+    # The 12:00 hour shows as booked because a booking touching the end is rejected.
+    response = auth_client.post("/api/v1/booking", {
+        "vehicle_id": vehicle.id,
+        "start_date": f"{day} 12:00",
+        "end_date": f"{day} 13:00",
+    }, format="json")
+    assert "Vehicle is already booked" in response.data["error"]["message"]
+
+    auth_client.post("/api/v1/booking", {
+        "vehicle_id": vehicle.id,
+        "start_date": f"{day} 22:00",
+        "end_date": f"{day + timedelta(days=1)} 00:00",
+    }, format="json")
+    data = auth_client.get(f"{vehicle_url}/{vehicle.id}/calendar", {"from": str(day), "days": 2}).data["success"]
+    assert data["data"]["days"][0]["slots"] == "0" * 10 + "111" + "0" * 9 + "11"
+    assert data["data"]["days"][1]["slots"] == "1" + "0" * 23
+
+@pytest.mark.django_db
+def test_vehicle_cache_invalidated_on_write(auth_client, user, vehicle_url):
+    vehicle = Vehicle.objects.create(user=user, make="Fiat", model="Panda", year=2016, plate="CACHE1")
+    assert auth_client.get(vehicle_url)["X-Cache"] == "MISS"
+    assert auth_client.get(vehicle_url)["X-Cache"] == "HIT"
+    assert auth_client.get(f"{vehicle_url}/{vehicle.id}")["X-Cache"] == "MISS"
+
+    auth_client.put(f"{vehicle_url}/{vehicle.id}", {"model": "Tipo"}, format="json")
+    response = auth_client.get(vehicle_url)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["success"]["data"][0]["model"] == "Tipo"
+    assert auth_client.get(f"{vehicle_url}/{vehicle.id}").data["success"]["data"]["model"] == "Tipo"
+
+    auth_client.delete(f"{vehicle_url}/{vehicle.id}")
+    assert auth_client.get(vehicle_url).data["success"]["code"] == 404
+
+@pytest.mark.django_db
+def test_async_vehicle_views(user, vehicle_url):
+    import json
+    from asgiref.sync import async_to_sync
+    from django.test import RequestFactory
+    from apps.user.services.token_service import issue_tokens
+    from apps.vehicle.views.async_vehicle_views import AsyncVehicleDetailView, AsyncVehicleView
+
+    list_view = AsyncVehicleView.as_view()
+    detail_view = AsyncVehicleDetailView.as_view()
+    factory = RequestFactory(HTTP_AUTHORIZATION=f"Bearer {issue_tokens(user)['access_token']}")
+    payload = {"make": "Kia", "model": "Rio", "year": 2021, "plate": "ASYNC1"}
+
+    data = json.loads(async_to_sync(list_view)(factory.post(vehicle_url, payload, content_type="application/json")).content)
+    vehicle_id = data["success"]["data"]["id"]
+    assert data["success"]["code"] == 201
+    data = json.loads(async_to_sync(list_view)(factory.post(vehicle_url, payload, content_type="application/json")).content)
+    assert data["error"]["message"] == "Plate already exists"
+
+    assert async_to_sync(list_view)(factory.get(vehicle_url))["X-Cache"] == "MISS"
+    response = async_to_sync(list_view)(factory.get(vehicle_url))
+    assert response["X-Cache"] == "HIT"
+    assert json.loads(response.content)["success"]["data"][0]["plate"] == "ASYNC1"
+
+    request = factory.put(f"{vehicle_url}/{vehicle_id}", {"model": "Ceed"}, content_type="application/json")
+    data = json.loads(async_to_sync(detail_view)(request, vehicle_id=vehicle_id).content)["success"]
+    assert data["data"]["model"] == "Ceed"
+    response = async_to_sync(detail_view)(factory.get(f"{vehicle_url}/{vehicle_id}"), vehicle_id=vehicle_id)
+    assert json.loads(response.content)["success"]["data"]["model"] == "Ceed"
+
+    response = async_to_sync(detail_view)(factory.delete(f"{vehicle_url}/{vehicle_id}"), vehicle_id=vehicle_id)
+    assert json.loads(response.content)["success"]["message"] == "Vehicle deleted successfully"
+    assert not Vehicle.objects.filter(id=vehicle_id).exists()
+
+@pytest.mark.django_db
+def test_vehicle_list_serializer_matches_instance_output(user):
+    from rest_framework.renderers import JSONRenderer
+    from apps.vehicle.serializers.vehicle_serializer import VehicleSerializer
+
+    for index in range(3):
+        Vehicle.objects.create(user=user, make="Mazda", model="3", year=2015 + index, plate=f"ROW{index}")
+    vehicles = Vehicle.objects.order_by("id")
+
+    rows = VehicleSerializer(vehicles, many=True).data
+    instances = [VehicleSerializer(vehicle).data for vehicle in vehicles]
+    assert JSONRenderer().render(rows) == JSONRenderer().render(instances)
+
+@pytest.mark.django_db
+def test_import_vehicles(auth_client, user, vehicle_url, tmp_path, settings):
+    import json
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.core.management import call_command
+
+    settings.VEHICLE_IMPORT_CHUNK_SIZE = 2
+    Vehicle.objects.create(user=user, make="Fiat", model="Panda", year=2016, plate="TAKEN1")
+    assert auth_client.get(vehicle_url)["X-Cache"] == "MISS"
+
+    csv_file = SimpleUploadedFile("fleet.csv", (
+        "make,model,year,plate\n"
+        "Toyota,Corolla,2020,CSV-1\n"
+        "Honda,Civic,twenty,CSV-2\n"
+        "Kia,Rio,2019,TAKEN1\n"
+        "Kia,Rio,2019,CSV-1\n"
+        "Ford,Focus,2018, CSV-3 \n"
+    ).encode())
+    response = auth_client.post(f"{vehicle_url}/import", {"file": csv_file}, format="multipart")
+    data = response.data["success"]
+    assert data["code"] == 201
+    assert [row["message"] for row in data["data"]] == [
+        None, "Year must be a valid integer", "Plate already exists", "Duplicate plate in file", None,
+    ]
+    assert Vehicle.objects.get(plate="CSV-3").id == data["data"][4]["vehicle_id"]
+    assert auth_client.get(vehicle_url).data["success"]["data"][0]["plate"] in {"CSV-1", "CSV-3"}
+
+    response = auth_client.post(f"{vehicle_url}/import", {"vehicles": [{"make": "Kia", "model": "Rio",
+                                                                         "year": 2019, "plate": "CSV-1"}]},
+                                format="json")
+    assert response.data["error"]["message"] == "No vehicles were imported"
+
+    bad_file = SimpleUploadedFile("fleet.csv", b"make,model,year\nKia,Rio,2019\n")
+    response = auth_client.post(f"{vehicle_url}/import", {"file": bad_file}, format="multipart")
+    assert response.data["error"]["message"] == "CSV header is missing: plate"
+
+    path = tmp_path / "fleet.json"
+    path.write_text(json.dumps([{"make": "Seat", "model": "Ibiza", "year": 2021, "plate": f"JSON-{index}"}
+                                for index in range(5)]))
+    call_command("import_vehicles", str(path), "--owner", str(user.id))
+    assert Vehicle.objects.filter(user=user, plate__startswith="JSON-").count() == 5
+
+@pytest.mark.django_db
+def test_request_metrics(user, vehicle_url, settings):
+    import re
+    from apps.user.authentication import active_users
+    from apps.user.services.token_service import issue_tokens
+    from utils.metrics import registry
+
+    settings.METRICS_ENABLED = True
+    registry.clear()
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {issue_tokens(user)['access_token']}")
+    Vehicle.objects.create(user=user, make="Fiat", model="Panda", year=2016, plate="METRIC1")
+    active_users.is_active(user.id)
+
+    timing = client.get(vehicle_url)["Server-Timing"]
+    assert re.search(r'^db;dur=[\d.]+;desc="1 queries", auth;dur=[\d.]+, serialize;dur=[\d.]+, render;dur=[\d.]+', timing)
+    assert re.search(r"total;dur=[\d.]+$", timing)
+    assert "exception;dur=" in APIClient().get(f"{vehicle_url}/999999")["Server-Timing"]
+
+    prefix = "Async" if settings.ASYNC_API_VIEWS else ""
+    body = client.get("/metrics").content.decode()
+    assert f'http_request_duration_seconds_count{{view="{prefix}VehicleView.get"}} 1' in body
+    assert f'http_request_db_queries_bucket{{view="{prefix}VehicleView.get",le="1"}} 1' in body
+    assert f'http_request_exception_seconds_count{{view="{prefix}VehicleDetailView.get"}} 1' in body
+
+@pytest.mark.django_db
+def test_vehicle_cache_metrics(auth_client, user, vehicle_url, settings):
+    import re
+
+    settings.METRICS_ENABLED = True
+    Vehicle.objects.create(user=user, make="Fiat", model="Panda", year=2016, plate="CACHE3")
+
+    def counters():
+        body = auth_client.get("/metrics").content.decode()
+        return {name: int(value) for name, value in re.findall(r"^vehicle_cache_(\w+)_total (\d+)$", body, re.M)}
+
+    before = counters()
+    assert auth_client.get(vehicle_url)["X-Cache"] == "MISS"
+    assert auth_client.get(vehicle_url)["X-Cache"] == "HIT"
+    after = counters()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
@@ -0,0 +1,97 @@
+import pytest
+from rest_framework.test import APIClient
+from apps.vehicle.models import Vehicle
+from apps.user.authentication import active_users
+from apps.user.services.token_service import issue_tokens
+from datetime import datetime, timedelta
+from tests.query_budget import assert_max_queries, assert_no_seq_scans, seed_dataset
+
+@pytest.fixture
+def dataset():
+    return seed_dataset(vehicles_per_user=60, bookings_per_vehicle=4)
+
+@pytest.fixture
+def user(dataset):
+    owners, _ = dataset
+    return owners[0]
+
+@pytest.fixture
+def auth_client(user):
+    client = APIClient()
+    access_token = issue_tokens(user)["access_token"]
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    # Budgets are per request once the user's active flag is cached.
+    active_users.is_active(user.id)
+    return client
+
+@pytest.fixture
+def vehicle_url():
+    return "/api/v1/vehicle"
+
+@pytest.mark.django_db
+def test_create_vehicle_query_budget(auth_client, vehicle_url):
+    payload = {"make": "Honda", "model": "Civic", "year": 2022, "plate": "BUDGET1"}
+    with assert_max_queries(3) as queries:
+        response = auth_client.post(vehicle_url, payload, format="json")
+    assert response.data["success"]["code"] == 201
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_list_vehicles_query_budget(auth_client, vehicle_url):
+    with assert_max_queries(1) as queries:
+        response = auth_client.get(vehicle_url)
+    data = response.data["success"]
+    assert len(data["data"]) == 50
+    with assert_max_queries(1):
+        auth_client.get(vehicle_url, {"cursor": data["next"]})
+    with assert_max_queries(0):
+        assert auth_client.get(vehicle_url)["X-Cache"] == "HIT"
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_update_vehicle_query_budget(auth_client, user, vehicle_url):
+    vehicle = Vehicle.objects.filter(user=user).first()
+    with assert_max_queries(2) as queries:
+        response = auth_client.put(f"{vehicle_url}/{vehicle.id}", {"model": "Sentra"}, format="json")
+    assert response.data["success"]["code"] == 200
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_delete_vehicle_query_budget(auth_client, user, vehicle_url):
+    vehicle = Vehicle.objects.create(user=user, make="Chevy", model="Malibu", year=2017, plate="BUDGET2")
+    with assert_max_queries(5) as queries:
+        response = auth_client.delete(f"{vehicle_url}/{vehicle.id}")
+    assert response.data["success"]["code"] == 200
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_available_vehicles_query_budget(auth_client, vehicle_url):
+    start = datetime.now() + timedelta(days=10)
+    params = {
+        "start": start.strftime("%Y-%m-%d %H:%M"),
+        "end": (start + timedelta(days=3)).strftime("%Y-%m-%d %H:%M"),
+        "make": "Kia",
+        "model": "Rio",
+    }
+    with assert_max_queries(1) as queries:
+        response = auth_client.get(f"{vehicle_url}/available", params)
+    assert response.data["success"]["code"] == 200
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_vehicle_calendar_query_budget(auth_client, user, vehicle_url):
+    vehicle = Vehicle.objects.filter(user=user).first()
+    with assert_max_queries(1) as queries:
+        response = auth_client.get(f"{vehicle_url}/{vehicle.id}/calendar", {"days": 90})
+    assert response.data["success"]["code"] == 200
+    assert_no_seq_scans(queries.captured_queries)
+
+@pytest.mark.django_db
+def test_import_vehicles_query_budget(auth_client, vehicle_url, settings):
+    settings.VEHICLE_IMPORT_CHUNK_SIZE = 50
+    vehicles = [{"make": "Kia", "model": "Rio", "year": 2020, "plate": f"IMPORT-{index}"} for index in range(100)]
+    # Two chunks, each one plate lookup plus a bulk insert inside a savepoint.
+    with assert_max_queries(8) as queries:
+        response = auth_client.post(f"{vehicle_url}/import", {"vehicles": vehicles}, format="json")
+    assert response.data["success"]["message"] == "100 of 100 vehicles imported successfully"
+    assert_no_seq_scans(queries.captured_queries)
@@ -1,11 +1,26 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
 
+from apps.vehicle.views.async_vehicle_views import AsyncVehicleDetailView, AsyncVehicleView
+from apps.vehicle.views.vehicle_availability_view import VehicleAvailabilityView
+from apps.vehicle.views.vehicle_calendar_view import VehicleCalendarView
 from apps.vehicle.views.vehicle_detail_view import VehicleDetailView
+from apps.vehicle.views.vehicle_import_view import VehicleImportView
 from apps.vehicle.views.vehicle_view import VehicleView
 
+if settings.ASYNC_API_VIEWS:
+    vehicle_view = csrf_exempt(AsyncVehicleView.as_view())
+    vehicle_detail_view = csrf_exempt(AsyncVehicleDetailView.as_view())
+else:
+    vehicle_view = VehicleView.as_view()
+    vehicle_detail_view = VehicleDetailView.as_view()
 
 urlpatterns = [
-    path("vehicle", VehicleView.as_view(), name="vehicle"),
-    path("vehicle/<int:vehicle_id>", VehicleDetailView.as_view(), name="vehicle_detail"),
+    path("vehicle", vehicle_view, name="vehicle"),
+    path("vehicle/available", VehicleAvailabilityView.as_view(), name="vehicle_available"),
+    path("vehicle/import", VehicleImportView.as_view(), name="vehicle_import"),
+    path("vehicle/<int:vehicle_id>", vehicle_detail_view, name="vehicle_detail"),
+    path("vehicle/<int:vehicle_id>/calendar", VehicleCalendarView.as_view(), name="vehicle_calendar"),
 ]
@@ -0,0 +1,134 @@
+"""
+Async variants of VehicleView and VehicleDetailView for ASGI deployments
+(ASYNC_API_VIEWS=True).
+"""
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from apps.booking.models.booking import Booking
+from apps.vehicle.models.vehicle import Vehicle
+from apps.vehicle.serializers.vehicle_serializer import VehicleSerializer
+from apps.vehicle.services.vehicle_cache import cache_status, vehicle_cache
+from constants.common_status import CommonStatus
+from utils.async_views import AsyncAPIView
+from utils.custom_responses import PaginatedResponse, SuccessResponse
+from utils.pagination import apaginate_by_created_at, get_page_size
+
+
+class AsyncVehicleView(AsyncAPIView):
+    async def post(self, request):
+        user = request.user
+        payload = {"user": user.id, **request.data}
+        serializer = VehicleSerializer(data=payload)
+        # Field validation includes the unique-plate lookup, which DRF runs
+        # synchronously.
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        data = serializer.validated_data
+        vehicle = await Vehicle.objects.acreate(
+            user_id=user.id,
+            make=data["make"],
+            model=data["model"],
+            year=data["year"],
+            plate=data["plate"],
+        )
+        await vehicle_cache.ainvalidate(user.id)
+        return SuccessResponse(
+            status_code=status.HTTP_201_CREATED,
+            data=serializer.to_representation(vehicle),
+            message="Vehicle created successfully",
+        )
+
+    async def get(self, request):
+        user = request.user
+
+        async def load_page():
+            vehicles, next_cursor = await apaginate_by_created_at(
+                Vehicle.objects.filter(user_id=user.id).values(*VehicleSerializer.row_fields), request
+            )
+            return list(VehicleSerializer(vehicles, many=True).data), next_cursor
+
+        page_key = f"list:{get_page_size(request)}:{request.query_params.get('cursor', '')}"
+        (vehicles, next_cursor), hit = await vehicle_cache.aget_or_set(user.id, page_key, load_page)
+        if not vehicles:
+            response = SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=[],
+                message="No vehicles",
+            )
+        else:
+            response = PaginatedResponse(
+                status_code=status.HTTP_200_OK,
+                data=vehicles,
+                next_cursor=next_cursor,
+                message="Vehicles retrieved successfully",
+            )
+        response["X-Cache"] = cache_status(hit)
+        return response
+
+
+class AsyncVehicleDetailView(AsyncAPIView):
+    async def get(self, request, vehicle_id):
+        user = request.user
+
+        async def load_vehicle():
+            vehicle = await Vehicle.objects.filter(id=vehicle_id, user_id=user.id).afirst()
+            return VehicleSerializer().to_representation(vehicle) if vehicle else None
+
+        vehicle, hit = await vehicle_cache.aget_or_set(user.id, f"vehicle:{vehicle_id}", load_vehicle)
+        if not vehicle:
+            response = SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="Vehicle not found",
+            )
+        else:
+            response = SuccessResponse(
+                status_code=status.HTTP_200_OK,
+                data=vehicle,
+                message="Vehicle retrieved successfully",
+            )
+        response["X-Cache"] = cache_status(hit)
+        return response
+
+    async def put(self, request, vehicle_id):
+        user = request.user
+        vehicle = await Vehicle.objects.filter(id=vehicle_id, user_id=user.id).afirst()
+        if not vehicle:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="Vehicle not found",
+            )
+
+        serializer = VehicleSerializer(vehicle, data=request.data, partial=True)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        updated_vehicle = await sync_to_async(serializer.save)()
+        return SuccessResponse(
+            status_code=status.HTTP_200_OK,
+            data=serializer.to_representation(updated_vehicle),
+            message="Vehicle updated successfully",
+        )
+
+    async def delete(self, request, vehicle_id):
+        user = request.user
+        vehicle = await Vehicle.objects.filter(id=vehicle_id, user_id=user.id).afirst()
+        if not vehicle:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="Vehicle not found",
+            )
+
+        if await Booking.objects.filter(vehicle_id=vehicle.pk, status=CommonStatus.ACTIVE.value).aexists():
+            return SuccessResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                data=None,
+                message="Cannot delete vehicle while it has active booking",
+            )
+
+        await vehicle.adelete()
+        await vehicle_cache.ainvalidate(user.id)
+        return SuccessResponse(
+            status_code=status.HTTP_200_OK,
+            data=None,
+            message="Vehicle deleted successfully",
+        )
@@ -65,6 +65,7 @@ vehicle_list_success_example = OpenApiExample(
                     "updated_at": "2024-01-01T00:00:00Z",
                 }
             ],
+            "next": None,
             "message": "Vehicles retrieved successfully",
         }
     },
@@ -142,3 +143,159 @@ vehicle_delete_not_found_example = OpenApiExample(
     response_only=True,
     status_codes=["404"],
 )
+
+# Vehicle availability examples
+vehicle_available_success_example = OpenApiExample(
+    "Success Response",
+    value={
+        "success": {
+            "code": 200,
+            "data": [
+                {
+                    "object": "vehicle",
+                    "id": 1,
+                    "user_id": 1,
+                    "make": "Toyota",
+                    "model": "Corolla",
+                    "year": 2020,
+                    "plate": "ABC123",
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "updated_at": "2024-01-01T00:00:00Z",
+                }
+            ],
+            "next": "WzFd",
+            "message": "Available vehicles retrieved successfully",
+        }
+    },
+    response_only=True,
+    status_codes=["200"],
+)
+
+vehicle_available_not_found_example = OpenApiExample(
+    "No Vehicles Available",
+    value={
+        "success": {
+            "code": 404,
+            "data": None,
+            "message": "No vehicles available for the selected dates",
+        }
+    },
+    response_only=True,
+    status_codes=["404"],
+)
+
+vehicle_available_invalid_dates_example = OpenApiExample(
+    "Invalid Dates",
+    value={
+        "error": {
+            "code": 400,
+            "data": None,
+            "message": "Start and end are required in YYYY-MM-DD HH:MM format",
+        }
+    },
+    response_only=True,
+    status_codes=["400"],
+)
+
+# Vehicle calendar examples
+vehicle_calendar_success_example = OpenApiExample(
+    "Success Response",
+    value={
+        "success": {
+            "code": 200,
+            "data": {
+                "vehicle_id": 1,
+                "days": [
+                    {"date": "2024-01-15", "slots": "000000000011111111111111"},
+                    {"date": "2024-01-16", "slots": "111111111110000000000000"},
+                ],
+            },
+            "message": "Vehicle calendar retrieved successfully",
+        }
+    },
+    response_only=True,
+    status_codes=["200"],
+)
+
+vehicle_calendar_not_found_example = OpenApiExample(
+    "Vehicle Not Found",
+    value={"success": {"code": 404, "data": None, "message": "Vehicle not found"}},
+    response_only=True,
+    status_codes=["404"],
+)
+
+# Vehicle detail GET examples
+vehicle_detail_success_example = OpenApiExample(
+    "Success Response",
+    value={
+        "success": {
+            "code": 200,
+            "data": {
+                "object": "vehicle",
+                "id": 1,
+                "user_id": 1,
+                "make": "Toyota",
+                "model": "Corolla",
+                "year": 2020,
+                "plate": "ABC123",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:00Z",
+            },
+            "message": "Vehicle retrieved successfully",
+        }
+    },
+    response_only=True,
+    status_codes=["200"],
+)
+
+vehicle_detail_not_found_example = OpenApiExample(
+    "Vehicle Not Found",
+    value={"success": {"code": 404, "data": None, "message": "Vehicle not found"}},
+    response_only=True,
+    status_codes=["404"],
+)
+
+# Vehicle import examples
+vehicle_import_payload_schema = {
+    "application/json": {
+        "type": "object",
+        "properties": {
+            "vehicles": {
+                "type": "array",
+                "items": add_vehcile_payload_schema["application/json"],
+            },
+        },
+        "required": ["vehicles"],
+    },
+    "multipart/form-data": {
+        "type": "object",
+        "properties": {
+            "file": {"type": "string", "format": "binary"},
+            "format": {"type": "string", "enum": ["csv", "json"]},
+        },
+        "required": ["file"],
+    },
+}
+
+vehicle_import_success_example = OpenApiExample(
+    "Success Response",
+    value={
+        "success": {
+            "code": 201,
+            "data": [
+                {"index": 0, "created": True, "vehicle_id": 1, "message": None},
+                {"index": 1, "created": False, "vehicle_id": None, "message": "Plate already exists"},
+            ],
+            "message": "1 of 2 vehicles imported successfully",
+        }
+    },
+    response_only=True,
+    status_codes=["201"],
+)
+
+vehicle_import_invalid_file_example = OpenApiExample(
+    "Invalid File",
+    value={"error": {"code": 400, "data": None, "message": "CSV header is missing: plate"}},
+    response_only=True,
+    status_codes=["400"],
+)
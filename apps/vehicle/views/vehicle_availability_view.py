@@ -0,0 +1,118 @@
+from django.db.models import Exists, OuterRef
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from apps.booking.models.booking import Booking
+from apps.booking.services.availability import as_aware, booking_period
+from apps.vehicle.models.vehicle import Vehicle
+from apps.vehicle.serializers.vehicle_serializer import VehicleSerializer
+from constants.common_status import CommonStatus
+from utils.common import parse_date_time
+from utils.custom_responses import PaginatedResponse, SuccessResponse
+from utils.error_handler import CustomAPIException
+from utils.pagination import decode_id_cursor, encode_cursor, get_page_size
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .open_api_schemas import (
+    vehicle_available_success_example,
+    vehicle_available_not_found_example,
+    vehicle_available_invalid_dates_example,
+)
+
+
+class VehicleAvailabilityView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Search available vehicles",
+        description="List vehicles with no active booking overlapping the requested period, ordered by id",
+        parameters=[
+            OpenApiParameter(name="start", location=OpenApiParameter.QUERY, required=True, type=str,
+                             description="Period start (YYYY-MM-DD HH:MM)"),
+            OpenApiParameter(name="end", location=OpenApiParameter.QUERY, required=True, type=str,
+                             description="Period end (YYYY-MM-DD HH:MM)"),
+            OpenApiParameter(name="make", location=OpenApiParameter.QUERY, required=False, type=str),
+            OpenApiParameter(name="model", location=OpenApiParameter.QUERY, required=False, type=str),
+            OpenApiParameter(name="year", location=OpenApiParameter.QUERY, required=False, type=int),
+            OpenApiParameter(name="cursor", location=OpenApiParameter.QUERY, required=False, type=str,
+                             description="Opaque cursor returned as `next` by the previous page"),
+            OpenApiParameter(name="page_size", location=OpenApiParameter.QUERY, required=False, type=int),
+        ],
+        responses={
+            200: VehicleSerializer,
+            400: None,
+            404: None,
+        },
+        examples=[
+            vehicle_available_success_example,
+            vehicle_available_not_found_example,
+            vehicle_available_invalid_dates_example,
+        ]
+    )
+    def get(self, request):
+        start_date = parse_date_time(request.query_params.get("start"))
+        end_date = parse_date_time(request.query_params.get("end"))
+        if not start_date or not end_date:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Start and end are required in YYYY-MM-DD HH:MM format",
+            )
+
+        if start_date > end_date:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Start date cannot be after end date",
+            )
+
+        filters = {}
+        for field in ("make", "model"):
+            if request.query_params.get(field):
+                filters[field] = request.query_params[field]
+        year = request.query_params.get("year")
+        if year:
+            if not year.isdigit():
+                raise CustomAPIException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Year must be a valid integer",
+                )
+            filters["year"] = int(year)
+
+        cursor = request.query_params.get("cursor")
+        if cursor:
+            filters["id__gt"] = decode_id_cursor(cursor)
+
+        # NOT EXISTS probes the (vehicle, period) GiST index once per candidate,
+        # and the id keyset stops the scan as soon as the page is full. The
+        # start_date bound keeps later monthly partitions out of the probe.
+        busy = Booking.objects.filter(
+            vehicle_id=OuterRef("pk"),
+            status=CommonStatus.ACTIVE.value,
+            start_date__lte=as_aware(end_date),
+            period__overlap=booking_period(start_date, end_date),
+        )
+        page_size = get_page_size(request)
+        vehicles = list(
+            Vehicle.objects.filter(**filters)
+            .filter(~Exists(busy))
+            .order_by("id")
+            .values(*VehicleSerializer.row_fields)[: page_size + 1]
+        )
+
+        if not vehicles:
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="No vehicles available for the selected dates",
+            )
+
+        next_cursor = None
+        if len(vehicles) > page_size:
+            vehicles = vehicles[:page_size]
+            next_cursor = encode_cursor([vehicles[-1]["id"]])
+
+        serializer = VehicleSerializer(vehicles, many=True)
+        return PaginatedResponse(
+            status_code=status.HTTP_200_OK,
+            data=serializer.data,
+            next_cursor=next_cursor,
+            message="Available vehicles retrieved successfully",
+        )
@@ -0,0 +1,92 @@
+from datetime import datetime
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from apps.booking.services.calendar import get_calendar
+from apps.vehicle.models.vehicle import Vehicle
+from utils.custom_responses import SuccessResponse
+from utils.error_handler import CustomAPIException
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from .open_api_schemas import (
+    vehicle_calendar_success_example,
+    vehicle_calendar_not_found_example,
+)
+
+MAX_CALENDAR_DAYS = 366
+
+
+class VehicleCalendarView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Get vehicle availability calendar",
+        description=(
+            "Hour-by-hour availability of a vehicle. Each day has a 24 character `slots` "
+            "string where character n is '1' when hour n (UTC) is booked."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='vehicle_id',
+                location=OpenApiParameter.PATH,
+                description='ID of the vehicle',
+                required=True,
+                type=int
+            ),
+            OpenApiParameter(
+                name='from',
+                location=OpenApiParameter.QUERY,
+                description='First day of the calendar (YYYY-MM-DD format), defaults to today',
+                required=False,
+                type=str
+            ),
+            OpenApiParameter(
+                name='days',
+                location=OpenApiParameter.QUERY,
+                description=f'Number of days to return (1-{MAX_CALENDAR_DAYS}), defaults to 30',
+                required=False,
+                type=int
+            )
+        ],
+        responses={
+            200: None,
+            404: None,
+        },
+        examples=[
+            vehicle_calendar_success_example,
+            vehicle_calendar_not_found_example
+        ]
+    )
+    def get(self, request, vehicle_id):
+        from_day = request.query_params.get("from")
+        days = request.query_params.get("days", "30")
+
+        try:
+            from_day = datetime.strptime(from_day, "%Y-%m-%d").date() if from_day else timezone.now().date()
+        except ValueError:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="From date must be in YYYY-MM-DD format",
+            )
+
+        if not days.isdigit() or not 1 <= int(days) <= MAX_CALENDAR_DAYS:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"Days must be between 1 and {MAX_CALENDAR_DAYS}",
+            )
+
+        calendar, has_bookings = get_calendar(vehicle_id, from_day, int(days))
+        # Only an all-free calendar needs the extra lookup to tell an idle
+        # vehicle from a missing one.
+        if not has_bookings and not Vehicle.objects.filter(id=vehicle_id).exists():
+            return SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="Vehicle not found",
+            )
+
+        return SuccessResponse(
+            status_code=status.HTTP_200_OK,
+            data={"vehicle_id": vehicle_id, "days": calendar},
+            message="Vehicle calendar retrieved successfully",
+        )
@@ -4,10 +4,13 @@ from rest_framework import status
 from apps.booking.models.booking import Booking
 from apps.vehicle.models.vehicle import Vehicle
 from apps.vehicle.serializers.vehicle_serializer import VehicleSerializer
+from apps.vehicle.services.vehicle_cache import cache_status, vehicle_cache
 from constants.common_status import CommonStatus
 from utils.custom_responses import SuccessResponse
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from .open_api_schemas import (
+    vehicle_detail_success_example,
+    vehicle_detail_not_found_example,
     vehicle_update_success_example,
     vehicle_update_not_found_example,
     vehicle_delete_success_example,
@@ -19,6 +22,50 @@ from .open_api_schemas import (
 class VehicleDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @extend_schema(
+        summary="Get a vehicle",
+        description="Retrieve one of the authenticated user's vehicles",
+        parameters=[
+            OpenApiParameter(
+                name='vehicle_id',
+                location=OpenApiParameter.PATH,
+                description='ID of the vehicle to retrieve',
+                required=True,
+                type=int
+            )
+        ],
+        responses={
+            200: VehicleSerializer,
+            404: None,
+        },
+        examples=[
+            vehicle_detail_success_example,
+            vehicle_detail_not_found_example
+        ]
+    )
+    def get(self, request, vehicle_id):
+        user = request.user
+
+        def load_vehicle():
+            vehicle = Vehicle.objects.filter(id=vehicle_id, user_id=user.id).first()
+            return VehicleSerializer().to_representation(vehicle) if vehicle else None
+
+        vehicle, hit = vehicle_cache.get_or_set(user.id, f"vehicle:{vehicle_id}", load_vehicle)
+        if not vehicle:
+            response = SuccessResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                data=None,
+                message="Vehicle not found",
+            )
+        else:
+            response = SuccessResponse(
+                status_code=status.HTTP_200_OK,
+                data=vehicle,
+                message="Vehicle retrieved successfully",
+            )
+        response["X-Cache"] = cache_status(hit)
+        return response
+
     @extend_schema(
         summary="Update a vehicle",
         description="Update vehicle details for the authenticated user's vehicle",
@@ -43,7 +90,7 @@ class VehicleDetailView(APIView):
     )
     def put(self, request, vehicle_id):
         user = request.user
-        vehicle = Vehicle.objects.filter(id=vehicle_id, user=user).first()
+        vehicle = Vehicle.objects.filter(id=vehicle_id, user_id=user.id).first()
         if not vehicle:
             return SuccessResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -85,7 +132,7 @@ class VehicleDetailView(APIView):
     )
     def delete(self, request, vehicle_id):
         user = request.user
-        vehicle = Vehicle.objects.filter(id=vehicle_id, user=user).first()
+        vehicle = Vehicle.objects.filter(id=vehicle_id, user_id=user.id).first()
         if not vehicle:
             return SuccessResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -94,8 +141,7 @@ class VehicleDetailView(APIView):
             )
         
         # Ensure the vehicle is not booked before deletion
-        booking = Booking.objects.filter(vehicle_id=vehicle.pk, status=CommonStatus.ACTIVE.value).first()
-        if booking:
+        if Booking.objects.filter(vehicle_id=vehicle.pk, status=CommonStatus.ACTIVE.value).exists():
             return SuccessResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 data=None,
@@ -103,6 +149,7 @@ class VehicleDetailView(APIView):
             )
     
         vehicle.delete()
+        vehicle_cache.invalidate(user.id)
         return SuccessResponse(
             status_code=status.HTTP_200_OK,
             data=None,
@@ -0,0 +1,90 @@
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from apps.vehicle.services.vehicle_import import (
+    IMPORT_FORMATS,
+    VehicleImportError,
+    import_vehicles,
+    parse_vehicle_file,
+)
+from utils.custom_responses import ErrorResponse, SuccessResponse
+from utils.error_handler import CustomAPIException
+from drf_spectacular.utils import extend_schema
+from .open_api_schemas import (
+    vehicle_import_payload_schema,
+    vehicle_import_success_example,
+    vehicle_import_invalid_file_example,
+)
+
+
+class VehicleImportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Import vehicles in bulk",
+        description=(
+            "Add many vehicles to the authenticated user's account from an uploaded CSV or "
+            "JSON file, or a JSON `vehicles` list. Valid rows are created; every row gets an "
+            "entry in the report saying whether it was imported and why not."
+        ),
+        request=vehicle_import_payload_schema,
+        responses={
+            201: None,
+            400: None,
+        },
+        examples=[
+            vehicle_import_success_example,
+            vehicle_import_invalid_file_example,
+        ]
+    )
+    def post(self, request):
+        rows = self._read_rows(request)
+        if not rows:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="No vehicles to import",
+            )
+        if len(rows) > settings.VEHICLE_IMPORT_MAX_ROWS:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"An import can contain at most {settings.VEHICLE_IMPORT_MAX_ROWS} vehicles",
+            )
+
+        results, created = import_vehicles(request.user.id, rows, settings.VEHICLE_IMPORT_CHUNK_SIZE)
+        if not created:
+            return ErrorResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                data=results,
+                message="No vehicles were imported",
+            )
+        return SuccessResponse(
+            status_code=status.HTTP_201_CREATED,
+            data=results,
+            message=f"{created} of {len(rows)} vehicles imported successfully",
+        )
+
+    def _read_rows(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            rows = request.data.get("vehicles")
+            if not isinstance(rows, list):
+                raise CustomAPIException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Upload a CSV or JSON file, or send a vehicles list",
+                )
+            return rows
+
+        import_format = request.data.get("format") or upload.name.rsplit(".", 1)[-1].lower()
+        if import_format not in IMPORT_FORMATS:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message="Format must be one of: " + ", ".join(IMPORT_FORMATS),
+            )
+        try:
+            return parse_vehicle_file(upload.read(), import_format)
+        except VehicleImportError as error:
+            raise CustomAPIException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=str(error),
+            )
@@ -4,7 +4,9 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from apps.vehicle.serializers.vehicle_serializer import VehicleSerializer
-from utils.custom_responses import SuccessResponse
+from apps.vehicle.services.vehicle_cache import cache_status, vehicle_cache
+from utils.custom_responses import PaginatedResponse, SuccessResponse
+from utils.pagination import get_page_size, paginate_by_created_at
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from .open_api_schemas import (
     vehicle_create_success_example,
@@ -45,7 +47,23 @@ class VehicleView(APIView):
     
     @extend_schema(
         summary="Get user vehicles",
-        description="Retrieve all vehicles belonging to the authenticated user",
+        description="Retrieve the authenticated user's vehicles newest first, one cursor page at a time",
+        parameters=[
+            OpenApiParameter(
+                name='cursor',
+                location=OpenApiParameter.QUERY,
+                description='Opaque cursor returned as `next` by the previous page',
+                required=False,
+                type=str
+            ),
+            OpenApiParameter(
+                name='page_size',
+                location=OpenApiParameter.QUERY,
+                description='Number of vehicles per page',
+                required=False,
+                type=int
+            )
+        ],
         responses={
             200: VehicleSerializer,
             404: None,
@@ -57,16 +75,27 @@ class VehicleView(APIView):
     )
     def get(self, request):
         user = request.user
-        vehicles = Vehicle.objects.filter(user=user)
-        if not vehicles.exists():
-            return SuccessResponse(
+
+        def load_page():
+            vehicles, next_cursor = paginate_by_created_at(
+                Vehicle.objects.filter(user_id=user.id).values(*VehicleSerializer.row_fields), request
+            )
+            return list(VehicleSerializer(vehicles, many=True).data), next_cursor
+
+        page_key = f"list:{get_page_size(request)}:{request.query_params.get('cursor', '')}"
+        (vehicles, next_cursor), hit = vehicle_cache.get_or_set(user.id, page_key, load_page)
+        if not vehicles:
+            response = SuccessResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 data=[],
                 message="No vehicles",
             )
-        serializer = VehicleSerializer(vehicles, many=True)
-        return SuccessResponse(
-            status_code=status.HTTP_200_OK,
-            data=serializer.data,
-            message="Vehicles retrieved successfully",
-        )
+        else:
+            response = PaginatedResponse(
+                status_code=status.HTTP_200_OK,
+                data=vehicles,
+                next_cursor=next_cursor,
+                message="Vehicles retrieved successfully",
+            )
+        response["X-Cache"] = cache_status(hit)
+        return response
@@ -0,0 +1,142 @@
+"""Stream generated rows into Postgres with ``COPY FROM STDIN``.
+
+Rows carry explicit primary keys taken from ``reserve_ids`` so that related
+rows can point at them without a round trip, and the sequences are moved
+past the loaded ids afterwards. ``deferred_indexes`` drops secondary
+indexes, unique/exclusion constraints and foreign keys for the duration of a
+load and recreates them afterwards, which builds each index once and checks
+each constraint in a single pass instead of row by row. User triggers, such
+as the bookings overlap check, are disabled for the load: generated rows are
+built not to conflict.
+"""
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from django.db import connection
+
+# Constraint types recreated after a load; primary keys and CHECKs stay.
+DEFERRED_CONSTRAINT_TYPES = ("f", "u", "x")
+
+# Tables the synthetic loaders fill, in dependency order, and their columns.
+LOADED_TABLES = ("users", "vehicles", "bookings")
+USER_COLUMNS = ("id", "email", "password", "first_name", "last_name", "phone", "status",
+                "email_verified", "phone_verified", "created_at", "updated_at")
+VEHICLE_COLUMNS = ("id", "user_id", "make", "model", "year", "plate", "created_at", "updated_at")
+BOOKING_COLUMNS = ("id", "user_id", "vehicle_id", "start_date", "end_date", "status", "created_at", "updated_at")
+
+
+def copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    # Generated values never contain tabs, newlines or backslashes.
+    return str(value)
+
+
+class RowStream:
+    """File-like view over an iterable of row tuples in COPY text format."""
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = b""
+        self.rows = 0
+
+    def read(self, size=-1):
+        size = 1 << 16 if size is None or size < 0 else size
+        lines = [self._buffer]
+        length = len(self._buffer)
+        for row in self._rows:
+            line = ("\t".join(copy_value(value) for value in row) + "\n").encode()
+            lines.append(line)
+            length += len(line)
+            self.rows += 1
+            if length >= size:
+                break
+        data = b"".join(lines)
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def copy_rows(table, columns, rows):
+    """COPY ``rows`` (tuples ordered like ``columns``) into ``table``; returns the row count."""
+    stream = RowStream(rows)
+    sql = f"COPY {connection.ops.quote_name(table)} ({', '.join(map(connection.ops.quote_name, columns))}) FROM STDIN"
+    with connection.cursor() as cursor:
+        if hasattr(cursor.cursor, "copy_expert"):
+            cursor.copy_expert(sql, stream)
+        else:
+            # psycopg 3, in use when the connection pool is enabled.
+            with cursor.copy(sql) as copy:
+                while data := stream.read():
+                    copy.write(data)
+    return stream.rows
+
+
+def reserve_ids(table):
+    """Return the highest id in ``table``; the caller loads ids above it."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {connection.ops.quote_name(table)}")
+        return cursor.fetchone()[0]
+
+
+def sync_sequence(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT setval(pg_get_serial_sequence(%s, 'id'), GREATEST(MAX(id), 1), MAX(id) IS NOT NULL) "
+            f"FROM {connection.ops.quote_name(table)}",
+            [table],
+        )
+
+
+@contextmanager
+def deferred_indexes(tables):
+    """Drop and afterwards recreate the secondary indexes and constraints of ``tables``.
+
+    Must run inside a transaction: the tables stay locked for the whole load
+    and a failure restores every dropped definition.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid), contype FROM pg_constraint "
+            "WHERE conrelid = ANY(%s::regclass[]) AND contype = ANY(%s) "
+            "ORDER BY contype = 'f' DESC",
+            [list(tables), list(DEFERRED_CONSTRAINT_TYPES)],
+        )
+        constraints = cursor.fetchall()
+        for table, name, _, _ in constraints:
+            cursor.execute(f"ALTER TABLE {table} DROP CONSTRAINT {connection.ops.quote_name(name)}")
+
+        cursor.execute(
+            "SELECT idx.indexrelid::regclass::text, pg_get_indexdef(idx.indexrelid) FROM pg_index idx "
+            "WHERE idx.indrelid = ANY(%s::regclass[]) AND NOT idx.indisprimary "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = idx.indexrelid)",
+            [list(tables)],
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {name}")
+
+        cursor.execute(
+            "SELECT tgrelid::regclass::text, tgname FROM pg_trigger "
+            "WHERE tgrelid = ANY(%s::regclass[]) AND NOT tgisinternal AND tgenabled <> 'D'",
+            [list(tables)],
+        )
+        triggers = cursor.fetchall()
+        for table, name in triggers:
+            cursor.execute(f"ALTER TABLE {table} DISABLE TRIGGER {connection.ops.quote_name(name)}")
+
+    yield
+
+    with connection.cursor() as cursor:
+        for table, name in triggers:
+            cursor.execute(f"ALTER TABLE {table} ENABLE TRIGGER {connection.ops.quote_name(name)}")
+        for _, definition in indexes:
+            # Indexes of a partitioned table are defined ON ONLY the parent;
+            # recreate them on every partition.
+            cursor.execute(definition.replace(" ON ONLY ", " ON ", 1))
+        # Unique and exclusion constraints first, since foreign keys may rely on them.
+        for table, name, definition, _ in reversed(constraints):
+            cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {connection.ops.quote_name(name)} {definition}")
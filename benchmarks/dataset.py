@@ -0,0 +1,141 @@
+"""Deterministic synthetic fleet for the benchmark suite.
+
+The same scale and seed always produce the same users, vehicles and
+bookings, anchored at a fixed date rather than "now", so two runs weeks apart
+exercise identical data. Everything seeded here uses the ``benchmark.local``
+email domain; run the suite against a dedicated database.
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import connection, transaction
+
+from apps.booking.models import Booking, VehicleCalendarDay
+from apps.booking.services.calendar import mark_loaded
+from apps.booking.services.partitions import ensure_partitions
+from apps.user.models import User
+from apps.user.serializers.user_serializer import hash_password
+from apps.vehicle.models import Vehicle
+from benchmarks.copy_loader import (
+    BOOKING_COLUMNS,
+    LOADED_TABLES,
+    USER_COLUMNS,
+    VEHICLE_COLUMNS,
+    copy_rows,
+    deferred_indexes,
+    reserve_ids,
+    sync_sequence,
+)
+from constants.common_status import CommonStatus
+
+EMAIL_DOMAIN = "benchmark.local"
+BENCHMARK_PASSWORD = "benchmark-password"
+ANCHOR = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+MAKES = (("Toyota", "Corolla"), ("Honda", "Civic"), ("Kia", "Rio"), ("Ford", "Focus"), ("Tesla", "Model 3"))
+# Every booking sits in its own two-day slot on its vehicle, so active
+# bookings never trip the overlap constraint.
+SLOT = timedelta(days=2)
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    users: int
+    vehicles: int
+    bookings: int
+
+    @property
+    def vehicles_per_user(self):
+        return self.vehicles // self.users
+
+    @property
+    def bookings_per_vehicle(self):
+        return self.bookings // self.vehicles
+
+
+SCALES = {
+    "tiny": DatasetScale(users=100, vehicles=1_000, bookings=10_000),
+    "small": DatasetScale(users=1_000, vehicles=10_000, bookings=100_000),
+    "medium": DatasetScale(users=10_000, vehicles=100_000, bookings=1_000_000),
+    "large": DatasetScale(users=100_000, vehicles=1_000_000, bookings=10_000_000),
+}
+
+
+def user_email(index):
+    return f"bench-{index}@{EMAIL_DOMAIN}"
+
+
+def benchmark_users():
+    return User.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}")
+
+
+def dataset_exists(scale):
+    return benchmark_users().count() == scale.users
+
+
+def drop_dataset():
+    users = benchmark_users()
+    Booking.objects.filter(vehicle__user__in=users).delete()
+    Booking.objects.filter(user__in=users).delete()
+    VehicleCalendarDay.objects.filter(vehicle__user__in=users).delete()
+    Vehicle.objects.filter(user__in=users).delete()
+    users.delete()
+
+
+def booking_window(scale):
+    """Bounds of the two-day slots every vehicle's bookings are laid out in."""
+    first = ANCHOR - SLOT * (scale.bookings_per_vehicle // 2)
+    return first, first + SLOT * scale.bookings_per_vehicle
+
+
+def booking_slots(scale, rng):
+    """Yield ``(start, end, status)`` for one vehicle, half before the anchor."""
+    first, _ = booking_window(scale)
+    for slot in range(scale.bookings_per_vehicle):
+        start = first + SLOT * slot + timedelta(hours=rng.randrange(12))
+        end = start + timedelta(hours=rng.randrange(4, 31))
+        status = CommonStatus.COMPLETED if end < ANCHOR else CommonStatus.ACTIVE
+        yield start, end, status.value
+
+
+def seed_dataset(scale, seed=0, log=None):
+    """COPY ``scale`` worth of users, vehicles and bookings in and mark the calendars."""
+    log = log or (lambda message: None)
+    rng = random.Random(seed)
+    password = hash_password(BENCHMARK_PASSWORD)
+    created = ANCHOR - timedelta(days=365)
+
+    with transaction.atomic():
+        user_base, vehicle_base, booking_base = (reserve_ids(table) for table in LOADED_TABLES)
+        ensure_partitions(*booking_window(scale))
+        with deferred_indexes(LOADED_TABLES):
+            users = copy_rows("users", USER_COLUMNS, (
+                (user_base + 1 + index, user_email(index), password, "Bench", str(index), "0000000000", 1,
+                 False, False, created, created)
+                for index in range(scale.users)
+            ))
+            log(f"{users} users")
+
+            vehicles = copy_rows("vehicles", VEHICLE_COLUMNS, (
+                (vehicle_base + 1 + index, user_base + 1 + index % scale.users, *MAKES[index % len(MAKES)],
+                 2010 + index % 15, f"BM{index:07d}", created, created)
+                for index in range(scale.vehicles)
+            ))
+            log(f"{vehicles} vehicles")
+
+            def booking_rows():
+                booking_id = booking_base
+                for vehicle_id in range(vehicle_base + 1, vehicle_base + 1 + scale.vehicles):
+                    for start, end, status in booking_slots(scale, rng):
+                        booking_id += 1
+                        booker = user_base + 1 + rng.randrange(scale.users)
+                        yield booking_id, booker, vehicle_id, start, end, status, created, created
+
+            log(f"{copy_rows('bookings', BOOKING_COLUMNS, booking_rows())} bookings")
+
+        for table in LOADED_TABLES:
+            sync_sequence(table)
+        mark_loaded(booking_base)
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users, vehicles, bookings, vehicle_calendar_days")
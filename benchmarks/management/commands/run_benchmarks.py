@@ -0,0 +1,75 @@
+import json
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.dataset import SCALES, benchmark_users, dataset_exists, drop_dataset, seed_dataset
+from benchmarks.runner import compare, run, run_metadata
+from benchmarks.scenarios import build_scenarios, uncovered_urls
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a deterministic dataset, send every API scenario through the test client and "
+        "record p50/p95/p99 latency and queries per request as JSON. With --baseline, fail "
+        "when a scenario regressed against a stored run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", choices=list(SCALES), default="small", help="Dataset size")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for the dataset")
+        parser.add_argument("--reseed", action="store_true",
+                            help="Drop the benchmark dataset and seed it again")
+        parser.add_argument("--iterations", type=int, default=50, help="Measured requests per scenario")
+        parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per scenario")
+        parser.add_argument("--only", help="Regex; only run scenarios whose name matches")
+        parser.add_argument("--output", default=str(settings.BASE_DIR / "benchmarks" / "results" / "latest.json"),
+                            help="Where to write the results")
+        parser.add_argument("--baseline", help="Results file to compare against")
+        parser.add_argument("--threshold", type=float, default=0.2,
+                            help="Allowed relative p95 growth before a scenario counts as a regression")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        scale = SCALES[options["scale"]]
+        if options["reseed"]:
+            self.stdout.write("Dropping the benchmark dataset")
+            drop_dataset()
+        if not dataset_exists(scale):
+            if benchmark_users().exists():
+                raise CommandError("A benchmark dataset of another scale exists, pass --reseed")
+            self.stdout.write(f"Seeding the {options['scale']} dataset")
+            seed_dataset(scale, seed=options["seed"], log=lambda message: self.stdout.write(f"  {message}"))
+
+        all_scenarios, user = build_scenarios()
+        scenarios = all_scenarios
+        if options["only"]:
+            pattern = re.compile(options["only"])
+            scenarios = [scenario for scenario in all_scenarios if pattern.search(scenario.name)]
+
+        results = {
+            "meta": run_metadata(options["scale"], scale, options["seed"], options["iterations"], options["warmup"]),
+            "results": run(scenarios, user, options["iterations"], options["warmup"], log=self.stdout.write),
+            "uncovered_urls": uncovered_urls(all_scenarios),
+        }
+        for name in results["uncovered_urls"]:
+            self.stderr.write(self.style.WARNING(f"No benchmark scenario for URL {name!r}"))
+
+        output = Path(options["output"])
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2) + "\n")
+        self.stdout.write(f"Results written to {output}")
+
+        if options["baseline"]:
+            baseline = json.loads(Path(options["baseline"]).read_text())
+            regressions = compare(baseline, results, options["threshold"])
+            for regression in regressions:
+                self.stderr.write(self.style.ERROR(regression))
+            if regressions:
+                raise CommandError(f"{len(regressions)} regressions against {options['baseline']}")
+            self.stdout.write(self.style.SUCCESS(f"No regressions against {options['baseline']}"))
+
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.startup import format_tree, profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot the WSGI application in a fresh interpreter under -X importtime, send it one "
+        "request and report the import tree, the boot time and the time to the first response."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/healthz", help="Path of the first request")
+        parser.add_argument("--min-ms", type=float, default=5.0,
+                            help="Hide modules whose cumulative import time is below this")
+        parser.add_argument("--depth", type=int, default=4, help="Levels of the import tree to show")
+
+    def handle(self, *args, **options):
+        try:
+            timings, roots = profile_startup(options["path"])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        for line in format_tree(roots, options["min_ms"], options["depth"]):
+            self.stdout.write(line)
+        imports_ms = sum(root.cumulative_us for root in roots) / 1000
+        self.stdout.write("")
+        self.stdout.write(f"Imports:       {imports_ms:8.1f} ms")
+        self.stdout.write(f"Boot:          {timings['boot'] * 1000:8.1f} ms (import config.wsgi)")
+        self.stdout.write(
+            f"First request: {timings['first_request'] * 1000:8.1f} ms ({options['path']} -> {timings['status']})"
+        )
@@ -0,0 +1,178 @@
+"""Time scenarios in-process and compare runs.
+
+Every request runs inside a transaction that is rolled back, so writes leave
+the dataset untouched and each iteration sees the same rows. Views that open
+their own transaction therefore issue a savepoint, which shows up in the
+query counts of write scenarios. ``bookings_partitions`` is the most
+partitions of ``bookings`` a scenario's queries plan to read once pruned.
+"""
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone as dt_timezone
+
+import django
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+
+from apps.booking.services.partitions import scanned_partitions
+from apps.user.services.token_service import issue_tokens
+
+RESULTS_VERSION = 1
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def send(client, scenario, headers):
+    if isinstance(client, AsyncClient):
+        return async_to_sync(asend)(client, scenario, headers)
+    method = getattr(client, scenario.method.lower())
+    if scenario.method == "GET":
+        response = method(scenario.path, scenario.data, headers=headers)
+    else:
+        response = method(scenario.path, json.dumps(scenario.data), content_type="application/json", headers=headers)
+    # Streaming bodies are produced lazily; reading them is part of the request.
+    if response.streaming:
+        b"".join(response.streaming_content)
+    return response
+
+
+async def asend(client, scenario, headers):
+    method = getattr(client, scenario.method.lower())
+    if scenario.method == "GET":
+        response = await method(scenario.path, scenario.data, headers=headers)
+    else:
+        response = await method(
+            scenario.path, json.dumps(scenario.data), content_type="application/json", headers=headers
+        )
+    # An async view's stream is bound to the event loop that served it, so it
+    # is read here; iterating the response handles sync streams as well.
+    if response.streaming:
+        b"".join([chunk async for chunk in response])
+    return response
+
+
+def partitions_scanned(captured_queries):
+    counts = []
+    with connection.cursor() as cursor:
+        for query in captured_queries:
+            if query["sql"].lstrip().upper().startswith("SELECT") and '"bookings"' in query["sql"]:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {query['sql']}")
+                counts.append(len(scanned_partitions(cursor.fetchone()[0][0]["Plan"])))
+    return max(counts, default=None)
+
+
+def measure(client, scenario, iterations, warmup, headers):
+    latencies = []
+    queries = []
+    status_codes = {}
+    for iteration in range(warmup + iterations):
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = send(client, scenario, headers)
+                elapsed = time.perf_counter() - started
+            transaction.set_rollback(True)
+        if iteration < warmup:
+            continue
+        latencies.append(elapsed * 1000)
+        queries.append(len(captured.captured_queries))
+        status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+
+    latencies.sort()
+    return {
+        "name": scenario.name,
+        "url_name": scenario.url_name,
+        "method": scenario.method,
+        "path": scenario.path,
+        "iterations": iterations,
+        "status_codes": {str(code): count for code, count in sorted(status_codes.items())},
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "queries_per_request": round(statistics.fmean(queries), 2),
+        "max_queries": max(queries),
+        "bookings_partitions": partitions_scanned(captured.captured_queries),
+    }
+
+
+def run(scenarios, user, iterations, warmup, log=None):
+    log = log or (lambda message: None)
+    # The async views are driven through AsyncClient, as an ASGI server would.
+    client = AsyncClient() if settings.ASYNC_API_VIEWS else Client()
+    headers = {"Authorization": f"Bearer {issue_tokens(user)['access_token']}"}
+    results = []
+    for scenario in scenarios:
+        result = measure(client, scenario, iterations, warmup, headers)
+        partitions = result["bookings_partitions"]
+        log(f"{result['name']:<40} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+            f"p99 {result['p99_ms']:>9.2f} ms  {result['queries_per_request']:>6.1f} queries"
+            + (f"  {partitions} partitions" if partitions is not None else ""))
+        results.append(result)
+    return results
+
+
+def git_revision():
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=settings.BASE_DIR
+        )
+    except OSError:
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_metadata(scale_name, scale, seed, iterations, warmup):
+    return {
+        "version": RESULTS_VERSION,
+        "started_at": datetime.now(dt_timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "scale": scale_name,
+        "users": scale.users,
+        "vehicles": scale.vehicles,
+        "bookings": scale.bookings,
+        "seed": seed,
+        "iterations": iterations,
+        "warmup": warmup,
+        "async_api_views": settings.ASYNC_API_VIEWS,
+    }
+
+
+def compare(baseline, current, threshold, min_delta_ms=1.0):
+    """Return one message per scenario that got slower, issues more queries or reads more partitions.
+
+    A latency regression needs the p95 to grow by more than ``threshold`` (a
+    fraction) and by at least ``min_delta_ms``, which keeps sub-millisecond
+    noise on fast endpoints out of the report.
+    """
+    previous = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get(result["name"])
+        if before is None:
+            continue
+        delta = result["p95_ms"] - before["p95_ms"]
+        if delta > before["p95_ms"] * threshold and delta >= min_delta_ms:
+            regressions.append(
+                f"{result['name']}: p95 {before['p95_ms']:.2f} ms -> {result['p95_ms']:.2f} ms"
+            )
+        if result["max_queries"] > before["max_queries"]:
+            regressions.append(
+                f"{result['name']}: queries {before['max_queries']} -> {result['max_queries']}"
+            )
+        # Older result files predate partition counts.
+        partitions, partitions_before = result.get("bookings_partitions"), before.get("bookings_partitions")
+        if partitions is not None and partitions_before is not None and partitions > partitions_before:
+            regressions.append(f"{result['name']}: bookings partitions {partitions_before} -> {partitions}")
+    return regressions
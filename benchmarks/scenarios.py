@@ -0,0 +1,119 @@
+"""Requests the suite sends, one or more per named URL.
+
+``uncovered_urls`` lists every named route in the URLconf that has no
+scenario, so a new endpoint shows up in the results until one is added here.
+"""
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from apps.user.models import User
+from apps.user.services.token_service import issue_tokens
+from apps.vehicle.models import Vehicle
+from benchmarks.dataset import ANCHOR, BENCHMARK_PASSWORD, EMAIL_DOMAIN, user_email
+from utils.schema import source_fingerprint
+
+# Django's and DRF's own pages and the metrics scrape endpoint, not part of this API.
+SKIPPED_PREFIXES = ("admin/", "api-auth/", "metrics")
+
+
+@dataclass
+class Scenario:
+    url_name: str
+    label: str
+    method: str
+    path: str
+    data: dict = field(default_factory=dict)
+
+    @property
+    def name(self):
+        return f"{self.url_name}:{self.label}"
+
+
+def named_urls(patterns=None, prefix=""):
+    """Map each route name to its full route string."""
+    urls = {}
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            urls.update(named_urls(pattern.url_patterns, route))
+        elif isinstance(pattern, URLPattern) and pattern.name and not route.startswith(SKIPPED_PREFIXES):
+            urls[pattern.name] = route
+    return urls
+
+
+def uncovered_urls(scenarios):
+    covered = {scenario.url_name for scenario in scenarios}
+    return sorted(name for name in named_urls() if name not in covered)
+
+
+def day(value):
+    return value.strftime("%Y-%m-%d")
+
+
+def minute(value):
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def build_scenarios():
+    """Return the scenarios and the seeded user they authenticate as."""
+    user = User.objects.get(email=user_email(0))
+    vehicle_ids = list(Vehicle.objects.filter(user=user).order_by("id").values_list("id", flat=True)[:2])
+    vehicle_id = vehicle_ids[0]
+    future = (ANCHOR + timedelta(days=3650)).replace(hour=10)
+    window_start = ANCHOR + timedelta(days=1, hours=2)
+
+    return [
+        Scenario("user-register", "new user", "POST", "/api/v1/user/register", {
+            "email": f"bench-new@{EMAIL_DOMAIN}",
+            "password": BENCHMARK_PASSWORD,
+            "first_name": "Bench",
+            "last_name": "New",
+            "phone": "0000000000",
+        }),
+        Scenario("user-login", "valid password", "POST", "/api/v1/user/login",
+                 {"email": user.email, "password": BENCHMARK_PASSWORD}),
+        Scenario("user-token-refresh", "rotate", "POST", "/api/v1/user/token/refresh",
+                 {"refresh_token": issue_tokens(user)["refresh_token"]}),
+        Scenario("vehicle", "list", "GET", "/api/v1/vehicle"),
+        Scenario("vehicle", "create", "POST", "/api/v1/vehicle",
+                 {"make": "Bench", "model": "Mark", "year": 2024, "plate": "BENCH-NEW"}),
+        Scenario("vehicle_available", "window", "GET", "/api/v1/vehicle/available",
+                 {"start": minute(window_start), "end": minute(window_start + timedelta(hours=6))}),
+        Scenario("vehicle_available", "window by make", "GET", "/api/v1/vehicle/available",
+                 {"start": minute(window_start), "end": minute(window_start + timedelta(hours=6)), "make": "Kia"}),
+        Scenario("vehicle_import", "100 rows", "POST", "/api/v1/vehicle/import", {"vehicles": [
+            {"make": "Bench", "model": "Mark", "year": 2024, "plate": f"BENCH-IMPORT-{index}"}
+            for index in range(100)
+        ]}),
+        Scenario("vehicle_detail", "get", "GET", f"/api/v1/vehicle/{vehicle_id}"),
+        Scenario("vehicle_detail", "update", "PUT", f"/api/v1/vehicle/{vehicle_id}", {"model": "Updated"}),
+        Scenario("vehicle_detail", "delete", "DELETE", f"/api/v1/vehicle/{vehicle_ids[-1]}"),
+        Scenario("vehicle_calendar", "30 days", "GET", f"/api/v1/vehicle/{vehicle_id}/calendar",
+                 {"from": day(ANCHOR), "days": 30}),
+        Scenario("booking", "list", "GET", "/api/v1/booking"),
+        Scenario("booking", "list from", "GET", "/api/v1/booking", {"from": day(ANCHOR)}),
+        Scenario("booking", "stream", "GET", "/api/v1/booking", {"stream": 1}),
+        Scenario("booking", "create", "POST", "/api/v1/booking", {
+            "vehicle_id": vehicle_id,
+            "start_date": minute(future),
+            "end_date": minute(future + timedelta(hours=5)),
+        }),
+        Scenario("booking_batch", "10 items", "POST", "/api/v1/booking/batch", {"bookings": [
+            {
+                "vehicle_id": vehicle_id,
+                "start_date": minute(future + timedelta(days=index + 1)),
+                "end_date": minute(future + timedelta(days=index + 1, hours=5)),
+            }
+            for index in range(10)
+        ]}),
+        Scenario("booking_export", "30 days ndjson", "GET", "/api/v1/booking/export",
+                 {"from": day(ANCHOR), "to": day(ANCHOR + timedelta(days=30))}),
+        Scenario("booking_export", "30 days csv gzip", "GET", "/api/v1/booking/export",
+                 {"from": day(ANCHOR), "to": day(ANCHOR + timedelta(days=30)), "format": "csv", "gzip": 1}),
+        Scenario("schema", "openapi", "GET", "/api/schema/"),
+        Scenario("schema-versioned", "openapi", "GET", f"/api/schema/{source_fingerprint()}/"),
+        Scenario("swagger-ui", "page", "GET", "/api/docs/"),
+        Scenario("healthz", "probe", "GET", "/healthz"),
+    ], user
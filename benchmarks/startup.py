@@ -0,0 +1,89 @@
+"""Worker boot cost: import time per module and time to the first response.
+
+``profile_startup`` boots the WSGI application the way gunicorn does, in a
+fresh interpreter under ``-X importtime``, then sends it one request. The
+import log is parsed back into a tree so the modules that dominate boot can
+be read off without wading through thousands of lines.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Runs in the child: what a worker does between exec and its first response.
+BOOT_SCRIPT = """
+import json, sys, time
+from wsgiref.util import setup_testing_defaults
+started = time.perf_counter()
+from config.wsgi import application
+booted = time.perf_counter()
+environ = {"PATH_INFO": sys.argv[1], "SERVER_NAME": "localhost"}
+setup_testing_defaults(environ)
+status = []
+b"".join(application(environ, lambda line, headers, exc_info=None: status.append(line)))
+answered = time.perf_counter()
+print(json.dumps({"boot": booted - started, "first_request": answered - booted, "status": status[0]}))
+"""
+
+
+@dataclass
+class ImportNode:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list = field(default_factory=list)
+
+
+def parse_importtime(lines):
+    """Build the import tree from ``-X importtime`` output; returns the root nodes."""
+    # Modules are logged after everything they import, one indent level deeper.
+    pending = []
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = ImportNode(name, int(self_us), int(cumulative_us))
+        while pending and pending[-1][0] > depth:
+            node.children.append(pending.pop()[1])
+        node.children.reverse()
+        pending.append((depth, node))
+    return [node for _, node in pending]
+
+
+def format_tree(roots, min_ms=5.0, max_depth=4):
+    lines = []
+
+    def visit(node, depth):
+        if node.cumulative_us < min_ms * 1000 or depth >= max_depth:
+            return
+        lines.append(f"{node.cumulative_us / 1000:9.1f} {node.self_us / 1000:8.1f}  {'  ' * depth}{node.name}")
+        for child in sorted(node.children, key=lambda child: -child.cumulative_us):
+            visit(child, depth + 1)
+
+    lines.append(f"{'cum ms':>9} {'self ms':>8}  module")
+    for root in sorted(roots, key=lambda root: -root.cumulative_us):
+        visit(root, 0)
+    return lines
+
+
+def profile_startup(path="/healthz"):
+    """Boot a fresh worker and return ``(timings, import tree roots)``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT, path],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Worker failed to boot:\n{result.stderr[-4000:]}")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    return timings, parse_importtime(result.stderr.splitlines())
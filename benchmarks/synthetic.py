@@ -0,0 +1,160 @@
+"""Production-shaped synthetic data for load testing and plan analysis.
+
+Owner fleet sizes and booking activity follow a Zipf-like skew, every
+vehicle's bookings are laid out in disjoint slots so none overlap, and
+statuses follow the booking's position relative to ``now``: past bookings
+are mostly completed with some cancelled, upcoming ones mostly active with
+some still pending.
+"""
+import math
+import random
+import time
+from contextlib import nullcontext
+from datetime import timedelta
+from itertools import accumulate
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.booking.services.calendar import mark_loaded
+from apps.booking.services.partitions import ensure_partitions
+from apps.user.serializers.user_serializer import hash_password
+from benchmarks.copy_loader import (
+    BOOKING_COLUMNS,
+    LOADED_TABLES,
+    USER_COLUMNS,
+    VEHICLE_COLUMNS,
+    copy_rows,
+    deferred_indexes,
+    reserve_ids,
+    sync_sequence,
+)
+from benchmarks.dataset import MAKES
+from constants.common_status import CommonStatus
+
+SEED_EMAIL_DOMAIN = "seed.local"
+SEED_PASSWORD = "seed-password"
+MINUTE = timedelta(minutes=1)
+
+
+def zipf_weights(count, skew):
+    """Cumulative weights giving rank ``r`` a share proportional to ``1 / (r + 1) ** skew``."""
+    return list(accumulate(1 / (rank + 1) ** skew for rank in range(count)))
+
+
+def booking_status(rng, start, end, now):
+    if end < now:
+        return (CommonStatus.INACTIVE if rng.random() < 0.1 else CommonStatus.COMPLETED).value
+    if start > now and rng.random() < 0.15:
+        return CommonStatus.PENDING.value
+    return CommonStatus.ACTIVE.value
+
+
+class SyntheticLoad:
+    def __init__(self, users, vehicles, bookings, seed=0, history_days=730, horizon_days=90, skew=0.8, now=None):
+        self.users = users
+        self.vehicles = vehicles
+        self.bookings = bookings
+        self.rng = random.Random(seed)
+        self.skew = skew
+        self.now = (now or timezone.now()).replace(second=0, microsecond=0)
+        self.window_start = self.now - timedelta(days=history_days)
+        self.window = timedelta(days=history_days + horizon_days)
+
+    def user_rows(self, first_id):
+        password = hash_password(SEED_PASSWORD)
+        for user_id in range(first_id, first_id + self.users):
+            joined = self.window_start - timedelta(minutes=self.rng.randrange(525_600))
+            yield (user_id, f"seed-{user_id}@{SEED_EMAIL_DOMAIN}", password, "Seed", str(user_id), "0000000000",
+                   1, self.rng.random() < 0.8, self.rng.random() < 0.5, joined, joined)
+
+    def vehicle_rows(self, first_id, first_user_id):
+        owners = self._ranked_ids(first_user_id, self.users, self.vehicles)
+        for vehicle_id, owner_id in zip(range(first_id, first_id + self.vehicles), owners):
+            make, model = MAKES[self.rng.randrange(len(MAKES))]
+            added = self.window_start - timedelta(minutes=self.rng.randrange(262_800))
+            yield (vehicle_id, owner_id, make, model, self.rng.randint(2008, 2025), f"SD{vehicle_id:010d}",
+                   added, added)
+
+    def booking_rows(self, first_id, first_vehicle_id, first_user_id):
+        booking_id = first_id
+        remaining = self.bookings
+        mean = self.bookings / self.vehicles
+        bookers = self._ranked_ids(first_user_id, self.users, self.bookings)
+        for index, vehicle_id in enumerate(range(first_vehicle_id, first_vehicle_id + self.vehicles)):
+            if index == self.vehicles - 1:
+                count = remaining
+            else:
+                count = min(remaining, max(0, round(self.rng.gauss(mean, mean / 2))))
+            remaining -= count
+            for start, end in self._slots(count):
+                status = booking_status(self.rng, start, end, self.now)
+                created = min(start, self.now) - timedelta(minutes=self.rng.randrange(1, 20_160))
+                updated = end if status == CommonStatus.COMPLETED.value else created
+                yield (booking_id, next(bookers), vehicle_id, start, end, status, created, updated)
+                booking_id += 1
+
+    def _slots(self, count):
+        """Disjoint closed intervals, one per equal slice of the window."""
+        if not count:
+            return
+        slot = self.window / count
+        for index in range(count):
+            slot_start = self.window_start + slot * index
+            # Typical rentals last about a day; the slot caps the long tail and
+            # a minute of slack keeps neighbouring closed ranges from touching.
+            hours = min(self.rng.lognormvariate(math.log(24), 0.8), (slot - 2 * MINUTE) / timedelta(hours=1))
+            duration = max(MINUTE, timedelta(minutes=int(hours * 60)))
+            slack = max(0, int((slot - duration - MINUTE) / MINUTE))
+            start = slot_start + MINUTE * self.rng.randint(0, slack)
+            yield start, start + duration
+
+    def _ranked_ids(self, first_id, count, draws, batch=100_000):
+        """Yield ``draws`` ids from ``first_id .. first_id + count`` with a Zipf skew on a shuffled ranking."""
+        ranking = list(range(first_id, first_id + count))
+        self.rng.shuffle(ranking)
+        cumulative = zipf_weights(count, self.skew)
+        while draws > 0:
+            size = min(batch, draws)
+            yield from self.rng.choices(ranking, cum_weights=cumulative, k=size)
+            draws -= size
+
+
+def load_synthetic(load, defer_indexes=True, log=None):
+    """Load ``load`` in one transaction and return ``{phase: (rows, seconds)}``."""
+    log = log or (lambda message: None)
+    timings = {}
+
+    def timed(phase, run):
+        started = time.perf_counter()
+        rows = run()
+        elapsed = time.perf_counter() - started
+        timings[phase] = (rows, elapsed)
+        log(f"{phase}: {rows} rows in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            cursor.execute(f"LOCK TABLE {', '.join(LOADED_TABLES)} IN ACCESS EXCLUSIVE MODE")
+        user_base, vehicle_base, booking_base = (reserve_ids(table) for table in LOADED_TABLES)
+        ensure_partitions(load.window_start, load.window_start + load.window)
+
+        with deferred_indexes(LOADED_TABLES) if defer_indexes else nullcontext():
+            timed("users", lambda: copy_rows("users", USER_COLUMNS, load.user_rows(user_base + 1)))
+            timed("vehicles", lambda: copy_rows(
+                "vehicles", VEHICLE_COLUMNS, load.vehicle_rows(vehicle_base + 1, user_base + 1)
+            ))
+            timed("bookings", lambda: copy_rows(
+                "bookings", BOOKING_COLUMNS, load.booking_rows(booking_base + 1, vehicle_base + 1, user_base + 1)
+            ))
+            started = time.perf_counter()
+        if defer_indexes:
+            log(f"indexes and constraints rebuilt in {time.perf_counter() - started:.1f}s")
+
+        for table in LOADED_TABLES:
+            sync_sequence(table)
+        timed("calendar days", lambda: mark_loaded(booking_base))
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users, vehicles, bookings, vehicle_calendar_days")
+    return timings
@@ -0,0 +1,85 @@
+import pytest
+from benchmarks.dataset import DatasetScale, seed_dataset
+from benchmarks.runner import compare, run
+from benchmarks.scenarios import build_scenarios, uncovered_urls
+
+@pytest.mark.django_db
+def test_every_url_is_benchmarked():
+    seed_dataset(DatasetScale(users=3, vehicles=6, bookings=24))
+    scenarios, user = build_scenarios()
+    assert uncovered_urls(scenarios) == []
+
+    results = run(scenarios, user, iterations=2, warmup=0)
+    for result in results:
+        assert set(result["status_codes"]) == {"200"}, result["name"]
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+        assert result["queries_per_request"] <= result["max_queries"]
+    by_name = {result["name"]: result for result in results}
+    assert by_name["booking:list from"]["bookings_partitions"] < by_name["booking:list"]["bookings_partitions"]
+    assert by_name["healthz:probe"]["bookings_partitions"] is None
+
+def test_compare_flags_slower_and_chattier_scenarios():
+    baseline = {"results": [
+        {"name": "booking:list", "p95_ms": 10.0, "max_queries": 1, "bookings_partitions": 2},
+        {"name": "vehicle:list", "p95_ms": 0.2, "max_queries": 1},
+    ]}
+    current = {"results": [
+        {"name": "booking:list", "p95_ms": 15.0, "max_queries": 2, "bookings_partitions": 6},
+        {"name": "vehicle:list", "p95_ms": 0.6, "max_queries": 1},
+        {"name": "booking:new", "p95_ms": 50.0, "max_queries": 9},
+    ]}
+    assert compare(baseline, current, threshold=0.2) == [
+        "booking:list: p95 10.00 ms -> 15.00 ms",
+        "booking:list: queries 1 -> 2",
+        "booking:list: bookings partitions 2 -> 6",
+    ]
+
+@pytest.mark.django_db
+def test_synthetic_load_is_consistent():
+    from django.db.models import Count
+    from apps.booking.models import Booking, VehicleCalendarDay
+    from apps.booking.services.calendar import hour_masks
+    from apps.user.models import User
+    from apps.vehicle.models import Vehicle
+    from benchmarks.synthetic import SyntheticLoad, load_synthetic
+    from constants.common_status import CommonStatus
+
+    timings = load_synthetic(SyntheticLoad(users=50, vehicles=40, bookings=600, history_days=60, horizon_days=30))
+    assert {phase: rows for phase, (rows, _) in timings.items() if phase != "calendar days"} == {
+        "users": 50, "vehicles": 40, "bookings": 600,
+    }
+    assert {row["status"] for row in Booking.objects.values("status").distinct()} >= {
+        CommonStatus.ACTIVE.value, CommonStatus.COMPLETED.value,
+    }
+    fleet_sizes = sorted(Vehicle.objects.values("user").annotate(count=Count("id")).values_list("count", flat=True))
+    assert fleet_sizes[-1] > fleet_sizes[0]
+
+    # Sequences continue after the loaded ids and the calendar matches the bookings.
+    user = User.objects.create(email="after-seed@example.com", password="!", first_name="A", last_name="B",
+                               phone="1234567890", status=1)
+    assert user.id > max(User.objects.exclude(id=user.id).values_list("id", flat=True))
+    booking = Booking.objects.filter(status=CommonStatus.ACTIVE.value).first()
+    for day, mask in hour_masks(booking.start_date, booking.end_date).items():
+        assert VehicleCalendarDay.objects.get(vehicle_id=booking.vehicle_id, day=day).busy_hours & mask == mask
+
+def test_parse_importtime_builds_the_import_tree():
+    from benchmarks.startup import format_tree, parse_importtime
+
+    roots = parse_importtime([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |     leaf",
+        "import time:       200 |        300 |   child",
+        "import time:       400 |        400 |   sibling",
+        "import time:      1000 |       1700 | root",
+        "import time:        50 |         50 | other",
+    ])
+    assert [root.name for root in roots] == ["root", "other"]
+    assert [child.name for child in roots[0].children] == ["child", "sibling"]
+    assert roots[0].children[0].children[0].name == "leaf"
+    assert [line.split()[-1] for line in format_tree(roots, min_ms=0.2)] == ["module", "root", "sibling", "child"]
+
+def test_booking_views_do_not_import_stripe():
+    import sys
+    import config.urls  # noqa: F401
+
+    assert "stripe" not in sys.modules
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ConfigConfig(AppConfig):
+    name = 'config'
+    verbose_name = 'Project configuration'
@@ -12,5 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Makes settings close database connections after each request; set
+# DB_POOL_MAX_SIZE to reuse them under ASGI.
+os.environ['SERVED_BY_ASGI'] = 'True'
 
 application = get_asgi_application()
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from utils.schema import build_schema, source_fingerprint
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the OpenAPI schema (JSON and YAML) for the current code into OPENAPI_SCHEMA_DIR. "
+        "Does nothing when the code has not changed since the last build."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Rebuild even if the schema is up to date")
+
+    def handle(self, *args, **options):
+        paths = build_schema(force=options["force"])
+        if not paths:
+            self.stdout.write(f"Schema {source_fingerprint()} is up to date")
+            return
+        for path in paths:
+            self.stdout.write(f"Wrote {path}")
+        self.stdout.write(self.style.SUCCESS(f"Built schema {source_fingerprint()}"))
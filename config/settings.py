@@ -15,10 +15,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 from datetime import timedelta
+from importlib.util import find_spec
 import os
 import environ
 from pathlib import Path
-from django.db import connections
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -48,6 +49,7 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework_simplejwt',
     'drf_spectacular',
+    'django.contrib.postgres',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -57,9 +59,13 @@ INSTALLED_APPS = [
     'apps.user',
     'apps.vehicle',
     'apps.booking',
+    'benchmarks',
+    'config',
 ]
 
 MIDDLEWARE = [
+    'utils.metrics.RequestMetricsMiddleware',
+    'utils.query_inspector.QueryInspectorMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -100,16 +106,79 @@ DATABASES = {
         "PASSWORD": env("DB_PASS"),
         "HOST": env("DB_HOST"),
         "PORT": env("DB_PORT"),
+        # Keep connections open between requests (seconds, 0 closes them after
+        # each request) and ping reused ones before handing them out.
+        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=60),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
+# Under ASGI the sync ORM runs in a fresh thread per request, so a kept
+# connection is never reused and they pile up until Postgres refuses new ones
+# (Django ticket #33497). config/asgi.py sets SERVED_BY_ASGI.
+if env.bool("SERVED_BY_ASGI", default=False):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+# Process-wide connection pool instead of one connection per thread. Needs
+# psycopg 3 with the pool extra (pip install "psycopg[binary,pool]"); Django
+# then returns connections to the pool after each request, so CONN_MAX_AGE
+# must be 0.
+DB_POOL_MAX_SIZE = env.int("DB_POOL_MAX_SIZE", default=0)
+if DB_POOL_MAX_SIZE:
+    # requirements.txt only ships psycopg2, which has no pool.
+    if not (find_spec("psycopg") and find_spec("psycopg_pool")):
+        raise ImproperlyConfigured(
+            'DB_POOL_MAX_SIZE needs psycopg 3 with the pool extra: pip install "psycopg[binary,pool]"'
+        )
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": env.int("DB_POOL_TIMEOUT", default=10),
+        },
+    }
+
+# Cache
+# LocMemCache evicts least recently used entries past MAX_ENTRIES. In production
+# point CACHE_URL at a shared backend, e.g. redis://host:6379/0 (needs the
+# redis package and a maxmemory-policy of allkeys-lru).
+CACHES = {
+    "default": env.cache_url("CACHE_URL", default="locmemcache://car-rental?MAX_ENTRIES=10000"),
+}
+VEHICLE_CACHE_TTL = env.int("VEHICLE_CACHE_TTL", default=300)
+
+# Full user rows loaded by ClaimsJWTAuthentication are kept per process for a
+# few seconds; token claims cover most requests without any lookup.
+AUTH_USER_CACHE_TTL = env.int("AUTH_USER_CACHE_TTL", default=30)
+AUTH_USER_CACHE_SIZE = env.int("AUTH_USER_CACHE_SIZE", default=1024)
+# Whether a token's user still exists and is active, kept in the default cache.
+# Saving or deleting a user drops the entry at once; changes that bypass model
+# signals (queryset updates) take effect after this many seconds.
+AUTH_ACTIVE_CACHE_TTL = env.int("AUTH_ACTIVE_CACHE_TTL", default=60)
+
+# Async login/registration (serve with config.asgi). Password hashing runs on a
+# bounded pool; requests beyond PASSWORD_HASHING_MAX_PENDING are turned away
+# with a 503 instead of queueing.
+ASYNC_AUTH_VIEWS = env.bool("ASYNC_AUTH_VIEWS", default=False)
+PASSWORD_HASHING_WORKERS = env.int("PASSWORD_HASHING_WORKERS", default=os.cpu_count() or 1)
+PASSWORD_HASHING_MAX_PENDING = env.int("PASSWORD_HASHING_MAX_PENDING", default=PASSWORD_HASHING_WORKERS * 4)
+
+# Serve /booking and /vehicle with async-native views (serve with config.asgi).
+ASYNC_API_VIEWS = env.bool("ASYNC_API_VIEWS", default=False)
+
+# Per-request Server-Timing header and Prometheus histograms at /metrics. The
+# histograms live in each worker process; scrape every worker or aggregate
+# behind the proxy.
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=False)
+
+# Development-time query inspection: SELECTs repeated this many times with the
+# same shape in one request are logged as N+1 (or raised in tests with
+# QUERY_INSPECTOR_RAISE), and queries slower than QUERY_INSPECTOR_SLOW_MS are
+# logged with the code that ran them.
+QUERY_INSPECTOR = env.bool("QUERY_INSPECTOR", default=False)
+QUERY_INSPECTOR_REPEAT_THRESHOLD = env.int("QUERY_INSPECTOR_REPEAT_THRESHOLD", default=5)
+QUERY_INSPECTOR_SLOW_MS = env.int("QUERY_INSPECTOR_SLOW_MS", default=100)
+QUERY_INSPECTOR_RAISE = env.bool("QUERY_INSPECTOR_RAISE", default=False)
 
-try:
-    connections["default"].ensure_connection()
-    DB_NAME = env("DB_NAME")
-    print(f"Connected to {DB_NAME} database")
-except Exception as e:
-    print("Failed to connect to PostgreSQL:", e)
-    raise SystemExit("Failed to connect to PostgreSQL. Exiting...")
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -153,12 +222,44 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.user.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_RENDERER_CLASSES': (
+        'utils.metrics.TimedJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     "EXCEPTION_HANDLER": "utils.error_handler.custom_exception_handler",
 }
 
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=50)
+API_MAX_PAGE_SIZE = env.int("API_MAX_PAGE_SIZE", default=200)
+BOOKING_BATCH_MAX_SIZE = env.int("BOOKING_BATCH_MAX_SIZE", default=100)
+# Rows fetched per server-side cursor round trip when streaming booking lists.
+BOOKING_STREAM_CHUNK_SIZE = env.int("BOOKING_STREAM_CHUNK_SIZE", default=2000)
+# Rows fetched per cursor round trip (and encoded per chunk) by booking exports.
+BOOKING_EXPORT_CHUNK_SIZE = env.int("BOOKING_EXPORT_CHUNK_SIZE", default=5000)
+# Bookings completed per transaction by `manage.py complete_bookings`.
+BOOKING_SWEEP_BATCH_SIZE = env.int("BOOKING_SWEEP_BATCH_SIZE", default=1000)
+# Monthly `bookings` partitions kept ahead of the current month, and how many
+# months back `manage.py partition_bookings --detach` keeps attached.
+BOOKING_PARTITION_MONTHS_AHEAD = env.int("BOOKING_PARTITION_MONTHS_AHEAD", default=3)
+BOOKING_PARTITION_RETENTION_MONTHS = env.int("BOOKING_PARTITION_RETENTION_MONTHS", default=24)
+# Cold archive written by `manage.py archive_bookings`: where the files live,
+# how many months of completed bookings stay in the table, rows per chunk.
+# The files are the only copy of the archived rows, so there is no default:
+# point it at a persistent volume, never at the container filesystem.
+BOOKING_ARCHIVE_DIR = env.str("BOOKING_ARCHIVE_DIR", default="")
+BOOKING_ARCHIVE_AFTER_MONTHS = env.int("BOOKING_ARCHIVE_AFTER_MONTHS", default=12)
+BOOKING_ARCHIVE_CHUNK_ROWS = env.int("BOOKING_ARCHIVE_CHUNK_ROWS", default=8192)
+# Bulk vehicle import: plates checked and rows inserted per chunk, and the
+# largest file accepted by the API (the management command has no cap).
+VEHICLE_IMPORT_CHUNK_SIZE = env.int("VEHICLE_IMPORT_CHUNK_SIZE", default=2000)
+VEHICLE_IMPORT_MAX_ROWS = env.int("VEHICLE_IMPORT_MAX_ROWS", default=50000)
+
+# Where `manage.py build_schema` writes the pre-rendered OpenAPI schema.
+OPENAPI_SCHEMA_DIR = env.str("OPENAPI_SCHEMA_DIR", default=str(BASE_DIR / "build" / "openapi"))
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Car Rental API',
     'DESCRIPTION': 'API documentation for the Car Rental Platform',
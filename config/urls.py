@@ -1,6 +1,9 @@
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularSwaggerView
+from utils.health import healthz_view
+from utils.metrics import metrics_view
+from utils.schema import SchemaView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -8,6 +11,9 @@ urlpatterns = [
     path("api/v1/user/", include("apps.user.urls")),
     path("api/v1/", include("apps.vehicle.urls")),
     path("api/v1/", include("apps.booking.urls")),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", SchemaView.as_view(), name="schema"),
+    path("api/schema/<str:fingerprint>/", SchemaView.as_view(), name="schema-versioned"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
+    path("metrics", metrics_view, name="metrics"),
+    path("healthz", healthz_view, name="healthz"),
 ]
@@ -0,0 +1,107 @@
+"""Helpers for the query-budget and EXPLAIN regression tests.
+
+Endpoints are exercised against a seeded dataset; ``assert_max_queries``
+catches N+1 regressions and ``assert_no_seq_scans`` re-plans every captured
+SELECT with sequential scans penalised, so a ``Seq Scan`` that still shows up
+on a checked table means no index can serve that query.
+"""
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.booking.models import Booking
+from apps.booking.services.calendar import mark_booked
+from apps.booking.services.partitions import parent_table, plan_nodes
+from apps.user.models import User
+from apps.vehicle.models import Vehicle
+from constants.common_status import CommonStatus
+
+PLAN_CHECKED_TABLES = {"bookings", "vehicles"}
+
+
+def seed_dataset(users=20, vehicles_per_user=10, bookings_per_vehicle=20):
+    """Bulk insert a deterministic fleet with back-to-back bookings per vehicle."""
+    owners = User.objects.bulk_create(
+        User(
+            email=f"seed-{index}@example.com",
+            password="!",
+            first_name="Seed",
+            last_name=str(index),
+            phone="1234567890",
+            status=1,
+        )
+        for index in range(users)
+    )
+    vehicles = Vehicle.objects.bulk_create(
+        Vehicle(
+            user=owner,
+            make=("Toyota", "Honda", "Kia")[index % 3],
+            model=("Corolla", "Civic", "Rio")[index % 3],
+            year=2015 + index % 10,
+            plate=f"SEED-{owner.pk}-{index}",
+        )
+        for owner in owners
+        for index in range(vehicles_per_user)
+    )
+
+    first_start = timezone.now().replace(minute=0, second=0, microsecond=0) - timedelta(days=bookings_per_vehicle)
+    bookings = []
+    for vehicle_index, vehicle in enumerate(vehicles):
+        for index in range(bookings_per_vehicle):
+            start_date = first_start + timedelta(days=index * 2)
+            bookings.append(
+                Booking(
+                    user=owners[(vehicle_index + index) % len(owners)],
+                    vehicle=vehicle,
+                    start_date=start_date,
+                    end_date=start_date + timedelta(hours=20),
+                    status=(CommonStatus.ACTIVE if index % 2 else CommonStatus.COMPLETED).value,
+                )
+            )
+    Booking.objects.bulk_create(bookings, batch_size=2000)
+    mark_booked(booking for booking in bookings if booking.status == CommonStatus.ACTIVE.value)
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users, vehicles, bookings")
+    return owners, vehicles
+
+
+@contextmanager
+def assert_max_queries(limit):
+    with CaptureQueriesContext(connection) as context:
+        yield context
+    executed = len(context.captured_queries)
+    assert executed <= limit, f"{executed} queries executed, budget is {limit}:\n" + "\n".join(
+        query["sql"] for query in context.captured_queries
+    )
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off")
+        try:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.execute("RESET enable_seqscan")
+    return plan[0]["Plan"]
+
+
+def seq_scans(plan, tables=PLAN_CHECKED_TABLES):
+    # Partitions count as the table they belong to.
+    return [
+        node for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and parent_table(node["Relation Name"]) in tables
+    ]
+
+
+def assert_no_seq_scans(captured_queries, tables=PLAN_CHECKED_TABLES):
+    for query in captured_queries:
+        sql = query["sql"]
+        if not sql.lstrip().upper().startswith("SELECT"):
+            continue
+        scans = seq_scans(explain(sql), tables)
+        assert not scans, f"Sequential scan on {scans[0]['Relation Name']} for:\n{sql}"
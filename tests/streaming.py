@@ -0,0 +1,25 @@
+"""Reading streamed API responses under either ``ASYNC_API_VIEWS`` setting."""
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.test import AsyncClient, Client
+
+from apps.user.services.token_service import issue_tokens
+
+
+def get_streamed(user, path, data=None, headers=None):
+    """GET ``path`` as ``user`` and return the response with its whole body.
+
+    An async view's stream is an async generator bound to the event loop that
+    served the request, so with the async views the request goes through an
+    ``AsyncClient`` and the body is read on that same loop.
+    """
+    headers = {"Authorization": f"Bearer {issue_tokens(user)['access_token']}", **(headers or {})}
+    if not settings.ASYNC_API_VIEWS:
+        response = Client().get(path, data, headers=headers)
+        return response, b"".join(response.streaming_content)
+
+    async def fetch():
+        response = await AsyncClient().get(path, data, headers=headers)
+        return response, b"".join([chunk async for chunk in response])
+
+    return async_to_sync(fetch)()
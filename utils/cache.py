@@ -0,0 +1,99 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+MISSING = object()
+
+
+class VersionedCache:
+    """Read-through cache whose entries are grouped per owner.
+
+    Every key embeds the owner's current version, so a write only has to bump
+    that version to make all of the owner's entries unreachable; they then
+    age out through the TTL or the backend's LRU eviction.
+    """
+
+    def __init__(self, namespace, timeout_setting, alias="default"):
+        self.namespace = namespace
+        self.timeout_setting = timeout_setting
+        self.alias = alias
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get_or_set(self, owner_id, key, loader):
+        """Return ``(value, hit)``, calling ``loader`` on a miss."""
+        cache_key = f"{self.namespace}:{owner_id}:v{self._version(owner_id)}:{key}"
+        value = self.cache.get(cache_key, MISSING)
+        if value is not MISSING:
+            self._count(hit=True)
+            return value, True
+
+        self._count(hit=False)
+        value = loader()
+        self.cache.set(cache_key, value, timeout=getattr(settings, self.timeout_setting))
+        return value, False
+
+    async def aget_or_set(self, owner_id, key, loader):
+        """Async variant of :meth:`get_or_set`; ``loader`` is a coroutine function."""
+        cache_key = f"{self.namespace}:{owner_id}:v{await self._aversion(owner_id)}:{key}"
+        value = await self.cache.aget(cache_key, MISSING)
+        if value is not MISSING:
+            self._count(hit=True)
+            return value, True
+
+        self._count(hit=False)
+        value = await loader()
+        await self.cache.aset(cache_key, value, timeout=getattr(settings, self.timeout_setting))
+        return value, False
+
+    def invalidate(self, owner_id):
+        try:
+            self.cache.incr(self._version_key(owner_id))
+        except ValueError:
+            # Nothing is cached for this owner under a version we could reach.
+            pass
+
+    async def ainvalidate(self, owner_id):
+        try:
+            await self.cache.aincr(self._version_key(owner_id))
+        except ValueError:
+            pass
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def _version(self, owner_id):
+        version_key = self._version_key(owner_id)
+        version = self.cache.get(version_key)
+        if version is None:
+            # Start from a fresh number so entries written under an evicted
+            # version key can never be served again.
+            self.cache.add(version_key, time.time_ns(), timeout=None)
+            version = self.cache.get(version_key)
+        return version
+
+    async def _aversion(self, owner_id):
+        version_key = self._version_key(owner_id)
+        version = await self.cache.aget(version_key)
+        if version is None:
+            await self.cache.aadd(version_key, time.time_ns(), timeout=None)
+            version = await self.cache.aget(version_key)
+        return version
+
+    def _version_key(self, owner_id):
+        return f"{self.namespace}:{owner_id}:version"
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
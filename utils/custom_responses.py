@@ -19,4 +19,14 @@ class ErrorResponse(Response):
             "data": data if data else None,
             "message": message if message else None,
         }
-        super().__init__(data={"error": response_data}, status=status.HTTP_200_OK)
\ No newline at end of file
+        super().__init__(data={"error": response_data}, status=status.HTTP_200_OK)
+
+class PaginatedResponse(Response):
+    def __init__(self, data=None, next_cursor=None, status_code=None, message=None):
+        response_data = {
+            "code": status_code if status_code else 200,
+            "data": data if data else None,
+            "next": next_cursor,
+            "message": message if message else None,
+        }
+        super().__init__(data={"success": response_data}, status=200)
@@ -5,9 +5,15 @@ from rest_framework import status
 from rest_framework.exceptions import ValidationError, NotAuthenticated, APIException
 from rest_framework_simplejwt.exceptions import InvalidToken
 from utils.custom_responses import ErrorResponse
+from utils.metrics import phase
 
 
 def custom_exception_handler(exc, context):
+    with phase("exception"):
+        return _handle_exception(exc, context)
+
+
+def _handle_exception(exc, context):
     response = exception_handler(exc, context)
     logging.exception(exc)
     message = "Something went wrong"
@@ -31,22 +37,26 @@ def custom_exception_handler(exc, context):
         )
 
     if isinstance(exc, ValidationError):
-        error_messages = []
-        for field, errors in response.data.items():
-            for error in errors:
-                if isinstance(error, dict):
-                    # Handle nested serializer errors
-                    for nested_errors in error.items():
-                        for nested_error in nested_errors:
-                            error_messages.append(f"{nested_error}")
-                else:
-                    error_messages.append(f"{error}")
-
-        message = ", ".join(error_messages)
+        message = validation_error_message(response.data)
 
     return ErrorResponse(status_code=response.status_code, data=None, message=message)
 
 
+def validation_error_message(detail):
+    error_messages = []
+    for field, errors in detail.items():
+        for error in errors:
+            if isinstance(error, dict):
+                # Handle nested serializer errors
+                for nested_errors in error.items():
+                    for nested_error in nested_errors:
+                        error_messages.append(f"{nested_error}")
+            else:
+                error_messages.append(f"{error}")
+
+    return ", ".join(error_messages)
+
+
 class CustomAPIException(Exception):
     def __init__(self, status_code, message):
         self.status_code = status_code
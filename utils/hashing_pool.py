@@ -0,0 +1,73 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+from utils.metrics import Stats, registry
+
+
+class HashingPoolSaturated(Exception):
+    pass
+
+
+class HashingPool:
+    """Bounded thread pool for password hashing.
+
+    PBKDF2 releases the GIL, so hashing runs in parallel on the pool's threads
+    while the event loop keeps serving other requests. At most
+    ``max_pending`` jobs may be queued or running; beyond that ``run`` fails
+    fast with ``HashingPoolSaturated`` instead of letting the queue grow.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def workers(self):
+        return settings.PASSWORD_HASHING_WORKERS
+
+    @property
+    def max_pending(self):
+        return settings.PASSWORD_HASHING_MAX_PENDING
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingPoolSaturated()
+            self.pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hashing")
+            future = self._executor.submit(func, *args)
+
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queue_depth": max(self.pending - self.workers, 0),
+                "in_flight": self.pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def _job_done(self, future):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+
+hashing_pool = HashingPool()
+
+registry.register(Stats("password_hashing", hashing_pool.stats, {
+    "queue_depth": ("gauge", "Hashing jobs waiting for a free worker."),
+    "in_flight": ("gauge", "Hashing jobs queued or running."),
+    "completed": ("counter", "Hashing jobs finished."),
+    "rejected": ("counter", "Logins and registrations turned away with 503 because the pool was full."),
+}))
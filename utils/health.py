@@ -0,0 +1,38 @@
+"""Readiness probe for load balancers and orchestrators.
+
+``healthz_view`` runs ``SELECT 1`` on the default database (reusing the
+persistent or pooled connection, so a healthy probe costs one round trip)
+and, when pooling is enabled, reports the pool's counters.
+"""
+import logging
+import time
+
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+
+POOL_STATS = ("pool_min", "pool_max", "pool_size", "pool_available", "requests_waiting")
+
+
+def pool_stats():
+    # Only the psycopg 3 backend has a pool, and only with OPTIONS["pool"] set.
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    return {name: stats[name] for name in POOL_STATS if name in stats}
+
+
+def healthz_view(request):
+    started = time.perf_counter()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except DatabaseError:
+        # The probe is unauthenticated; the error names the database host and user.
+        logging.exception("Health check could not reach the database")
+        return JsonResponse({"status": "unavailable"}, status=503)
+    return JsonResponse({
+        "status": "ok",
+        "database_ms": round((time.perf_counter() - started) * 1000, 2),
+        "pool": pool_stats(),
+    })
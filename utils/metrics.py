@@ -0,0 +1,248 @@
+"""Per-request timings exposed as ``Server-Timing`` and Prometheus histograms.
+
+With ``METRICS_ENABLED`` the middleware opens a ``RequestTimings`` for each
+request, the database execute wrapper and the ``phase`` blocks in the auth
+class, serializers, renderer and exception handler add to it, and the totals
+land in per-view histograms served by ``metrics_view``. Disabled, the
+middleware removes itself and every hook is a single context variable
+lookup.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import Http404, HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+PHASES = ("auth", "serialize", "render", "exception")
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+_current = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view = "unmatched"
+        self.queries = 0
+        self.db = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self._open = set()
+
+
+class phase:
+    """Add the time spent in the block to the current request's ``name`` phase.
+
+    Nested blocks of the same phase (a serializer rendering another one) are
+    only counted once.
+    """
+
+    __slots__ = ("name", "timings", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.timings = _current.get()
+        if self.timings is None or self.name in self.timings._open:
+            self.timings = None
+            return
+        self.timings._open.add(self.name)
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        if self.timings is not None:
+            self.timings.phases[self.name] += time.perf_counter() - self.started
+            self.timings._open.discard(self.name)
+
+
+def time_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - started
+        timings.queries += 1
+
+
+def install_query_timer(connection, **kwargs):
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+class Histogram:
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, view, value):
+        with self._lock:
+            series = self._series.get(view)
+            if series is None:
+                series = self._series[view] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def exposition(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {view: (list(counts), total) for view, (counts, total) in self._series.items()}
+        for view, (counts, total) in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{view="{view}",le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{view="{view}"}} {total}')
+            lines.append(f'{self.name}_count{{view="{view}"}} {cumulative}')
+        return lines
+
+
+class Stats:
+    """Counters and gauges read from a ``stats()`` dict each time ``/metrics`` is scraped.
+
+    ``metrics`` maps the keys of the dict to ``(type, documentation)``;
+    counters get the ``_total`` suffix Prometheus expects.
+    """
+
+    def __init__(self, prefix, stats, metrics):
+        self.prefix = prefix
+        self.stats = stats
+        self.metrics = metrics
+
+    def exposition(self):
+        values = self.stats()
+        lines = []
+        for key, (kind, documentation) in self.metrics.items():
+            name = f"{self.prefix}_{key}_total" if kind == "counter" else f"{self.prefix}_{key}"
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {values[key]}"]
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.collectors = []
+        self.request = Histogram("http_request_duration_seconds", "Time spent handling the request.",
+                                 LATENCY_BUCKETS)
+        self.db = Histogram("http_request_db_seconds", "Time spent in database queries.", LATENCY_BUCKETS)
+        self.queries = Histogram("http_request_db_queries", "Database queries per request.", QUERY_BUCKETS)
+        self.phases = {
+            name: Histogram(f"http_request_{name}_seconds", f"Time spent in the {name} phase.", LATENCY_BUCKETS)
+            for name in PHASES
+        }
+
+    def register(self, collector):
+        """Add a :class:`Stats` (or anything with ``exposition()``) to ``/metrics``."""
+        self.collectors.append(collector)
+        return collector
+
+    def histograms(self):
+        return [self.request, self.db, self.queries, *self.phases.values()]
+
+    def record(self, timings, total):
+        self.request.observe(timings.view, total)
+        self.db.observe(timings.view, timings.db)
+        self.queries.observe(timings.view, timings.queries)
+        for name, seconds in timings.phases.items():
+            self.phases[name].observe(timings.view, seconds)
+
+    def clear(self):
+        for histogram in self.histograms():
+            histogram.clear()
+
+    def exposition(self):
+        sources = [*self.histograms(), *self.collectors]
+        return "\n".join(line for source in sources for line in source.exposition()) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def view_name(request, view_func):
+    view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    name = view_class.__name__ if view_class else getattr(view_func, "__name__", "view")
+    return f"{name}.{request.method.lower()}"
+
+
+def server_timing(timings, total):
+    entries = [f'db;dur={timings.db * 1000:.2f};desc="{timings.queries} queries"']
+    entries += [
+        f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.phases.items() if seconds
+    ]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(install_query_timer)
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(timings, response)
+
+    async def __acall__(self, request):
+        timings = RequestTimings()
+        token = _current.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(timings, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _current.get()
+        if timings is not None:
+            timings.view = view_name(request, view_func)
+
+    def finish(self, timings, response):
+        total = time.perf_counter() - timings.started
+        registry.record(timings, total)
+        response["Server-Timing"] = server_timing(timings, total)
+        return response
+
+
+class TimedJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with phase("render"):
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+def metrics_view(request):
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    return HttpResponse(registry.exposition(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,141 @@
+import base64
+import binascii
+import heapq
+import json
+from datetime import datetime
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Q
+from rest_framework import status
+
+from utils.error_handler import CustomAPIException
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+
+    if not isinstance(values, list):
+        raise CustomAPIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Invalid cursor",
+        )
+    return values
+
+
+def decode_id_cursor(cursor):
+    """The last id of an id-ordered keyset page."""
+    values = decode_cursor(cursor)
+    try:
+        (last_id,) = values
+        return int(last_id)
+    except (TypeError, ValueError):
+        raise CustomAPIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Invalid cursor",
+        )
+
+
+def get_page_size(request):
+    page_size = request.query_params.get("page_size")
+    if page_size is None:
+        return settings.API_PAGE_SIZE
+
+    if not page_size.isdigit() or int(page_size) < 1:
+        raise CustomAPIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Page size must be a positive integer",
+        )
+    return min(int(page_size), settings.API_MAX_PAGE_SIZE)
+
+
+def paginate_by_created_at(queryset, request, extra_rows=None):
+    """Newest-first keyset page over ``(created_at, id)``.
+
+    Returns the page items and the cursor for the next page (``None`` on the
+    last page). Seeking from the cursor instead of using OFFSET keeps every
+    page as cheap as the first one. ``extra_rows`` supplies ``.values()``
+    rows kept outside the queryset (archived bookings): it is called with the
+    cursor's ``(created_at, id)``, or ``None`` on the first page, and the
+    number of rows the page needs, and returns at most that many rows created
+    before the cursor, newest first. They are merged into the page.
+    """
+    page_size = get_page_size(request)
+    after = _created_at_cursor(request)
+    items = list(_created_at_page_queryset(queryset, after, page_size))
+    extra = extra_rows(after, page_size + 1) if extra_rows else None
+    return _created_at_page(_merge_rows(items, extra, page_size), page_size)
+
+
+async def apaginate_by_created_at(queryset, request, extra_rows=None):
+    """Async variant of :func:`paginate_by_created_at`."""
+    page_size = get_page_size(request)
+    after = _created_at_cursor(request)
+    items = [item async for item in _created_at_page_queryset(queryset, after, page_size)]
+    extra = None
+    if extra_rows:
+        # Reading them can block, so it happens in a worker thread.
+        extra = await sync_to_async(lambda: list(extra_rows(after, page_size + 1)))()
+    return _created_at_page(_merge_rows(items, extra, page_size), page_size)
+
+
+def _created_at_cursor(request):
+    cursor = request.query_params.get("cursor")
+    if not cursor:
+        return None
+    values = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(values[0]), int(values[1])
+    except (IndexError, TypeError, ValueError):
+        raise CustomAPIException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message="Invalid cursor",
+        )
+
+
+def _created_at_page_queryset(queryset, after, page_size):
+    if after:
+        created_at, last_id = after
+        # The redundant created_at__lte bound is what lets Postgres start the
+        # index scan at the cursor instead of filtering from the first row.
+        queryset = queryset.filter(created_at__lte=created_at).filter(
+            Q(created_at__lt=created_at) | Q(id__lt=last_id)
+        )
+    # One extra row tells us whether there is a next page.
+    return queryset.order_by("-created_at", "-id")[: page_size + 1]
+
+
+def _merge_rows(items, extra_rows, page_size):
+    if extra_rows is None:
+        return items
+
+    def key(row):
+        return row["created_at"], row["id"]
+
+    # A row being archived right now can briefly show up on both sides.
+    seen = {row["id"] for row in items}
+    extra = (row for row in extra_rows if row["id"] not in seen)
+    return list(islice(heapq.merge(items, extra, key=key, reverse=True), page_size + 1))
+
+
+def _created_at_page(items, page_size):
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        if isinstance(last, dict):
+            # Querysets narrowed with .values() page the same way.
+            next_cursor = encode_cursor([last["created_at"].isoformat(), last["id"]])
+        else:
+            next_cursor = encode_cursor([last.created_at.isoformat(), last.id])
+    return items, next_cursor
@@ -0,0 +1,190 @@
+"""Development-time N+1 and slow-query detection.
+
+With ``QUERY_INSPECTOR`` enabled every query runs through ``inspect_query``,
+which fingerprints its SQL (literals and ``IN`` lists collapsed) and
+remembers where it came from: the view being served, the serializer on the
+stack, and the last few frames of project code. At the end of a request,
+SELECTs whose shape repeated ``QUERY_INSPECTOR_REPEAT_THRESHOLD`` times or
+more are reported as N+1; queries slower than ``QUERY_INSPECTOR_SLOW_MS``
+are logged as they finish. With ``QUERY_INSPECTOR_RAISE`` an N+1 raises
+``NPlusOneDetected`` instead, which fails the test that triggered it.
+"""
+import logging
+import re
+import sys
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.serializers import BaseSerializer
+
+from utils.metrics import view_name
+
+logger = logging.getLogger("query_inspector")
+
+_current = ContextVar("query_inspection", default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+_OWN_FILES = (__file__.rsplit(".", 1)[0],)
+
+
+class NPlusOneDetected(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """Normalize ``sql`` so queries differing only in values compare equal."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def active_serializer():
+    frame = sys._getframe(2)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, BaseSerializer):
+            return type(owner).__name__
+        frame = frame.f_back
+    return None
+
+
+def project_stack(limit=5):
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()[:-2]
+        if frame.filename.startswith(base_dir)
+        and "site-packages" not in frame.filename
+        and not frame.filename.startswith(_OWN_FILES)
+    ]
+    return [f"{frame.filename[len(base_dir) + 1:]}:{frame.lineno} in {frame.name}" for frame in frames[-limit:]]
+
+
+class QueryInspection:
+    def __init__(self, view=None):
+        self.view = view
+        self.queries = {}
+
+    def record(self, sql, duration):
+        key = fingerprint(sql)
+        entry = self.queries.get(key)
+        if entry is None:
+            self.queries[key] = entry = {
+                "sql": key,
+                "count": 0,
+                "serializer": active_serializer(),
+                "stack": project_stack(),
+            }
+        entry["count"] += 1
+
+        if duration * 1000 >= settings.QUERY_INSPECTOR_SLOW_MS:
+            logger.warning(
+                "Slow query (%.1f ms) in %s via %s: %s\n  %s",
+                duration * 1000, self.view, entry["serializer"], sql, "\n  ".join(project_stack()),
+            )
+
+    @property
+    def n_plus_one(self):
+        return [
+            entry for entry in self.queries.values()
+            if entry["count"] >= settings.QUERY_INSPECTOR_REPEAT_THRESHOLD and entry["sql"].upper().startswith("SELECT")
+        ]
+
+    def report(self):
+        findings = self.n_plus_one
+        for entry in findings:
+            logger.warning(
+                "N+1: %d queries of the same shape in %s via %s: %s\n  %s",
+                entry["count"], self.view, entry["serializer"], entry["sql"], "\n  ".join(entry["stack"]),
+            )
+        if findings and settings.QUERY_INSPECTOR_RAISE:
+            worst = max(findings, key=lambda entry: entry["count"])
+            raise NPlusOneDetected(
+                f"{worst['count']} queries of the same shape in {self.view} via {worst['serializer']}: "
+                f"{worst['sql']}\n  " + "\n  ".join(worst["stack"])
+            )
+        return findings
+
+
+def inspect_query(execute, sql, params, many, context):
+    inspection = _current.get()
+    if inspection is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        inspection.record(sql, time.perf_counter() - started)
+
+
+def install_query_inspector(connection, **kwargs):
+    if inspect_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(inspect_query)
+
+
+@contextmanager
+def inspect_queries(label="block"):
+    """Inspect the queries run inside the block; ``report()`` runs on exit."""
+    connection_created.connect(install_query_inspector)
+    for connection in connections.all(initialized_only=True):
+        install_query_inspector(connection)
+    inspection = QueryInspection(label)
+    token = _current.set(inspection)
+    try:
+        yield inspection
+    finally:
+        _current.reset(token)
+    inspection.report()
+
+
+class QueryInspectorMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_INSPECTOR:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(install_query_inspector)
+        for connection in connections.all(initialized_only=True):
+            install_query_inspector(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        inspection = QueryInspection(request.path)
+        token = _current.set(inspection)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        inspection.report()
+        return response
+
+    async def __acall__(self, request):
+        inspection = QueryInspection(request.path)
+        token = _current.set(inspection)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        inspection.report()
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        inspection = _current.get()
+        if inspection is not None:
+            inspection.view = view_name(request, view_func)
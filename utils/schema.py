@@ -0,0 +1,116 @@
+"""OpenAPI schema rendered once per code version instead of on every request.
+
+``build_schema`` renders the JSON and YAML schema into ``OPENAPI_SCHEMA_DIR``
+under a name carrying ``source_fingerprint()``, a hash of the code and
+packages the schema is generated from. ``SchemaView`` serves the file that
+matches the running code with an ETag, and ``/api/schema/<fingerprint>/`` serves
+it as immutable. Without a matching file (the code changed since the last
+build) the view falls back to introspecting the views as before.
+"""
+import hashlib
+import logging
+from functools import cache
+from importlib.metadata import version
+from pathlib import Path
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SpectacularAPIView
+
+SCHEMA_SOURCES = ("apps", "config", "constants", "utils")
+SCHEMA_PACKAGES = ("django", "djangorestframework", "djangorestframework-simplejwt", "drf-spectacular")
+SCHEMA_RENDERERS = {"json": OpenApiJsonRenderer, "yaml": OpenApiYamlRenderer}
+
+_loaded = {}
+_warned = set()
+
+
+@cache
+def source_fingerprint():
+    """Hash of every module the schema can depend on; computed once per process."""
+    digest = hashlib.sha256()
+    for package in SCHEMA_PACKAGES:
+        digest.update(f"{package}=={version(package)}\n".encode())
+    for source in SCHEMA_SOURCES:
+        for path in sorted((settings.BASE_DIR / source).rglob("*.py")):
+            if "tests" in path.parts:
+                continue
+            digest.update(str(path.relative_to(settings.BASE_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def schema_path(fingerprint, format):
+    return Path(settings.OPENAPI_SCHEMA_DIR) / f"openapi-{fingerprint}.{format}"
+
+
+def build_schema(force=False):
+    """Render the schema for the current code; returns the written paths, or ``[]`` when up to date."""
+    fingerprint = source_fingerprint()
+    paths = {format: schema_path(fingerprint, format) for format in SCHEMA_RENDERERS}
+    if not force and all(path.exists() for path in paths.values()):
+        return []
+
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    directory = Path(settings.OPENAPI_SCHEMA_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in directory.glob("openapi-*"):
+        if stale not in paths.values():
+            stale.unlink()
+    for format, path in paths.items():
+        # Write then rename, so a running server never reads a partial file.
+        partial = path.with_suffix(".partial")
+        partial.write_bytes(SCHEMA_RENDERERS[format]().render(schema, renderer_context={}))
+        partial.replace(path)
+    _loaded.clear()
+    return list(paths.values())
+
+
+def load_schema(format):
+    """``(content, etag)`` of the built schema for the running code, or ``None``.
+
+    Only hits are kept, so a server started before the build picks the file up.
+    """
+    if format not in _loaded:
+        try:
+            content = schema_path(source_fingerprint(), format).read_bytes()
+        except FileNotFoundError:
+            return None
+        _loaded[format] = content, f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+    return _loaded[format]
+
+
+class SchemaView(SpectacularAPIView):
+    @extend_schema(exclude=True)
+    def get(self, request, *args, fingerprint=None, **kwargs):
+        if fingerprint is not None and fingerprint != source_fingerprint():
+            raise Http404
+        format = request.accepted_renderer.format
+        built = load_schema(format)
+        if built is None:
+            if fingerprint is not None:
+                raise Http404
+            if format not in _warned:
+                _warned.add(format)
+                logging.warning(
+                    "No pre-built %s schema for code version %s; introspecting the views on every request. "
+                    "Run `manage.py build_schema` as part of the build.", format, source_fingerprint(),
+                )
+            return super().get(request, *args, **kwargs)
+
+        content, etag = built
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=request.accepted_media_type)
+            response["Content-Disposition"] = f'inline; filename="{self._get_filename(request, None)}"'
+        response["ETag"] = etag
+        if fingerprint is None:
+            response["Cache-Control"] = "no-cache"
+            response["Content-Location"] = f"{request.path}{source_fingerprint()}/"
+        else:
+            response["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
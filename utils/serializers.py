@@ -0,0 +1,35 @@
+from django.db.models import Manager, QuerySet
+from rest_framework import serializers
+
+from utils.metrics import phase
+
+
+class TimedDataMixin:
+    """Counts building ``serializer.data`` as the request's serialize phase."""
+
+    @property
+    def data(self):
+        with phase("serialize"):
+            return super().data
+
+
+class RowListSerializer(TimedDataMixin, serializers.ListSerializer):
+    """Read-only ``many=True`` path that formats ``.values()`` rows directly.
+
+    The child serializer declares ``row_fields`` (the columns to fetch) and a
+    ``row_representation(row)`` that returns exactly what ``to_representation``
+    returns for the matching instance. Querysets are read as rows, skipping
+    model instantiation; lists of instances still go through the child.
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, Manager):
+            data = data.all()
+        if isinstance(data, QuerySet):
+            data = data.values(*self.child.row_fields)
+        row_representation = self.child.row_representation
+        to_representation = self.child.to_representation
+        return [
+            row_representation(item) if isinstance(item, dict) else to_representation(item)
+            for item in data
+        ]
@@ -0,0 +1,119 @@
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import JSONRenderer
+
+STREAM_MEDIA_TYPE = "application/stream+json"
+
+
+def wants_stream(request):
+    """Streaming is opt-in through ``?stream=1`` or ``Accept: application/stream+json``."""
+    return request.query_params.get("stream") == "1" or STREAM_MEDIA_TYPE in request.META.get("HTTP_ACCEPT", "")
+
+
+def streaming_body(request, chunks):
+    """``chunks`` in the form the server streams without buffering.
+
+    Under ASGI, ``StreamingHttpResponse`` reads a sync iterator to the end
+    into a list before sending anything, so there the chunks are pulled one
+    at a time through ``sync_to_async`` instead.
+    """
+    if isinstance(request._request, ASGIRequest):
+        return aiterate_sync(chunks)
+    return chunks
+
+
+async def aiterate_sync(chunks):
+    chunks = iter(chunks)
+    # Thread-sensitive, so every chunk is read in the same thread and a
+    # generator holding a transaction and a server-side cursor keeps its
+    # connection.
+    read = sync_to_async(next)
+    try:
+        while (chunk := await read(chunks, None)) is not None:
+            yield chunk
+    finally:
+        if hasattr(chunks, "close"):
+            await sync_to_async(chunks.close)()
+
+
+class StreamingNegotiation(DefaultContentNegotiation):
+    """Content negotiation for views that write their own streamed body.
+
+    The media types a view lists in ``streamed_media_types`` and a
+    ``?format=`` the view reads itself mean something to the view rather
+    than to DRF, so the default renderer is picked for them; it only renders
+    the non-streamed envelopes. Any other unacceptable ``Accept`` still gets
+    a 406.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        view = request.parser_context.get("view")
+        accept = request.META.get("HTTP_ACCEPT", "")
+        streamed = getattr(view, "streamed_media_types", ())
+        if request.query_params.get(self.settings.URL_FORMAT_OVERRIDE) or any(
+            media_type in accept for media_type in streamed
+        ):
+            return renderers[0], renderers[0].media_type
+        return super().select_renderer(request, renderers, format_suffix)
+
+
+class EnvelopeStream:
+    """Renders the ``SuccessResponse`` envelope piece by piece.
+
+    Joined together, the pieces are byte-identical to rendering
+    ``SuccessResponse(data=items)``, but only one chunk of items is held in
+    memory at a time.
+    """
+
+    def __init__(self, serialize, message, status_code=status.HTTP_200_OK, chunk_size=1000):
+        self.serialize = serialize
+        self.message = message
+        self.status_code = status_code
+        self.chunk_size = chunk_size
+        self.renderer = JSONRenderer()
+        self.started = False
+
+    def head(self):
+        return b'{"success":{"code":%d,"data":[' % self.status_code
+
+    def chunk(self, items):
+        # Rendering the chunk as a list and dropping the brackets keeps the
+        # separators exactly as JSONRenderer writes them.
+        rendered = self.renderer.render([self.serialize(item) for item in items])[1:-1]
+        if self.started:
+            rendered = b"," + rendered
+        self.started = True
+        return rendered
+
+    def tail(self):
+        return b'],"message":' + self.renderer.render(self.message) + b"}}"
+
+    def iterate(self, items):
+        yield self.head()
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == self.chunk_size:
+                yield self.chunk(batch)
+                batch = []
+        if batch:
+            yield self.chunk(batch)
+        yield self.tail()
+
+    async def aiterate(self, items):
+        yield self.head()
+        batch = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) == self.chunk_size:
+                yield self.chunk(batch)
+                batch = []
+        if batch:
+            yield self.chunk(batch)
+        yield self.tail()
+
+    def response(self, chunks):
+        return StreamingHttpResponse(chunks, content_type="application/json")